@@ -0,0 +1,118 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+"""Per-primitive benchmark of the NumPy backend of the ARC-AGI DSL.
+
+Each primitive taking or returning grids is timed with the tuple
+implementation and the NumPy backend, on a random grid with a background
+color and small objects (like the ARC-AGI grids). The NumPy backend takes
+the grid as an array, the conversions are not timed.
+
+Usage:
+
+```
+python benchmarks/arcagi_dsl_benchmark.py --size 30
+```
+"""
+
+import argparse
+import timeit
+
+import numpy as np
+
+from synalinks.src.datasets.arcagi.dsl import dsl
+from synalinks.src.datasets.arcagi.dsl import numpy_dsl
+
+PRIMITIVES = {
+    "asindices": lambda m, g, o: m.asindices(g),
+    "asobject": lambda m, g, o: m.asobject(g),
+    "bottomhalf": lambda m, g, o: m.bottomhalf(g),
+    "canvas": lambda m, g, o: m.canvas(0, (30, 30)),
+    "cellwise": lambda m, g, o: m.cellwise(g, m.rot180(g), 0),
+    "cmirror": lambda m, g, o: m.cmirror(g),
+    "colorcount": lambda m, g, o: m.colorcount(g, 1),
+    "compress": lambda m, g, o: m.compress(g),
+    "cover": lambda m, g, o: m.cover(g, o),
+    "crop": lambda m, g, o: m.crop(g, (2, 2), (10, 10)),
+    "dmirror": lambda m, g, o: m.dmirror(g),
+    "downscale": lambda m, g, o: m.downscale(g, 2),
+    "equality": lambda m, g, o: m.equality(g, g),
+    "fgpartition": lambda m, g, o: m.fgpartition(g),
+    "fill": lambda m, g, o: m.fill(g, 5, m.backdrop(o)),
+    "frontiers": lambda m, g, o: m.frontiers(g),
+    "gobjects": lambda m, g, o: m.gobjects(g, True, False, True),
+    "gobjects (diagonal)": lambda m, g, o: m.gobjects(g, False, True, True),
+    "hconcat": lambda m, g, o: m.hconcat(g, g),
+    "height": lambda m, g, o: m.height(g),
+    "hmirror": lambda m, g, o: m.hmirror(g),
+    "hsplit": lambda m, g, o: m.hsplit(g, 3),
+    "hupscale": lambda m, g, o: m.hupscale(g, 2),
+    "index": lambda m, g, o: m.index(g, (1, 2)),
+    "leastcolor": lambda m, g, o: m.leastcolor(g),
+    "lefthalf": lambda m, g, o: m.lefthalf(g),
+    "mostcolor": lambda m, g, o: m.mostcolor(g),
+    "move": lambda m, g, o: m.move(g, o, (1, 1)),
+    "numcolors": lambda m, g, o: m.numcolors(g),
+    "occurrences": lambda m, g, o: m.occurrences(g, o),
+    "ofcolor": lambda m, g, o: m.ofcolor(g, 1),
+    "paint": lambda m, g, o: m.paint(g, o),
+    "palette": lambda m, g, o: m.palette(g),
+    "partition": lambda m, g, o: m.partition(g),
+    "portrait": lambda m, g, o: m.portrait(g),
+    "replace": lambda m, g, o: m.replace(g, 0, 1),
+    "righthalf": lambda m, g, o: m.righthalf(g),
+    "rot180": lambda m, g, o: m.rot180(g),
+    "rot270": lambda m, g, o: m.rot270(g),
+    "rot90": lambda m, g, o: m.rot90(g),
+    "shape": lambda m, g, o: m.shape(g),
+    "square": lambda m, g, o: m.square(g),
+    "subgrid": lambda m, g, o: m.subgrid(o, g),
+    "switch": lambda m, g, o: m.switch(g, 0, 1),
+    "toobject": lambda m, g, o: m.toobject(m.backdrop(o), g),
+    "tophalf": lambda m, g, o: m.tophalf(g),
+    "trim": lambda m, g, o: m.trim(g),
+    "underfill": lambda m, g, o: m.underfill(g, 5, m.backdrop(o)),
+    "underpaint": lambda m, g, o: m.underpaint(g, o),
+    "upscale": lambda m, g, o: m.upscale(g, 3),
+    "vconcat": lambda m, g, o: m.vconcat(g, g),
+    "vmirror": lambda m, g, o: m.vmirror(g),
+    "vsplit": lambda m, g, o: m.vsplit(g, 3),
+    "vupscale": lambda m, g, o: m.vupscale(g, 2),
+    "width": lambda m, g, o: m.width(g),
+}
+
+
+def make_grid(size, seed=0):
+    rng = np.random.RandomState(seed)
+    grid = np.zeros((size, size), dtype=np.uint8)
+    for _ in range(size):
+        i, j = rng.randint(size), rng.randint(size)
+        grid[i : i + rng.randint(1, 4), j : j + rng.randint(1, 4)] = rng.randint(1, 10)
+    return numpy_dsl.to_grid(grid)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=30)
+    parser.add_argument("--number", type=int, default=100)
+    args = parser.parse_args()
+
+    grid = make_grid(args.size)
+    array = numpy_dsl.to_array(grid)
+    obj = max(dsl.gobjects(grid, True, False, True), key=len)
+
+    def timeit_min(fn):
+        return min(timeit.repeat(fn, number=args.number, repeat=3)) / args.number
+
+    print(f"{'primitive':<22}{'tuple':>12}{'numpy':>12}{'speedup':>10}")
+    for name, primitive in PRIMITIVES.items():
+        timings = [
+            timeit_min(lambda: primitive(dsl, grid, obj)),
+            timeit_min(lambda: primitive(numpy_dsl, array, obj)),
+        ]
+        print(
+            f"{name:<22}{timings[0] * 1e6:>9.1f} us"
+            f"{timings[1] * 1e6:>9.1f} us{timings[0] / timings[1]:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+"""Benchmark of the per-epoch iteration overhead of `ArrayDataAdapter`.
+
+`ArrayDataAdapter` is compared with a baseline reproducing its previous
+implementation: the inputs converted to an object array at each epoch, and
+each batch copied into a new object array.
+
+Usage:
+
+```
+python benchmarks/array_data_adapter_benchmark.py --num_samples 1000000
+```
+"""
+
+import argparse
+import timeit
+
+import numpy as np
+
+from synalinks.src.backend import DataModel
+from synalinks.src.trainers.data_adapters.array_data_adapter import ArrayDataAdapter
+
+
+class Query(DataModel):
+    query: str
+
+
+class Answer(DataModel):
+    answer: str
+
+
+class BaselineArrayDataAdapter(ArrayDataAdapter):
+    def __init__(self, x, y=None, batch_size=None, shuffle=False):
+        super().__init__(x, y=y, batch_size=batch_size, shuffle=shuffle)
+        self._inputs = (x, y)
+
+    def get_numpy_iterator(self):
+        inputs = np.array(self._inputs, dtype="object")
+
+        def slice_and_convert_to_numpy(sliceable, indices=None):
+            x = sliceable[indices]
+            x = np.array(x, dtype="object")
+            return x
+
+        return self._get_baseline_iterator(slice_and_convert_to_numpy, inputs)
+
+    def _get_baseline_iterator(self, slice_and_convert_fn, inputs):
+        global_permutation = None
+        if self._shuffle and self._shuffle != "batch":
+            global_permutation = np.random.permutation(self._num_samples)
+        for i in range(self._size):
+            start = i * self._batch_size
+            stop = min((i + 1) * self._batch_size, self._num_samples)
+            if self._shuffle == "batch":
+                indices = np.random.permutation(stop - start) + start
+            elif self._shuffle:
+                indices = global_permutation[start:stop]
+            else:
+                indices = slice(start, stop)
+            x = slice_and_convert_fn(inputs[0], indices=indices)
+            y = slice_and_convert_fn(inputs[1], indices=indices)
+            yield (x, y)
+
+
+def iterate(adapter):
+    for _ in adapter.get_numpy_iterator():
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--num_samples", type=int, default=1_000_000)
+    parser.add_argument("--batch_size", type=int, default=32)
+    parser.add_argument("--number", type=int, default=1)
+    args = parser.parse_args()
+
+    query, answer = Query(query="What is the capital of France?"), Answer(answer="Paris")
+    x = np.empty(args.num_samples, dtype="object")
+    x[:] = [query.model_copy() for _ in range(args.num_samples)]
+    y = np.empty(args.num_samples, dtype="object")
+    y[:] = [answer.model_copy() for _ in range(args.num_samples)]
+
+    print(f"{'shuffle':<10}{'baseline':>14}{'adapter':>14}{'speedup':>10}")
+    for shuffle in (False, "batch", True):
+        timings = [
+            min(
+                timeit.repeat(
+                    lambda: iterate(
+                        cls(x, y=y, batch_size=args.batch_size, shuffle=shuffle)
+                    ),
+                    number=args.number,
+                    repeat=3,
+                )
+            )
+            / args.number
+            for cls in (BaselineArrayDataAdapter, ArrayDataAdapter)
+        ]
+        print(
+            f"{str(shuffle):<10}{timings[0] * 1e3:>11.1f} ms"
+            f"{timings[1] * 1e3:>11.1f} ms{timings[0] / timings[1]:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
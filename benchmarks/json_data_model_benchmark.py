@@ -0,0 +1,85 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+"""Benchmark of the `JsonDataModel` creation throughput and memory.
+
+`JsonDataModel` is compared with a baseline reproducing its previous
+implementation: an instance `__dict__`, a name generated at creation and
+a new standardized schema for each instance.
+
+The data models are created from a `DataModel` instance (`data_model=`, the
+schema being generated for each instance, as in the programs) and from a
+schema object reused for all the instances (`schema=`).
+
+Usage:
+
+```
+python benchmarks/json_data_model_benchmark.py --number 100000
+```
+"""
+
+import argparse
+import timeit
+import tracemalloc
+
+from synalinks.src.backend import DataModel
+from synalinks.src.backend.common.json_data_model import JsonDataModel
+from synalinks.src.utils.naming import auto_name
+
+
+class Answer(DataModel):
+    thinking: str
+    answer: str
+
+
+class BaselineJsonDataModel:
+    def __init__(self, schema=None, json=None, data_model=None, name=None):
+        if data_model is not None:
+            schema = data_model.get_schema()
+            json = data_model.get_json()
+        self.name = name or auto_name("baseline_json_data_model")
+        self._schema = {**schema, "title": "SymbolicDataModel"}
+        self._json = json
+
+
+def create_from_data_models(cls, data_models):
+    return [cls(data_model=data_model) for data_model in data_models]
+
+
+def create_from_schema(cls, schema, jsons):
+    return [cls(schema=schema, json=json) for json in jsons]
+
+
+def measure_memory(create, number):
+    tracemalloc.start()
+    data_models = create()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del data_models
+    return size / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=100000)
+    args = parser.parse_args()
+
+    schema = Answer.get_schema()
+    data_models = [Answer(thinking="...", answer=str(i)) for i in range(args.number)]
+    jsons = [data_model.get_json() for data_model in data_models]
+    scenarios = {
+        "data_model=": lambda cls: lambda: create_from_data_models(cls, data_models),
+        "schema=": lambda cls: lambda: create_from_schema(cls, schema, jsons),
+    }
+    print(f"{'path':<14}{'class':<24}{'creations/s':>16}{'bytes/instance':>18}")
+    for path, scenario in scenarios.items():
+        for cls in (BaselineJsonDataModel, JsonDataModel):
+            create = scenario(cls)
+            seconds = min(timeit.repeat(create, number=1, repeat=3))
+            memory = measure_memory(create, args.number)
+            print(
+                f"{path:<14}{cls.__name__:<24}"
+                f"{args.number / seconds:>16,.0f}{memory:>18,.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
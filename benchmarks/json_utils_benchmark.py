@@ -0,0 +1,88 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+"""Micro-benchmarks of the JSON operations on payloads of growing size.
+
+The operations share the unchanged values with their inputs, so their cost
+depends on the number of top-level properties, not on the size or depth of the
+payload. The cost of the `copy.deepcopy()` they used to perform is shown for
+comparison.
+
+Usage:
+
+```
+python benchmarks/json_utils_benchmark.py --number 1000
+```
+"""
+
+import argparse
+import copy
+import timeit
+
+from synalinks.src.backend.common import json_schema_utils
+from synalinks.src.backend.common import json_utils
+
+
+def make_payload(depth, num_examples=8, embedding_size=256):
+    nested = {"answer": "Paris"}
+    for i in range(depth):
+        nested = {f"level_{i}": nested, "text": "The French capital is Paris."}
+    return {
+        "query": "What is the capital of France?",
+        "examples": [copy.deepcopy(nested) for _ in range(num_examples)],
+        "embeddings": [[0.1] * embedding_size for _ in range(num_examples)],
+        "answer": "Paris",
+    }
+
+
+def make_schema(depth):
+    nested = {"type": "object", "properties": {"answer": {"type": "string"}}}
+    for i in range(depth):
+        nested = {
+            "type": "object",
+            "properties": {f"level_{i}": nested, "text": {"type": "string"}},
+        }
+    return {
+        "type": "object",
+        "title": "Payload",
+        "properties": {"query": {"type": "string"}, "nested": nested},
+        "required": ["query", "nested"],
+    }
+
+
+def benchmark(fn, number):
+    seconds = min(timeit.repeat(fn, number=number, repeat=3))
+    return seconds / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=1000)
+    args = parser.parse_args()
+
+    operations = {
+        "concatenate_json": lambda x, s: json_utils.concatenate_json(x, x),
+        "factorize_json": lambda x, s: json_utils.factorize_json(x),
+        "out_mask_json (non recursive)": lambda x, s: json_utils.out_mask_json(
+            x, mask=["query"], recursive=False
+        ),
+        "in_mask_json (non recursive)": lambda x, s: json_utils.in_mask_json(
+            x, mask=["answer"], recursive=False
+        ),
+        "concatenate_schema": lambda x, s: json_schema_utils.concatenate_schema(s, s),
+        "out_mask_schema (non recursive)": lambda x, s: json_schema_utils.out_mask_schema(
+            s, mask=["query"], recursive=False
+        ),
+        "deepcopy (payload, for comparison)": lambda x, s: copy.deepcopy(x),
+    }
+    depths = [1, 8, 32]
+    print(f"{'operation':<40}" + "".join(f"{f'depth={d}':>14}" for d in depths))
+    for name, op in operations.items():
+        timings = []
+        for depth in depths:
+            payload = make_payload(depth)
+            schema = make_schema(depth)
+            timings.append(benchmark(lambda: op(payload, schema), args.number))
+        print(f"{name:<40}" + "".join(f"{t:>11.2f} us" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
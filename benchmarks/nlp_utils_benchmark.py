@@ -0,0 +1,77 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+"""Micro-benchmarks of the text and property key normalization.
+
+Each function is timed on a repeated workload (the same keys and texts being
+seen many times, like during training). The property key functions are timed
+with and without their own memo cache (the functions they call keep theirs).
+
+Usage:
+
+```
+python benchmarks/nlp_utils_benchmark.py --number 10000
+```
+"""
+
+import argparse
+import timeit
+
+from synalinks.src.utils import nlp_utils
+
+PROPERTY_KEYS = [
+    "answer",
+    "answers_1",
+    "thinking",
+    "reasoning_steps",
+    "user_account_2",
+    "entities",
+    "query",
+    "labels",
+]
+
+TEXTS = [
+    "The French capital is Paris, a city of art and history.",
+    "Toulouse is the French city of aeronautics and space.",
+    "An apple a day keeps the doctor away!",
+    "What is the answer? It's 42, of course...",
+]
+
+
+def get_uncached(fn):
+    return getattr(fn, "__wrapped__", fn)
+
+
+def benchmark(name, fn, inputs, number):
+    def run():
+        for x in inputs:
+            fn(x)
+
+    seconds = min(timeit.repeat(run, number=number, repeat=3))
+    per_call = seconds / (number * len(inputs)) * 1e9
+    print(f"{name:<50} {per_call:>10.1f} ns/call")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=10000)
+    args = parser.parse_args()
+
+    property_functions = [
+        nlp_utils.to_singular_without_numerical_suffix,
+        nlp_utils.to_plural_without_numerical_suffix,
+        nlp_utils.is_plural,
+        nlp_utils.remove_numerical_suffix,
+    ]
+    for fn in property_functions:
+        benchmark(
+            f"{fn.__name__} (uncached)", get_uncached(fn), PROPERTY_KEYS, args.number
+        )
+        benchmark(f"{fn.__name__}", fn, PROPERTY_KEYS, args.number)
+
+    benchmark("normalize_text", nlp_utils.normalize_text, TEXTS, args.number)
+    benchmark(
+        "normalize_and_tokenize", nlp_utils.normalize_and_tokenize, TEXTS, args.number
+    )
+
+
+if __name__ == "__main__":
+    main()
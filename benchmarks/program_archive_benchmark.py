@@ -0,0 +1,129 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+"""Benchmark of the program file formats: size and save/load time.
+
+The program is a chain of `Generator`s whose trainable variables hold a large
+few-shot state (many examples and predictions with long texts). Each format is
+saved and loaded, and the time to access the state of a single module after
+loading is measured separately, as the `.synalinks` archives only decode the
+variables when first accessed.
+
+Usage:
+
+```
+python benchmarks/program_archive_benchmark.py --num_modules 8 --num_examples 500
+```
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import timeit
+
+import synalinks
+from synalinks.src.saving import program_archive
+
+
+class Query(synalinks.DataModel):
+    query: str
+
+
+class AnswerWithRationale(synalinks.DataModel):
+    rationale: str
+    answer: str
+
+
+async def build_program(num_modules, num_examples):
+    language_model = synalinks.LanguageModel(model="ollama/mistral")
+    inputs = synalinks.Input(data_model=Query)
+    outputs = inputs
+    for _ in range(num_modules):
+        outputs = await synalinks.Generator(
+            data_model=AnswerWithRationale,
+            language_model=language_model,
+        )(outputs)
+    program = synalinks.Program(inputs=inputs, outputs=outputs)
+    for i, variable in enumerate(program.trainable_variables):
+        examples = [
+            {
+                "inputs": {"query": f"Question {i}-{j}: what is the capital of France?"},
+                "outputs": {
+                    "rationale": "The capital of France is well known. " * 20,
+                    "answer": "Paris",
+                },
+                "reward": 1.0,
+            }
+            for j in range(num_examples)
+        ]
+        variable.update({"examples": examples, "predictions": examples})
+    return program
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--num_modules", type=int, default=8)
+    parser.add_argument("--num_examples", type=int, default=500)
+    parser.add_argument("--number", type=int, default=3)
+    args = parser.parse_args()
+
+    program = asyncio.run(build_program(args.num_modules, args.num_examples))
+    formats = [
+        ("json", "program.json", {}),
+        ("json.gz", "program.json.gz", {}),
+        ("synalinks", "program.synalinks", {}),
+        (
+            "synalinks gzip-1",
+            "program.synalinks",
+            {"compression": "gzip", "compression_level": 1},
+        ),
+        ("synalinks gzip-6", "program.synalinks", {"compression": "gzip"}),
+    ]
+    if program_archive.zstandard is not None:
+        formats += [
+            ("synalinks zstd-3", "program.synalinks", {"compression": "zstd"}),
+            (
+                "synalinks zstd-19",
+                "program.synalinks",
+                {"compression": "zstd", "compression_level": 19},
+            ),
+        ]
+
+    def timeit_min(fn):
+        return min(timeit.repeat(fn, number=args.number, repeat=3)) / args.number
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        print(
+            f"{'format':<20}{'save':>12}{'load':>12}"
+            f"{'load + 1 module':>18}{'load + all':>14}{'size':>12}"
+        )
+        for name, filename, kwargs in formats:
+            filepath = os.path.join(tmp_dir, filename)
+
+            def load_one():
+                program = synalinks.Program.load(filepath)
+                program.trainable_variables[0].get("examples")
+
+            def load_all():
+                synalinks.Program.load(filepath).get_state_tree()
+
+            timings = [
+                timeit_min(fn)
+                for fn in (
+                    lambda: program.save(filepath, **kwargs),
+                    lambda: synalinks.Program.load(filepath),
+                    load_one,
+                    load_all,
+                )
+            ]
+            size = os.path.getsize(filepath) / 1e6
+            print(
+                f"{name:<20}"
+                + "".join(
+                    f"{t * 1e3:>{w - 3}.1f} ms" for t, w in zip(timings, (12, 12, 18, 14))
+                )
+                + f"{size:>9.2f} MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
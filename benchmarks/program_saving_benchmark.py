@@ -0,0 +1,96 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+"""Benchmark of the program saving and loading with each JSON codec.
+
+The program is a `Generator` whose trainable variables hold a large few-shot
+state (many examples and predictions with long texts).
+
+Usage:
+
+```
+python benchmarks/program_saving_benchmark.py --num_examples 1000
+```
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import timeit
+
+import synalinks
+from synalinks.src.utils import json_codec
+
+
+class Query(synalinks.DataModel):
+    query: str
+
+
+class AnswerWithRationale(synalinks.DataModel):
+    rationale: str
+    answer: str
+
+
+async def build_program(num_examples):
+    language_model = synalinks.LanguageModel(model="ollama/mistral")
+    inputs = synalinks.Input(data_model=Query)
+    outputs = await synalinks.Generator(
+        data_model=AnswerWithRationale,
+        language_model=language_model,
+    )(inputs)
+    program = synalinks.Program(inputs=inputs, outputs=outputs)
+    example = {
+        "inputs": {"query": "What is the capital of France? " * 20},
+        "outputs": {
+            "rationale": "The capital of France is well known. " * 50,
+            "answer": "Paris",
+        },
+        "reward": 1.0,
+    }
+    for variable in program.trainable_variables:
+        variable.update(
+            {
+                "examples": [example] * num_examples,
+                "predictions": [example] * num_examples,
+            }
+        )
+    return program
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--num_examples", type=int, default=1000)
+    parser.add_argument("--number", type=int, default=5)
+    args = parser.parse_args()
+
+    program = asyncio.run(build_program(args.num_examples))
+    codecs = ["json", "orjson"] if json_codec.orjson is not None else ["json"]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filepath = os.path.join(tmp_dir, "program.json")
+        variables_filepath = os.path.join(tmp_dir, "program.variables.json")
+        print(
+            f"{'codec':<10}{'save':>12}{'load':>12}"
+            f"{'save_variables':>18}{'load_variables':>18}{'size':>12}"
+        )
+        for codec in codecs:
+            json_codec.set_json_codec(codec)
+            timings = [
+                min(timeit.repeat(fn, number=args.number, repeat=3)) / args.number
+                for fn in (
+                    lambda: program.save(filepath),
+                    lambda: synalinks.Program.load(filepath),
+                    lambda: program.save_variables(variables_filepath),
+                    lambda: program.load_variables(variables_filepath),
+                )
+            ]
+            size = os.path.getsize(filepath) / 1e6
+            print(
+                f"{codec:<10}"
+                + "".join(
+                    f"{t * 1e3:>{w - 3}.1f} ms" for t, w in zip(timings, (12, 12, 18, 18))
+                )
+                + f"{size:>9.1f} MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -12,3 +12,4 @@ from synalinks.src.datasets.arcagi.arcagi import get_training_task_names
 from synalinks.src.datasets.arcagi.arcagi import get_validation_task_names
 from synalinks.src.datasets.arcagi.arcagi import load_data
 from synalinks.src.datasets.arcagi.arcagi import plot_task
+from synalinks.src.datasets.arcagi.program_executor import ProgramExecutor
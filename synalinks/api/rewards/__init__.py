@@ -8,9 +8,11 @@ from synalinks.src.rewards import deserialize
 from synalinks.src.rewards import get
 from synalinks.src.rewards import serialize
 from synalinks.src.rewards.cosine_similarity import CosineSimilarity
+from synalinks.src.rewards.cosine_similarity import batch_cosine_similarity
 from synalinks.src.rewards.cosine_similarity import cosine_similarity
 from synalinks.src.rewards.exact_match import ExactMatch
 from synalinks.src.rewards.exact_match import exact_match
 from synalinks.src.rewards.reward import Reward
+from synalinks.src.rewards.reward_cache import RewardCache
 from synalinks.src.rewards.reward_wrappers import ProgramAsJudge
 from synalinks.src.rewards.reward_wrappers import RewardFunctionWrapper
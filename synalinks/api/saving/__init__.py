@@ -4,6 +4,7 @@ This file was autogenerated. Do not edit it by hand,
 since your modifications would be overwritten.
 """
 
+from synalinks.src.saving.incremental_checkpoint import IncrementalCheckpoint
 from synalinks.src.saving.object_registration import CustomObjectScope
 from synalinks.src.saving.object_registration import (
     CustomObjectScope as custom_object_scope,
@@ -20,10 +20,13 @@ from synalinks.src.saving.serialization_lib import deserialize_synalinks_object
 from synalinks.src.saving.serialization_lib import serialize_synalinks_object
 from synalinks.src.trainers.data_adapters.data_adapter_utils import pack_x_y
 from synalinks.src.trainers.data_adapters.data_adapter_utils import unpack_x_y
+from synalinks.src.trainers.data_adapters.jsonl_data_adapter import JsonlDataAdapter
 from synalinks.src.utils.file_utils import get_file
 from synalinks.src.utils.io_utils import disable_interactive_logging
 from synalinks.src.utils.io_utils import enable_interactive_logging
 from synalinks.src.utils.io_utils import is_interactive_logging_enabled
+from synalinks.src.utils.json_codec import get_json_codec
+from synalinks.src.utils.json_codec import set_json_codec
 from synalinks.src.utils.plot_history import plot_history
 from synalinks.src.utils.plot_metrics import plot_metrics
 from synalinks.src.utils.progbar import Progbar
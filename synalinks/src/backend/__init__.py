@@ -12,12 +12,16 @@ from synalinks.src.backend.common.dynamic_json_schema_utils import dynamic_enum
 from synalinks.src.backend.common.json_schema_utils import concatenate_schema
 from synalinks.src.backend.common.json_schema_utils import contains_schema
 from synalinks.src.backend.common.json_schema_utils import factorize_schema
+from synalinks.src.backend.common.json_schema_utils import get_schema_fingerprint
 from synalinks.src.backend.common.json_schema_utils import in_mask_schema
 from synalinks.src.backend.common.json_schema_utils import is_schema_equal
 from synalinks.src.backend.common.json_schema_utils import out_mask_schema
 from synalinks.src.backend.common.json_schema_utils import prefix_schema
 from synalinks.src.backend.common.json_schema_utils import standardize_schema
 from synalinks.src.backend.common.json_schema_utils import suffix_schema
+from synalinks.src.backend.common.json_schema_validator import SchemaValidationError
+from synalinks.src.backend.common.json_schema_validator import get_validator
+from synalinks.src.backend.common.json_schema_validator import validate_json
 from synalinks.src.backend.common.json_utils import concatenate_json
 from synalinks.src.backend.common.json_utils import factorize_json
 from synalinks.src.backend.common.json_utils import in_mask_json
@@ -2,12 +2,29 @@
 
 import asyncio
 import inspect
+import weakref
 
 from synalinks.src.api_export import synalinks_export
 from synalinks.src.backend.common.json_schema_utils import standardize_schema
 from synalinks.src.backend.common.symbolic_data_model import SymbolicDataModel
 from synalinks.src.utils.naming import auto_name
 
+# The standardized schema of each `DataModel` class. Generating the schema of a
+# class is expensive and its result never changes.
+_STANDARDIZED_SCHEMAS = weakref.WeakKeyDictionary()
+
+
+def _get_standardized_schema(data_model):
+    cls = data_model if inspect.isclass(data_model) else type(data_model)
+    if not hasattr(cls, "model_json_schema"):
+        # A `JsonDataModel` or a `SymbolicDataModel`, with its own schema.
+        return standardize_schema(data_model.get_schema())
+    schema = _STANDARDIZED_SCHEMAS.get(cls)
+    if schema is None:
+        schema = standardize_schema(cls.get_schema())
+        _STANDARDIZED_SCHEMAS[cls] = schema
+    return schema
+
 
 @synalinks_export("synalinks.JsonDataModel")
 class JsonDataModel:
@@ -72,8 +89,16 @@ class JsonDataModel:
         query="What is the capital of France?",
     ).to_json_data_model()
     ```
+
+    **Note:** Many of these objects are created at each step, as intermediate
+    values of the programs. To keep them lightweight, the schema is shared with
+    the other data models having the same schema (see `standardize_schema()`),
+    the schema of each `DataModel` class is only generated once, and the name
+    is only generated when first accessed.
     """
 
+    __slots__ = ("_name", "_schema", "_json")
+
     def __init__(
         self,
         schema=None,
@@ -81,8 +106,7 @@ class JsonDataModel:
         data_model=None,
         name=None,
     ):
-        name = name or auto_name(self.__class__.__name__)
-        self.name = name
+        self._name = name
         self._schema = None
         self._json = None
 
@@ -99,7 +123,7 @@ class JsonDataModel:
             )
         if data_model:
             if not schema:
-                schema = data_model.get_schema()
+                schema = _get_standardized_schema(data_model)
             if not json:
                 if inspect.isclass(data_model):
                     raise ValueError(
@@ -112,6 +136,17 @@ class JsonDataModel:
         self._schema = standardize_schema(schema)
         self._json = json
 
+    @property
+    def name(self):
+        """The name of the data model."""
+        if not self._name:
+            self._name = auto_name(self.__class__.__name__)
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        self._name = value
+
     def to_symbolic_data_model(self):
         """Converts the JsonDataModel to a SymbolicDataModel.
 
@@ -403,12 +438,11 @@ class JsonDataModel:
         """Clone a data model and give it a different name."""
         import copy
 
-        clone = copy.deepcopy(self)
-        if name:
-            clone.name = name
-        else:
-            clone.name = auto_name(self.name + "_clone")
-        return clone
+        return JsonDataModel(
+            schema=self._schema,
+            json=copy.deepcopy(self._json),
+            name=name or auto_name(self.name + "_clone"),
+        )
 
     def __repr__(self):
         return f"<JsonDataModel schema={self._schema}, json={self._json}>"
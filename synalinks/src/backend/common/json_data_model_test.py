@@ -1,5 +1,7 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+from unittest.mock import patch
+
 from synalinks.src import testing
 from synalinks.src.backend import DataModel
 from synalinks.src.backend.common.json_data_model import JsonDataModel
@@ -90,3 +92,66 @@ class JsonDataModelTest(testing.TestCase):
             str(json_data_model),
             f"<JsonDataModel schema={expected_schema}, json={expected_json}>",
         )
+
+    def test_schema_is_shared(self):
+        class Query(DataModel):
+            query: str
+
+        x1 = JsonDataModel(data_model=Query(query="What is the capital of France?"))
+        x2 = JsonDataModel(data_model=Query(query="What is the capital of Italy?"))
+        self.assertIs(x1.get_schema(), x2.get_schema())
+        self.assertFalse(hasattr(x1, "__dict__"))
+
+    def test_shared_schema_is_read_only(self):
+        class Query(DataModel):
+            query: str
+
+        x1 = JsonDataModel(data_model=Query(query="What is the capital of France?"))
+        with self.assertRaises(TypeError):
+            x1.get_schema()["properties"]["query"]["type"] = "integer"
+        schema = Query.get_schema()
+        x2 = JsonDataModel(schema=schema, json={"query": "What is the capital of Italy?"})
+        schema["properties"]["query"]["type"] = "integer"
+        self.assertEqual(x2.get_schema()["properties"]["query"]["type"], "string")
+
+    def test_schema_is_generated_once_per_class(self):
+        class Query(DataModel):
+            query: str
+
+        with patch.object(
+            Query, "model_json_schema", wraps=Query.model_json_schema
+        ) as mock_model_json_schema:
+            x1 = JsonDataModel(data_model=Query(query="What is the capital of France?"))
+            x2 = Query(query="What is the capital of Italy?").to_json_data_model()
+        self.assertEqual(mock_model_json_schema.call_count, 1)
+        self.assertIs(x1.get_schema(), x2.get_schema())
+        self.assertEqual(x2.get_json(), {"query": "What is the capital of Italy?"})
+
+    def test_name_is_generated_lazily(self):
+        class Query(DataModel):
+            query: str
+
+        json_data_model = JsonDataModel(
+            data_model=Query(query="What is the capital of France?")
+        )
+        self.assertIsNone(json_data_model._name)
+        name = json_data_model.name
+        self.assertTrue(name.startswith("json_data_model"))
+        self.assertEqual(json_data_model.name, name)
+
+        json_data_model.name = "query"
+        self.assertEqual(json_data_model.name, "query")
+
+    def test_clone(self):
+        class Query(DataModel):
+            query: str
+
+        json_data_model = JsonDataModel(
+            data_model=Query(query="What is the capital of France?"),
+            name="query",
+        )
+        clone = json_data_model.clone()
+        self.assertEqual(clone.name, "query_clone")
+        self.assertIs(clone.get_schema(), json_data_model.get_schema())
+        self.assertEqual(clone.get_json(), json_data_model.get_json())
+        self.assertIsNot(clone.get_json(), json_data_model.get_json())
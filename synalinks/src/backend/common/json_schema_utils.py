@@ -1,30 +1,68 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
-import collections
-import copy
-
+from synalinks.src.backend.common.schema_registry import get_schema_registry
 from synalinks.src.utils.nlp_utils import add_suffix
 from synalinks.src.utils.nlp_utils import is_plural
 from synalinks.src.utils.nlp_utils import to_plural_without_numerical_suffix
 from synalinks.src.utils.nlp_utils import to_singular_without_numerical_suffix
 
+# Like the JSON values (see `json_utils`), the schemas are never modified in
+# place, so the operations below share the unchanged sub-schemas with their
+# inputs instead of deep copying them. The operations results are memoized and
+# interned by the schema registry, so the returned schemas are shared and
+# read-only (deep copy them first to modify them, like `dynamic_enum()`).
+
+
+def get_schema_fingerprint(schema):
+    """Returns the fingerprint of a JSON schema.
+
+    Equal schemas have the same fingerprint, whatever their key order.
+
+    Args:
+        schema (dict): The JSON schema.
+
+    Returns:
+        (str): The hexadecimal fingerprint of the schema.
+    """
+    return get_schema_registry().fingerprint(schema)
+
 
 def standardize_schema(schema):
     """Standardize the JSON schema for consistency"""
     if schema.get("title"):
-        schema = copy.deepcopy(schema)
-        schema.update({"title": "SymbolicDataModel"})
+        registry = get_schema_registry()
+        return registry.memoize(
+            ("standardize", registry.fingerprint(schema)),
+            lambda: _standardize_schema(schema),
+        )
+    return schema
+
+
+def _standardize_schema(schema):
+    if schema.get("title"):
+        schema = {**schema, "title": "SymbolicDataModel"}
     return schema
 
 
 def contains_schema(schema1, schema2):
     """Returns True if schema2 properties is a subset of schema1 properties."""
-    return schema2.get("properties").items() <= schema1.get("properties").items()
+    if schema1 is schema2:
+        return True
+    registry = get_schema_registry()
+    entry1 = registry.lookup(schema1)
+    entry2 = registry.lookup(schema2)
+    if entry1 is None or entry2 is None:
+        # Comparing the properties is cheaper than fingerprinting the schemas.
+        return schema2.get("properties").items() <= schema1.get("properties").items()
+    return registry.memoize(
+        ("contains", entry1.fingerprint, entry2.fingerprint),
+        lambda: entry2.property_fingerprints <= entry1.property_fingerprints,
+    )
 
 
 def prefix_schema(schema, prefix):
     """Add a prefix to the schema properties"""
-    schema = copy.deepcopy(schema)
+    schema = dict(schema)
     for prop_key, _ in schema.get("properties").items():
         prop_key = f"{prefix}_{prop_key}"
     return schema
@@ -32,7 +70,7 @@ def prefix_schema(schema, prefix):
 
 def suffix_schema(schema, suffix):
     """Add a suffix to the schema properties"""
-    schema = copy.deepcopy(schema)
+    schema = dict(schema)
     for prop_key, _ in schema.get("properties").items():
         prop_key = f"{prop_key}_{suffix}"
     return schema
@@ -53,11 +91,15 @@ def is_schema_equal(schema1, schema2):
         - (bool): `True` if the schemas are considered equal based on their properties,
         `False` otherwise.
     """
-    schema1_properties = schema1.get("properties", {})
-    schema2_properties = schema2.get("properties", {})
-    if len(schema1_properties) != len(schema2_properties):
-        return False
-    return schema1_properties == schema2_properties
+    if schema1 is schema2:
+        return True
+    registry = get_schema_registry()
+    entry1 = registry.lookup(schema1)
+    entry2 = registry.lookup(schema2)
+    if entry1 is None or entry2 is None:
+        # Comparing the properties is cheaper than fingerprinting the schemas.
+        return schema1.get("properties", {}) == schema2.get("properties", {})
+    return entry1.properties_fingerprint == entry2.properties_fingerprint
 
 
 def is_object(schema):
@@ -89,8 +131,14 @@ def concatenate_schema(schema1, schema2):
     Returns:
         (dict): A new JSON schema that combines the properties of the input schemas.
     """
-    schema1 = copy.deepcopy(schema1)
-    schema2 = copy.deepcopy(schema2)
+    registry = get_schema_registry()
+    return registry.memoize(
+        ("concatenate", registry.fingerprint(schema1), registry.fingerprint(schema2)),
+        lambda: _concatenate_schema(schema1, schema2),
+    )
+
+
+def _concatenate_schema(schema1, schema2):
     # Initialize the resulting schema
     result_schema = {
         "additionalProperties": False,
@@ -102,9 +150,9 @@ def concatenate_schema(schema1, schema2):
     }
 
     if schema1.get("$defs") and not schema2.get("$defs"):
-        result_schema["$defs"] = schema1.get("$defs")
+        result_schema["$defs"] = dict(schema1.get("$defs"))
     if not schema1.get("$defs") and schema2.get("$defs"):
-        result_schema["$defs"] = schema2.get("$defs")
+        result_schema["$defs"] = dict(schema2.get("$defs"))
     if schema1.get("$defs") and schema2.get("$defs"):
         result_schema["$defs"] = {**schema1.get("$defs"), **schema2.get("$defs")}
 
@@ -117,7 +165,10 @@ def concatenate_schema(schema1, schema2):
         while new_prop_key in result_schema["properties"]:
             suffix += 1
             new_prop_key = add_suffix(prop_key, suffix)
-            prop_value["title"] = new_prop_key.title().replace("_", " ")
+            prop_value = {
+                **prop_value,
+                "title": new_prop_key.title().replace("_", " "),
+            }
         result_schema["properties"][new_prop_key] = prop_value
 
         required1 = schema1.get("required")
@@ -172,7 +223,14 @@ def factorize_schema(schema):
     Returns:
         (dict): A factorized JSON schema with grouped properties.
     """
-    schema = copy.deepcopy(schema)
+    registry = get_schema_registry()
+    return registry.memoize(
+        ("factorize", registry.fingerprint(schema)),
+        lambda: _factorize_schema(schema),
+    )
+
+
+def _factorize_schema(schema):
     # Initialize the resulting schema
     result_schema = {
         "additionalProperties": False,
@@ -184,7 +242,7 @@ def factorize_schema(schema):
     }
 
     if schema.get("$defs"):
-        result_schema["$defs"] = schema.get("$defs")
+        result_schema["$defs"] = dict(schema.get("$defs"))
 
     schema_properties = schema.get("properties", {})
 
@@ -201,7 +259,7 @@ def factorize_schema(schema):
         if similar_props and not is_plural(prop_key):
             if plural_key not in result_schema["properties"]:
                 # Create an array property
-                array_prop = copy.deepcopy(prop_value)
+                array_prop = dict(prop_value)
                 array_prop["title"] = plural_key.title()
                 array_prop["type"] = "array"
                 array_prop["items"] = {"type": prop_value["type"]}
@@ -241,59 +299,28 @@ def out_mask_schema(schema, mask=None, recursive=True):
     Returns:
         (dict): A masked JSON schema with removed properties.
     """
-    result_schema = standardize_schema(copy.deepcopy(schema))
+    registry = get_schema_registry()
+    return registry.memoize(
+        (
+            "out_mask",
+            registry.fingerprint(schema),
+            frozenset(mask or ()),
+            recursive,
+        ),
+        lambda: _out_mask_schema(schema, mask=mask, recursive=recursive),
+    )
 
-    if not mask:
-        return result_schema
-
-    stack_init = [result_schema]
 
-    if recursive:
-        if "$defs" in result_schema:
-            for obk_name, obj_schema in result_schema["$defs"].items():
-                stack_init.append(obj_schema)
+def _out_mask_schema(schema, mask=None, recursive=True):
+    result_schema = dict(_standardize_schema(schema))
 
-    stack = collections.deque(stack_init)
+    if not mask:
+        return result_schema
 
     # Ensure that the mask keys are in singular form
-    mask = [to_singular_without_numerical_suffix(k) for k in mask]
-
-    while stack:
-        current = stack.pop()
-        keys_to_delete = []
+    mask = {to_singular_without_numerical_suffix(k) for k in mask}
 
-        properties = current.get("properties", {})
-
-        for prop_key, prop_value in properties.items():
-            base_key = to_singular_without_numerical_suffix(prop_key)
-            if base_key in mask:
-                keys_to_delete.append(prop_key)
-
-            if recursive:
-                if is_object(prop_value):
-                    stack.append(prop_value)
-                elif is_array(prop_value):
-                    stack.append(prop_value["items"])
-
-        for key in keys_to_delete:
-            del properties[key]
-
-        if "required" in current:
-            temp_required = []
-            for req in current.get("required"):
-                if req not in keys_to_delete:
-                    temp_required.append(req)
-            current["required"] = temp_required
-
-    # Clean up defs if no link found after masking
-    new_defs = {}
-    if "$defs" in result_schema:
-        for obj_key, obj_schema in result_schema["$defs"].items():
-            if str(result_schema).find(f"#/$defs/{obj_key}") > 0:
-                new_defs[obj_key] = obj_schema
-        result_schema["$defs"] = new_defs
-
-    return result_schema
+    return _mask_schema(result_schema, mask, recursive, keep=False)
 
 
 def in_mask_schema(schema, mask=None, recursive=True):
@@ -311,6 +338,19 @@ def in_mask_schema(schema, mask=None, recursive=True):
     Returns:
         - (dict): A masked JSON schema with only the specified properties.
     """
+    registry = get_schema_registry()
+    return registry.memoize(
+        (
+            "in_mask",
+            registry.fingerprint(schema),
+            frozenset(mask or ()),
+            recursive,
+        ),
+        lambda: _in_mask_schema(schema, mask=mask, recursive=recursive),
+    )
+
+
+def _in_mask_schema(schema, mask=None, recursive=True):
     if not mask:
         return {
             "additionalProperties": False,
@@ -319,57 +359,72 @@ def in_mask_schema(schema, mask=None, recursive=True):
             "type": "object",
         }
 
-    result_schema = standardize_schema(copy.deepcopy(schema))
+    result_schema = _standardize_schema(schema)
 
-    stack_init = [result_schema]
+    # Ensure that the mask keys are in singular form
+    mask = {to_singular_without_numerical_suffix(k) for k in mask}
 
-    if recursive:
-        if "$defs" in result_schema:
-            for _, obj_schema in result_schema["$defs"].items():
-                stack_init.append(obj_schema)
+    return _mask_schema(result_schema, mask, recursive, keep=True)
 
-    stack = collections.deque(stack_init)
 
-    # Ensure that the mask keys are in singular form
-    mask = [to_singular_without_numerical_suffix(k) for k in mask]
+def _mask_schema(schema, mask, recursive, keep):
+    result_schema = _mask_object_schema(schema, mask, recursive, keep)
+
+    if "$defs" in result_schema:
+        defs = result_schema["$defs"]
+        if recursive:
+            defs = {
+                obj_key: _mask_object_schema(obj_schema, mask, recursive, keep)
+                for obj_key, obj_schema in defs.items()
+            }
+        # Clean up defs if no link found after masking
+        schema_string = str({**result_schema, "$defs": defs})
+        result_schema["$defs"] = {
+            obj_key: obj_schema
+            for obj_key, obj_schema in defs.items()
+            if schema_string.find(f"#/$defs/{obj_key}") > 0
+        }
+    return result_schema
 
-    while stack:
-        current = stack.pop()
-        keys_to_keep = []
 
-        properties = current.get("properties", {})
+def _mask_object_schema(schema, mask, recursive, keep):
+    """Returns a copy of the schema with the masked properties.
 
+    Only the traversed sub-schemas are copied, the other values are shared.
+    """
+    result_schema = dict(schema)
+    properties = schema.get("properties")
+    if properties is not None:
+        result_properties = {}
         for prop_key, prop_value in properties.items():
             base_key = to_singular_without_numerical_suffix(prop_key)
-
-            if base_key in mask:
-                keys_to_keep.append(prop_key)
-
+            if (base_key in mask) != keep:
+                continue
             if recursive:
                 if is_object(prop_value):
-                    stack.append(prop_value)
+                    prop_value = _mask_object_schema(prop_value, mask, recursive, keep)
                 elif is_array(prop_value):
-                    stack.append(prop_value["items"])
-
-        keys_to_delete = set(properties.keys()) - set(keys_to_keep)
-        for key in keys_to_delete:
-            del properties[key]
-        if "required" in current:
-            required = []
-            for req in current["required"]:
-                if req in keys_to_keep:
-                    required.append(req)
+                    prop_value = {
+                        **prop_value,
+                        "items": _mask_object_schema(
+                            prop_value["items"], mask, recursive, keep
+                        ),
+                    }
+            result_properties[prop_key] = prop_value
+        result_schema["properties"] = result_properties
+    else:
+        result_properties = {}
+
+    if "required" in schema:
+        if keep:
+            required = [req for req in schema["required"] if req in result_properties]
             if required:
-                current["required"] = required
+                result_schema["required"] = required
             else:
-                del current["required"]
-
-    # Clean up defs if no link found after masking
-    new_defs = {}
-    if "$defs" in result_schema:
-        for obj_key, obj_schema in result_schema["$defs"].items():
-            if str(result_schema).find(f"#/$defs/{obj_key}") > 0:
-                new_defs[obj_key] = obj_schema
-        result_schema["$defs"] = new_defs
-
+                del result_schema["required"]
+        else:
+            masked_keys = set(properties or {}) - set(result_properties)
+            result_schema["required"] = [
+                req for req in schema["required"] if req not in masked_keys
+            ]
     return result_schema
@@ -1,15 +1,19 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import copy
 from typing import List
 
 from synalinks.src import testing
 from synalinks.src.backend import DataModel
 from synalinks.src.backend import standardize_schema
+from synalinks.src.backend.common.json_schema_utils import _concatenate_schema
+from synalinks.src.backend.common.json_schema_utils import _out_mask_schema
 from synalinks.src.backend.common.json_schema_utils import concatenate_schema
 from synalinks.src.backend.common.json_schema_utils import contains_schema
 from synalinks.src.backend.common.json_schema_utils import factorize_schema
 from synalinks.src.backend.common.json_schema_utils import in_mask_schema
 from synalinks.src.backend.common.json_schema_utils import out_mask_schema
+from synalinks.src.backend.common.schema_registry import get_schema_registry
 
 
 class JsonSchemaConcatenateTest(testing.TestCase):
@@ -520,3 +524,59 @@ class JsonSchemaContainsTest(testing.TestCase):
         schema2 = standardize_schema(Input2.get_schema())
 
         self.assertFalse(contains_schema(schema1, schema2))
+
+
+class JsonSchemaStructuralSharingTest(testing.TestCase):
+    def setUp(self):
+        super().setUp()
+        # The results of equal schemas are memoized, clear them to compare
+        # the results with these inputs.
+        get_schema_registry().clear()
+
+    def test_ops_do_not_modify_their_inputs(self):
+        class Inner(DataModel):
+            foo: str
+            bar: str
+
+        class Input(DataModel):
+            foo: str
+            inners: List[Inner]
+
+        schema = Input.get_schema()
+        original = copy.deepcopy(schema)
+        concatenate_schema(schema, schema)
+        factorize_schema(concatenate_schema(schema, schema))
+        out_mask_schema(schema, mask=["bar"])
+        in_mask_schema(schema, mask=["foo"])
+        standardize_schema(schema)
+        self.assertEqual(schema, original)
+
+    def test_unchanged_sub_schemas_are_shared(self):
+        class Inner(DataModel):
+            foo: str
+            bar: str
+
+        class Input(DataModel):
+            foo: str
+            bar: str
+            inners: List[Inner]
+
+        # The memoized results are interned as copies, the sharing happens in
+        # the operations themselves.
+        schema = Input.get_schema()
+        result = _concatenate_schema(schema, schema)
+        self.assertIs(result["properties"]["foo"], schema["properties"]["foo"])
+
+        result = _out_mask_schema(schema, mask=["bar"], recursive=False)
+        self.assertIs(result["properties"]["inners"], schema["properties"]["inners"])
+        self.assertIs(result["$defs"]["Inner"], schema["$defs"]["Inner"])
+
+    def test_results_are_interned(self):
+        class Input(DataModel):
+            foo: str
+            bar: str
+
+        schema = Input.get_schema()
+        result = out_mask_schema(schema, mask=["bar"])
+        self.assertIs(get_schema_registry().lookup(result).schema, result)
+        self.assertIsNot(result["properties"]["foo"], schema["properties"]["foo"])
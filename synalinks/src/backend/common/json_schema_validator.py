@@ -0,0 +1,298 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+from synalinks.src.backend.common.schema_registry import get_schema_registry
+
+# The JSON values are validated by functions compiled once per schema, and
+# cached by schema fingerprint. Each function checks a value against its
+# sub-schema and returns the (coerced) value. Like the other JSON operations,
+# the values are never modified in place: the containers are only copied when
+# one of their items is coerced.
+
+
+class SchemaValidationError(ValueError):
+    """Raised when a JSON value doesn't match its schema.
+
+    Args:
+        message (str): The reason of the violation.
+        path (str): The path of the invalid value (e.g. `answers[2].text`).
+    """
+
+    def __init__(self, message, path=""):
+        self.path = path
+        super().__init__(f"{path or '<root>'}: {message}")
+
+
+def get_validator(schema):
+    """Returns the validation function of a JSON schema.
+
+    The function is compiled on first use and cached by schema fingerprint.
+
+    Args:
+        schema (dict): The JSON schema.
+
+    Returns:
+        (callable): A function taking a JSON value and returning it coerced
+            to the schema (integral floats to integers, missing optional
+            properties to their default), or raising a `SchemaValidationError`.
+    """
+    registry = get_schema_registry()
+    return registry.memoize(
+        ("validator", registry.fingerprint(schema)),
+        lambda: _compile_validator(schema),
+    )
+
+
+def validate_json(json, schema):
+    """Validates and coerces a JSON value with the given schema.
+
+    Args:
+        json (dict): The JSON value to validate.
+        schema (dict): The JSON schema.
+
+    Returns:
+        (dict): The coerced JSON value.
+
+    Raises:
+        SchemaValidationError: If the value doesn't match the schema.
+    """
+    return get_validator(schema)(json)
+
+
+def _compile_validator(schema):
+    check = _compile(schema, _Definitions(schema.get("$defs", {})))
+
+    def validate(json):
+        return check(json, "")
+
+    return validate
+
+
+class _Definitions:
+    """The `$defs` of a schema, compiled on first reference."""
+
+    def __init__(self, defs):
+        self.defs = defs
+        self.compiled = {}
+
+    def get(self, ref):
+        name = ref.rsplit("/", 1)[-1]
+        if name not in self.compiled:
+            if not ref.startswith("#/$defs/") or name not in self.defs:
+                raise ValueError(f"Could not resolve the schema reference: {ref}")
+            self.compiled[name] = _compile(self.defs[name], self)
+        return self.compiled[name]
+
+
+def _compile(schema, defs):
+    if not isinstance(schema, dict) or not schema:
+        return _accept
+    if "$ref" in schema:
+        return _compile_ref(schema["$ref"], defs)
+    checks = []
+    for keyword in ("anyOf", "oneOf"):
+        if keyword in schema:
+            checks.append(_compile_any_of(schema[keyword], defs))
+    if "allOf" in schema:
+        checks.extend(_compile(sub_schema, defs) for sub_schema in schema["allOf"])
+    if "type" in schema:
+        checks.append(_compile_type(schema, defs))
+    if "enum" in schema:
+        checks.append(_compile_enum(schema["enum"]))
+    if "const" in schema:
+        checks.append(_compile_enum([schema["const"]]))
+    if not checks:
+        return _accept
+    if len(checks) == 1:
+        return checks[0]
+
+    def validate(value, path):
+        for check in checks:
+            value = check(value, path)
+        return value
+
+    return validate
+
+
+def _accept(value, path):
+    return value
+
+
+def _compile_ref(ref, defs):
+    def validate(value, path):
+        return defs.get(ref)(value, path)
+
+    return validate
+
+
+def _compile_any_of(sub_schemas, defs):
+    checks = [_compile(sub_schema, defs) for sub_schema in sub_schemas]
+
+    def validate(value, path):
+        errors = []
+        for check in checks:
+            try:
+                return check(value, path)
+            except SchemaValidationError as e:
+                errors.append(str(e))
+        raise SchemaValidationError(
+            f"does not match any of the expected schemas ({'; '.join(errors)})", path
+        )
+
+    return validate
+
+
+def _compile_enum(values):
+    def validate(value, path):
+        if value not in values:
+            raise SchemaValidationError(
+                f"expected one of {values}, received {value!r}", path
+            )
+        return value
+
+    return validate
+
+
+def _compile_type(schema, defs):
+    types = schema["type"]
+    if isinstance(types, list):
+        return _compile_any_of([{**schema, "type": t} for t in types], defs)
+    if types == "object":
+        return _compile_object(schema, defs)
+    if types == "array":
+        return _compile_array(schema, defs)
+    if types == "string":
+        return _compile_string(schema)
+    if types in ("integer", "number"):
+        return _compile_number(schema)
+    if types == "boolean":
+        return _compile_instance_check(bool, "a boolean")
+    if types == "null":
+        return _compile_instance_check(type(None), "null")
+    return _accept
+
+
+def _compile_instance_check(cls, description):
+    def validate(value, path):
+        if not isinstance(value, cls):
+            raise SchemaValidationError(
+                f"expected {description}, received {value!r}", path
+            )
+        return value
+
+    return validate
+
+
+def _compile_object(schema, defs):
+    properties = {
+        prop_key: _compile(prop_schema, defs)
+        for prop_key, prop_schema in schema.get("properties", {}).items()
+    }
+    required = schema.get("required", [])
+    defaults = {
+        prop_key: prop_schema["default"]
+        for prop_key, prop_schema in schema.get("properties", {}).items()
+        if isinstance(prop_schema, dict)
+        and "default" in prop_schema
+        and prop_key not in required
+    }
+    additional_properties = schema.get("additionalProperties", True)
+    if isinstance(additional_properties, dict):
+        additional_check = _compile(additional_properties, defs)
+    else:
+        additional_check = _accept if additional_properties else None
+
+    def validate(value, path):
+        if not isinstance(value, dict):
+            raise SchemaValidationError(f"expected an object, received {value!r}", path)
+        for prop_key in required:
+            if prop_key not in value:
+                raise SchemaValidationError(
+                    f"missing required property '{prop_key}'", path
+                )
+        result = value
+        for prop_key, prop_value in value.items():
+            check = properties.get(prop_key, additional_check)
+            prop_path = f"{path}.{prop_key}" if path else prop_key
+            if check is None:
+                raise SchemaValidationError("unexpected property", prop_path)
+            new_value = check(prop_value, prop_path)
+            if new_value is not prop_value:
+                if result is value:
+                    result = dict(value)
+                result[prop_key] = new_value
+        for prop_key, default in defaults.items():
+            if prop_key not in value:
+                if result is value:
+                    result = dict(value)
+                result[prop_key] = default
+        return result
+
+    return validate
+
+
+def _compile_array(schema, defs):
+    check = _compile(schema.get("items", {}), defs)
+    min_items = schema.get("minItems")
+    max_items = schema.get("maxItems")
+
+    def validate(value, path):
+        if not isinstance(value, list):
+            raise SchemaValidationError(f"expected an array, received {value!r}", path)
+        if min_items is not None and len(value) < min_items:
+            raise SchemaValidationError(f"expected at least {min_items} items", path)
+        if max_items is not None and len(value) > max_items:
+            raise SchemaValidationError(f"expected at most {max_items} items", path)
+        result = value
+        for i, item in enumerate(value):
+            new_item = check(item, f"{path}[{i}]")
+            if new_item is not item:
+                if result is value:
+                    result = list(value)
+                result[i] = new_item
+        return result
+
+    return validate
+
+
+def _compile_string(schema):
+    min_length = schema.get("minLength")
+    max_length = schema.get("maxLength")
+
+    def validate(value, path):
+        if not isinstance(value, str):
+            raise SchemaValidationError(f"expected a string, received {value!r}", path)
+        if min_length is not None and len(value) < min_length:
+            raise SchemaValidationError(
+                f"expected at least {min_length} characters", path
+            )
+        if max_length is not None and len(value) > max_length:
+            raise SchemaValidationError(f"expected at most {max_length} characters", path)
+        return value
+
+    return validate
+
+
+def _compile_number(schema):
+    integer = schema["type"] == "integer"
+    minimum = schema.get("minimum")
+    maximum = schema.get("maximum")
+
+    def validate(value, path):
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise SchemaValidationError(
+                f"expected {'an integer' if integer else 'a number'}, received {value!r}",
+                path,
+            )
+        if integer and not isinstance(value, int):
+            if not value.is_integer():
+                raise SchemaValidationError(
+                    f"expected an integer, received {value!r}", path
+                )
+            value = int(value)
+        if minimum is not None and value < minimum:
+            raise SchemaValidationError(f"expected a value >= {minimum}", path)
+        if maximum is not None and value > maximum:
+            raise SchemaValidationError(f"expected a value <= {maximum}", path)
+        return value
+
+    return validate
@@ -0,0 +1,93 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import re
+from enum import Enum
+from typing import List
+from typing import Optional
+
+from synalinks.src import testing
+from synalinks.src.backend import DataModel
+from synalinks.src.backend.common.json_schema_validator import SchemaValidationError
+from synalinks.src.backend.common.json_schema_validator import get_validator
+from synalinks.src.backend.common.json_schema_validator import validate_json
+
+
+class Label(str, Enum):
+    positive = "positive"
+    negative = "negative"
+
+
+class Entity(DataModel):
+    name: str
+    label: Label
+    score: float
+
+
+class Document(DataModel):
+    title: str
+    entities: List[Entity]
+    page: int
+    summary: Optional[str] = None
+
+
+class JsonSchemaValidatorTest(testing.TestCase):
+    def test_valid_json_is_returned_unchanged(self):
+        json = {
+            "title": "Report",
+            "entities": [{"name": "Paris", "label": "positive", "score": 1}],
+            "page": 3,
+            "summary": "A report about Paris.",
+        }
+        self.assertIs(validate_json(json, Document.get_schema()), json)
+
+    def test_coercion(self):
+        json = {
+            "title": "Report",
+            "entities": [{"name": "Paris", "label": "positive", "score": 0.5}],
+            "page": 3.0,
+        }
+        result = validate_json(json, Document.get_schema())
+        self.assertEqual(result["page"], 3)
+        self.assertIsInstance(result["page"], int)
+        self.assertIsNone(result["summary"])
+        self.assertIs(result["entities"], json["entities"])
+        self.assertEqual(json["page"], 3.0)
+        self.assertNotIn("summary", json)
+
+    def test_violations(self):
+        schema = Document.get_schema()
+        valid = {
+            "title": "Report",
+            "entities": [{"name": "Paris", "label": "positive", "score": 0.5}],
+            "page": 3,
+        }
+        invalid_jsons = {
+            "page": {**valid, "page": 3.5},
+            "<root>": {"title": "Report", "page": 3},
+            "entities[0].label": {
+                **valid,
+                "entities": [{"name": "Paris", "label": "neutral", "score": 0.5}],
+            },
+            "entities[0].score": {
+                **valid,
+                "entities": [{"name": "Paris", "label": "positive", "score": "high"}],
+            },
+            "author": {**valid, "author": "John"},
+            "summary": {**valid, "summary": 42},
+        }
+        for path, json in invalid_jsons.items():
+            with self.assertRaisesRegex(SchemaValidationError, f"^{re.escape(path)}"):
+                validate_json(json, schema)
+
+    def test_booleans_are_not_numbers(self):
+        class Answer(DataModel):
+            answer: int
+
+        with self.assertRaises(SchemaValidationError):
+            validate_json({"answer": True}, Answer.get_schema())
+
+    def test_validator_is_cached(self):
+        self.assertIs(
+            get_validator(Document.get_schema()),
+            get_validator(Document.get_schema()),
+        )
@@ -1,17 +1,19 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
-import collections
-import copy
-
 from synalinks.src.utils.nlp_utils import add_suffix
 from synalinks.src.utils.nlp_utils import is_plural
 from synalinks.src.utils.nlp_utils import to_plural_without_numerical_suffix
 from synalinks.src.utils.nlp_utils import to_singular_without_numerical_suffix
 
+# The JSON values flowing in the programs are never modified in place, so the
+# operations below build new top-level objects that share the unchanged values
+# with their inputs instead of deep copying them. Use `JsonDataModel.clone()`
+# to get an independent copy.
+
 
 def prefix_json(json, prefix):
     """Add a prefix to the json object keys"""
-    json = copy.deepcopy(json)
+    json = dict(json)
     for prop_key, _ in json.items():
         prop_key = f"{prefix}_{prop_key}"
     return json
@@ -19,7 +21,7 @@ def prefix_json(json, prefix):
 
 def suffix_json(json, suffix):
     """Add a suffix to the json object keys"""
-    json = copy.deepcopy(json)
+    json = dict(json)
     for prop_key, _ in json.items():
         prop_key = f"{prop_key}_{suffix}"
     return json
@@ -38,9 +40,6 @@ def concatenate_json(json1, json2):
     Returns:
         (dict): A new Json object that combines the properties of the input objects.
     """
-    json1 = copy.deepcopy(json1)
-    json2 = copy.deepcopy(json2)
-
     result_json = {}
 
     def add_property(prop_key, prop_value, suffix=0):
@@ -73,7 +72,6 @@ def factorize_json(json):
     Returns:
         (dict): A factorized Json object with grouped properties.
     """
-    json = copy.deepcopy(json)
     # Initialize the resulting Json object
     result_json = {}
 
@@ -100,6 +98,9 @@ def factorize_json(json):
                 result_json[base_key] = prop_value
             else:
                 # If the property is a plural (a list) ensure it is added to the result
+                # (copied, as the similar properties can be appended to it)
+                if isinstance(prop_value, list):
+                    prop_value = list(prop_value)
                 result_json[prop_key] = prop_value
 
     return result_json
@@ -120,38 +121,37 @@ def out_mask_json(json, mask=None, recursive=True):
     Returns:
         - (dict): A masked Json object with removed properties.
     """
-    json = copy.deepcopy(json)
-
     if not mask:
-        return json
-
-    stack = collections.deque([json])
+        return dict(json)
 
     # Ensure that the mask keys are in singular form
-    mask = [to_singular_without_numerical_suffix(k) for k in mask]
+    mask = {to_singular_without_numerical_suffix(k) for k in mask}
 
-    while stack:
-        current = stack.pop()
-        keys_to_delete = []
+    return dict(_out_mask_object(json, mask, recursive))
 
-        for prop_key, prop_value in current.items():
-            base_key = to_singular_without_numerical_suffix(prop_key)
 
-            if base_key in mask:
-                keys_to_delete.append(prop_key)
-
-            if recursive:
-                if isinstance(prop_value, dict):
-                    stack.append(prop_value)
-                elif isinstance(prop_value, list):
-                    for item in prop_value:
-                        if isinstance(item, dict):
-                            stack.append(item)
-
-        for key in keys_to_delete:
-            del current[key]
-
-    return json
+def _out_mask_object(json, mask, recursive):
+    """Returns the masked object, or the object itself if unchanged."""
+    result_json = {}
+    changed = False
+    for prop_key, prop_value in json.items():
+        if to_singular_without_numerical_suffix(prop_key) in mask:
+            changed = True
+            continue
+        if recursive:
+            if isinstance(prop_value, dict):
+                new_value = _out_mask_object(prop_value, mask, recursive)
+            elif isinstance(prop_value, list):
+                new_value = _map_objects(
+                    prop_value,
+                    lambda item: _out_mask_object(item, mask, recursive),
+                )
+            else:
+                new_value = prop_value
+            changed = changed or new_value is not prop_value
+            prop_value = new_value
+        result_json[prop_key] = prop_value
+    return result_json if changed else json
 
 
 def in_mask_json(json, mask=None, recursive=True):
@@ -169,37 +169,36 @@ def in_mask_json(json, mask=None, recursive=True):
     Returns:
         (dict): A masked Json object with only the specified properties.
     """
-    json = copy.deepcopy(json)
-
     if not mask:
         return {}
 
-    stack = collections.deque([json])
-
     # Ensure that the mask keys are in singular form
-    mask = [to_singular_without_numerical_suffix(k) for k in mask]
-
-    while stack:
-        current = stack.pop()
-        keys_to_keep = []
+    mask = {to_singular_without_numerical_suffix(k) for k in mask}
 
-        for prop_key, prop_value in current.items():
-            base_key = to_singular_without_numerical_suffix(prop_key)
+    return _in_mask_object(json, mask, recursive)
 
-            if base_key in mask:
-                keys_to_keep.append(prop_key)
 
-            if recursive:
-                if isinstance(prop_value, dict):
-                    stack.append(prop_value)
-                elif isinstance(prop_value, list):
-                    keys_to_keep.append(prop_key)
-                    for item in prop_value:
-                        if isinstance(item, dict):
-                            stack.append(item)
+def _in_mask_object(json, mask, recursive):
+    result_json = {}
+    for prop_key, prop_value in json.items():
+        keep = to_singular_without_numerical_suffix(prop_key) in mask
+        if recursive:
+            if isinstance(prop_value, dict):
+                prop_value = _in_mask_object(prop_value, mask, recursive)
+            elif isinstance(prop_value, list):
+                keep = True
+                prop_value = _map_objects(
+                    prop_value,
+                    lambda item: _in_mask_object(item, mask, recursive),
+                )
+        if keep:
+            result_json[prop_key] = prop_value
+    return result_json
 
-        keys_to_delete = set(current.keys()) - set(keys_to_keep)
-        for key in keys_to_delete:
-            del current[key]
 
-    return json
+def _map_objects(items, fn):
+    """Applies `fn` to the objects of a list, sharing the list if unchanged."""
+    new_items = [fn(item) if isinstance(item, dict) else item for item in items]
+    if all(new_item is item for new_item, item in zip(new_items, items)):
+        return items
+    return new_items
@@ -1,5 +1,6 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import copy
 from typing import List
 
 from synalinks.src import testing
@@ -571,3 +572,42 @@ class JsonInMaskTest(testing.TestCase):
 
         result = in_mask_json(json, mask=["foo"], recursive=False)
         self.assertEqual(result, expected)
+
+
+class JsonStructuralSharingTest(testing.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.json = {
+            "query": "What is the capital of France?",
+            "embeddings": [[0.1, 0.2, 0.3]],
+            "examples": [{"answer": "Paris", "thinking": "It's Paris"}],
+            "answers": ["Paris"],
+            "answer": "Paris",
+        }
+        self.original = copy.deepcopy(self.json)
+
+    def test_ops_do_not_modify_their_inputs(self):
+        concatenate_json(self.json, self.json)
+        factorize_json(self.json)
+        factorize_json(concatenate_json(self.json, self.json))
+        out_mask_json(self.json, mask=["thinking"])
+        in_mask_json(self.json, mask=["answer"])
+        self.assertEqual(self.json, self.original)
+
+    def test_unchanged_values_are_shared(self):
+        result = concatenate_json(self.json, self.json)
+        self.assertIs(result["embeddings"], self.json["embeddings"])
+        self.assertIs(result["embeddings_1"], self.json["embeddings"])
+
+        result = out_mask_json(self.json, mask=["query"])
+        self.assertNotIn("query", result)
+        self.assertIs(result["embeddings"], self.json["embeddings"])
+        self.assertIs(result["examples"], self.json["examples"])
+
+        result = out_mask_json(self.json, mask=["thinking"])
+        self.assertIsNot(result["examples"], self.json["examples"])
+        self.assertIs(result["embeddings"], self.json["embeddings"])
+
+    def test_top_level_object_is_always_new(self):
+        self.assertIsNot(out_mask_json(self.json), self.json)
+        self.assertIsNot(out_mask_json(self.json, mask=["foo"]), self.json)
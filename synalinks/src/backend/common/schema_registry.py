@@ -0,0 +1,288 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import collections
+import copy
+import hashlib
+import json
+import threading
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+SCHEMA_REGISTRY_SIZE = 4096
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError(
+        "The interned schemas are shared and read-only, "
+        "copy them first (e.g. with `copy.deepcopy()`) to modify them."
+    )
+
+
+class ReadOnlyDict(dict):
+    """A `dict` that can't be modified in place, used for the interned schemas.
+
+    It behaves like a `dict` otherwise (e.g. for JSON serialization), and
+    its (deep) copies are regular, modifiable, `dict`s.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    __ior__ = _read_only
+    clear = _read_only
+    pop = _read_only
+    popitem = _read_only
+    setdefault = _read_only
+    update = _read_only
+
+    def copy(self):
+        return dict(self)
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self):
+        return (ReadOnlyDict, (dict(self),))
+
+
+class ReadOnlyList(list):
+    """A `list` that can't be modified in place, used for the interned schemas.
+
+    It behaves like a `list` otherwise, and its (deep) copies are regular,
+    modifiable, `list`s.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    __iadd__ = _read_only
+    __imul__ = _read_only
+    append = _read_only
+    clear = _read_only
+    extend = _read_only
+    insert = _read_only
+    pop = _read_only
+    remove = _read_only
+    reverse = _read_only
+    sort = _read_only
+
+    def copy(self):
+        return list(self)
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return [copy.deepcopy(value, memo) for value in self]
+
+    def __reduce__(self):
+        return (ReadOnlyList, (list(self),))
+
+
+def freeze_schema(value):
+    """Returns a read-only deep copy of a JSON schema (or of a JSON value)."""
+    if isinstance(value, ReadOnlyDict) or isinstance(value, ReadOnlyList):
+        return value
+    if isinstance(value, dict):
+        return ReadOnlyDict((key, freeze_schema(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return ReadOnlyList(freeze_schema(item) for item in value)
+    return value
+
+
+class SchemaEntry:
+    """The fingerprints of a schema.
+
+    Only the fingerprint of the whole schema is computed when the entry is
+    created, the fingerprints of the properties are computed when first used.
+
+    Args:
+        schema (dict): The schema.
+        fingerprint (str): The fingerprint of the whole schema.
+    """
+
+    __slots__ = (
+        "schema",
+        "fingerprint",
+        "_properties_fingerprint",
+        "_property_fingerprints",
+    )
+
+    def __init__(self, schema, fingerprint):
+        self.schema = schema
+        self.fingerprint = fingerprint
+        self._properties_fingerprint = None
+        self._property_fingerprints = None
+
+    @property
+    def property_fingerprints(self):
+        """The `(key, fingerprint)` pairs of each property of the schema."""
+        if self._property_fingerprints is None:
+            properties = self.schema.get("properties") or {}
+            self._property_fingerprints = frozenset(
+                (prop_key, _digest(prop_value))
+                for prop_key, prop_value in properties.items()
+            )
+        return self._property_fingerprints
+
+    @property
+    def properties_fingerprint(self):
+        """The fingerprint of the schema properties."""
+        if self._properties_fingerprint is None:
+            self._properties_fingerprint = _digest(self.schema.get("properties") or {})
+        return self._properties_fingerprint
+
+
+class SchemaRegistry:
+    """Interns the JSON schemas and assigns each a stable fingerprint.
+
+    The fingerprint of a schema is the digest of its canonical JSON, so equal
+    schemas have the same fingerprint, whatever their key order. Each distinct
+    schema is interned: the registry keeps a read-only deep copy of the first
+    registered instance as the canonical one (see `ReadOnlyDict`), and the
+    results of the schema operations are memoized by the fingerprints of their
+    inputs.
+
+    The interned schemas are looked up by identity, so their fingerprints are
+    computed once. They are shared by all the users of the registry, so they
+    can't be modified in place. The other schemas are fingerprinted on each
+    lookup, and the registry doesn't keep any reference to them. The least
+    recently used entries are evicted after `max_size` entries.
+
+    Args:
+        max_size (int): The maximum number of entries of each table
+            (Default to `SCHEMA_REGISTRY_SIZE`).
+    """
+
+    def __init__(self, max_size=SCHEMA_REGISTRY_SIZE):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        # fingerprint -> SchemaEntry
+        self._interned = collections.OrderedDict()
+        # id(interned schema) -> SchemaEntry
+        self._instances = {}
+        # memoization key -> result
+        self._results = collections.OrderedDict()
+
+    def lookup(self, schema):
+        """Returns the `SchemaEntry` of an interned schema, `None` otherwise.
+
+        Only the interned instances are found, the lookup is done by identity
+        without fingerprinting the schema.
+        """
+        with self._lock:
+            entry = self._instances.get(id(schema))
+            if entry is not None and entry.schema is schema:
+                self._interned.move_to_end(entry.fingerprint)
+                return entry
+        return None
+
+    def get_entry(self, schema):
+        """Returns the `SchemaEntry` of a schema, without registering it."""
+        entry = self.lookup(schema)
+        if entry is None:
+            entry = _make_entry(schema)
+        return entry
+
+    def fingerprint(self, schema):
+        """Returns the fingerprint of a schema."""
+        return self.get_entry(schema).fingerprint
+
+    def intern(self, schema):
+        """Returns the canonical instance of a schema, registering it if needed.
+
+        The returned schema is read-only.
+        """
+        entry = self.lookup(schema)
+        if entry is not None:
+            return entry.schema
+        entry = _make_entry(schema)
+        with self._lock:
+            interned = self._interned.get(entry.fingerprint)
+            if interned is not None:
+                self._interned.move_to_end(entry.fingerprint)
+                return interned.schema
+            # A copy, so the interned schema is not affected by the changes
+            # made by the caller to its own instance.
+            entry.schema = freeze_schema(schema)
+            self._interned[entry.fingerprint] = entry
+            self._instances[id(entry.schema)] = entry
+            if len(self._interned) > self.max_size:
+                _, evicted = self._interned.popitem(last=False)
+                del self._instances[id(evicted.schema)]
+        return entry.schema
+
+    def memoize(self, key, fn):
+        """Returns the memoized result of `fn()` for the given key.
+
+        The result is interned, so the schemas derived from it are also
+        looked up in constant time.
+        """
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                return self._results[key]
+        result = fn()
+        if isinstance(result, dict):
+            result = self.intern(result)
+        with self._lock:
+            _put(self._results, key, result, self.max_size)
+        return result
+
+    def clear(self):
+        """Removes all the entries of the registry."""
+        with self._lock:
+            self._interned.clear()
+            self._instances.clear()
+            self._results.clear()
+
+    def __len__(self):
+        return len(self._interned)
+
+
+def _make_entry(schema):
+    # The canonical JSON has sorted keys, so a single digest of the whole
+    # schema doesn't depend on the key order.
+    return SchemaEntry(schema, _digest(schema))
+
+
+def _put(table, key, value, max_size):
+    table[key] = value
+    table.move_to_end(key)
+    if len(table) > max_size:
+        table.popitem(last=False)
+
+
+def _digest(value):
+    canonical_json = None
+    if orjson is not None:
+        try:
+            canonical_json = orjson.dumps(value, default=str, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            # e.g. non-string keys, handled by the `json` library.
+            pass
+    if canonical_json is None:
+        canonical_json = json.dumps(
+            value,
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=str,
+        ).encode("utf-8")
+    return hashlib.blake2b(canonical_json, digest_size=16).hexdigest()
+
+
+GLOBAL_SCHEMA_REGISTRY = SchemaRegistry()
+
+
+def get_schema_registry():
+    """Returns the global schema registry."""
+    return GLOBAL_SCHEMA_REGISTRY
@@ -0,0 +1,124 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import copy
+
+from synalinks.src import testing
+from synalinks.src.backend import DataModel
+from synalinks.src.backend.common.json_schema_utils import concatenate_schema
+from synalinks.src.backend.common.json_schema_utils import contains_schema
+from synalinks.src.backend.common.json_schema_utils import get_schema_fingerprint
+from synalinks.src.backend.common.json_schema_utils import is_schema_equal
+from synalinks.src.backend.common.json_schema_utils import out_mask_schema
+from synalinks.src.backend.common.json_schema_utils import standardize_schema
+from synalinks.src.backend.common.schema_registry import SchemaRegistry
+from synalinks.src.backend.common.schema_registry import get_schema_registry
+
+
+class Query(DataModel):
+    query: str
+
+
+class Answer(DataModel):
+    answer: str
+
+
+class SchemaRegistryTest(testing.TestCase):
+    def test_fingerprint_is_independent_of_key_order(self):
+        schema = Query.get_schema()
+        reordered = dict(reversed(list(schema.items())))
+        self.assertEqual(
+            get_schema_fingerprint(schema),
+            get_schema_fingerprint(reordered),
+        )
+        self.assertNotEqual(
+            get_schema_fingerprint(schema),
+            get_schema_fingerprint(Answer.get_schema()),
+        )
+
+    def test_intern_returns_the_canonical_instance(self):
+        registry = SchemaRegistry()
+        schema = Query.get_schema()
+        interned = registry.intern(schema)
+        self.assertEqual(interned, schema)
+        self.assertIsNot(interned, schema)
+        self.assertIs(registry.intern(Query.get_schema()), interned)
+        self.assertIs(registry.intern(interned), interned)
+        self.assertIs(registry.lookup(interned).schema, interned)
+        self.assertEqual(len(registry), 1)
+
+    def test_interned_schema_is_a_copy(self):
+        registry = SchemaRegistry()
+        schema = Query.get_schema()
+        interned = registry.intern(schema)
+        schema["properties"]["query"]["type"] = "integer"
+        self.assertEqual(interned["properties"]["query"]["type"], "string")
+        self.assertNotEqual(registry.fingerprint(schema), registry.fingerprint(interned))
+
+    def test_interned_schema_is_read_only(self):
+        registry = SchemaRegistry()
+        interned = registry.intern(Query.get_schema())
+        with self.assertRaisesRegex(TypeError, "read-only"):
+            interned["title"] = "Answer"
+        with self.assertRaisesRegex(TypeError, "read-only"):
+            interned["properties"]["query"]["type"] = "integer"
+        with self.assertRaisesRegex(TypeError, "read-only"):
+            interned["required"].append("answer")
+        schema = copy.deepcopy(interned)
+        schema["properties"]["query"]["type"] = "integer"
+        schema["required"].append("answer")
+        self.assertEqual(interned, Query.get_schema())
+
+    def test_unregistered_schemas_are_not_kept(self):
+        registry = SchemaRegistry()
+        schema = Query.get_schema()
+        registry.fingerprint(schema)
+        self.assertIsNone(registry.lookup(schema))
+        self.assertEqual(len(registry), 0)
+
+    def test_entries_are_evicted(self):
+        registry = SchemaRegistry(max_size=1)
+        query_schema = registry.intern(Query.get_schema())
+        registry.intern(Answer.get_schema())
+        self.assertEqual(len(registry), 1)
+        self.assertIsNone(registry.lookup(query_schema))
+
+    def test_memoize(self):
+        registry = SchemaRegistry()
+        calls = []
+
+        def fn():
+            calls.append(None)
+            return {"type": "object", "properties": {}}
+
+        result = registry.memoize("key", fn)
+        self.assertIs(registry.memoize("key", fn), result)
+        self.assertEqual(len(calls), 1)
+
+    def test_schema_ops_are_memoized(self):
+        schema1 = Query.get_schema()
+        schema2 = Answer.get_schema()
+        result = concatenate_schema(schema1, schema2)
+        self.assertIs(concatenate_schema(Query.get_schema(), Answer.get_schema()), result)
+        result = out_mask_schema(result, mask=["answer"])
+        self.assertIs(
+            out_mask_schema(concatenate_schema(schema1, schema2), mask=["answer"]),
+            result,
+        )
+        self.assertIs(standardize_schema(schema1), standardize_schema(schema1))
+
+    def test_equality_and_subset_checks(self):
+        schema = concatenate_schema(Query.get_schema(), Answer.get_schema())
+        self.assertTrue(is_schema_equal(Query.get_schema(), Query.get_schema()))
+        self.assertFalse(is_schema_equal(schema, Query.get_schema()))
+        self.assertTrue(contains_schema(schema, Query.get_schema()))
+        self.assertTrue(contains_schema(schema, Answer.get_schema()))
+        self.assertFalse(contains_schema(Query.get_schema(), schema))
+
+    def test_checks_dont_register_the_schemas(self):
+        registry = get_schema_registry()
+        schema1 = {**Query.get_schema(), "title": "Unregistered"}
+        schema2 = {**Query.get_schema(), "title": "Unregistered"}
+        self.assertTrue(is_schema_equal(schema1, schema2))
+        self.assertTrue(contains_schema(schema1, schema2))
+        self.assertIsNone(registry.lookup(schema1))
+        self.assertIsNone(registry.lookup(schema2))
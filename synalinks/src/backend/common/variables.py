@@ -127,6 +127,8 @@ class Variable:
         self._initializer = None
         self._data_model = data_model
         self._trainable = bool(trainable)
+        self._version = 0
+        self._lazy_updates = []
 
         if in_stateless_scope():
             if callable(initializer):
@@ -198,6 +200,8 @@ class Variable:
             value = scope.get_current_value(self)
             if value is not None:
                 return value
+        if self._lazy_updates:
+            self._apply_lazy_updates()
         if self._json is None:
             # Uninitialized variable. Return a placeholder.
             # This is fine because it's only ever used
@@ -256,6 +260,8 @@ class Variable:
             json (dict): The new json value to be assigned.
         """
         self._json = json
+        self._lazy_updates = []
+        self._version += 1
 
     def get_schema(self):
         """The schema of the variable.
@@ -274,6 +280,14 @@ class Variable:
     def trainable(self, value):
         self._trainable = bool(value)
 
+    @property
+    def version(self):
+        """The number of times the variable was assigned or updated.
+
+        The in place modifications of the variable fields are not counted.
+        """
+        return self._version
+
     @property
     def name(self):
         """The name of the variable."""
@@ -285,6 +299,8 @@ class Variable:
         return self._path
 
     def __repr__(self):
+        if self._lazy_updates:
+            self._apply_lazy_updates()
         json = None
         if self._json is not None:
             json = self._json
@@ -308,6 +324,8 @@ class Variable:
             json (dict): The initial value (JSON object dict).
         """
         self._json = json
+        self._lazy_updates = []
+        self._version += 1
 
     def to_json_data_model(self):
         """Convert the variable into a `JsonDataModel`.
@@ -331,6 +349,8 @@ class Variable:
         Args:
             key (str): The key to access.
         """
+        if self._lazy_updates:
+            self._apply_lazy_updates()
         return self._json.get(key, default_value)
 
     def update(self, kv_dict):
@@ -339,7 +359,28 @@ class Variable:
         Args:
             kv_dict (dict): The key/value dict to update.
         """
+        if self._lazy_updates:
+            self._apply_lazy_updates()
         self._json.update(kv_dict)
+        self._version += 1
+
+    def lazy_update(self, loader):
+        """Update wrapper deferring the loading of the fields to the first access.
+
+        The fields are loaded with `loader()` when the variable value is first
+        read or modified. Used to load the saved variables, so their JSON is
+        only decoded when needed.
+
+        Args:
+            loader (callable): A function returning the key/value dict to update.
+        """
+        self._lazy_updates.append(loader)
+        self._version += 1
+
+    def _apply_lazy_updates(self):
+        lazy_updates, self._lazy_updates = self._lazy_updates, []
+        for loader in lazy_updates:
+            self._json.update(loader())
 
 
 def register_uninitialized_variable(variable):
@@ -265,7 +265,7 @@ class DataModel(pydantic.BaseModel, metaclass=MetaDataModel):
         Returns:
             (JsonDataModel): The backend-independent data model.
         """
-        return JsonDataModel(schema=self.get_schema(), json=self.get_json())
+        return JsonDataModel(data_model=self)
 
     def __add__(self, other):
         """Concatenates this data model with another.
@@ -10,8 +10,13 @@ import numpy as np
 
 from synalinks.src.api_export import synalinks_export
 from synalinks.src.callbacks.callback import Callback
+from synalinks.src.saving import checkpoint_writer
+from synalinks.src.saving import program_archive
+from synalinks.src.saving import serialization_lib
+from synalinks.src.saving.incremental_checkpoint import IncrementalCheckpoint
 from synalinks.src.utils import file_utils
 from synalinks.src.utils import io_utils
+from synalinks.src.utils.python_utils import pythonify_logs
 
 
 @synalinks_export("synalinks.callbacks.ProgramCheckpoint")
@@ -89,6 +94,19 @@ class ProgramCheckpoint(Callback):
 
     # The program variables (that are considered the best) can be loaded as -
     program.load_variables(checkpoint_filepath)
+
+    # For long trainings, the checkpoints can be appended to a single log that
+    # only holds the variables that changed since the previous checkpoint -
+    checkpoint_filepath = '/tmp/synalinks/checkpoints.jsonl'
+    program_checkpoint_callback = synalinks.callbacks.ProgramCheckpoint(
+        filepath=checkpoint_filepath,
+        incremental=True,
+    )
+
+    # Any of the checkpoints can be restored as -
+    synalinks.saving.IncrementalCheckpoint(checkpoint_filepath).restore(
+        program, checkpoint=-1
+    )
     ```
 
     Args:
@@ -142,6 +160,37 @@ class ProgramCheckpoint(Callback):
             metric to be monitored. Only applies if `save_best_value=True`. Only
             overwrites the program variables already saved if the performance of
             current program is better than this value.
+        incremental (bool): If `True`, the checkpoints are appended to an
+            `IncrementalCheckpoint` log that only holds the variables that changed
+            since the previous checkpoint. The `filepath` needs to end with
+            `".jsonl"` and cannot contain formatting options. Defaults to `False`.
+        snapshot_freq (int): When `incremental=True`, the number of checkpoints
+            between two full snapshots of the variables. Defaults to 10.
+        max_snapshots (int): Optional. When `incremental=True`, the maximum
+            number of snapshots kept in the log, the older checkpoints being
+            dropped. If `None`, all the checkpoints are kept.
+        background (bool): If `True`, the checkpoints are serialized and written
+            by a background thread, so the training steps don't wait on the disk.
+            A snapshot of the variables is taken when the checkpoint is made,
+            and the pending writes are finished at the end of the training.
+            Defaults to `False`.
+        max_pending_writes (int): When `background=True`, the maximum number of
+            checkpoints waiting to be written. When reached, the training waits
+            for the oldest one to be written, bounding the memory used by the
+            snapshots. Defaults to 2.
+        compression (str): Optional. The compression of the `.synalinks`
+            archives, one of `"gzip"` or `"zstd"` (see `Program.save()`).
+            Defaults to `None`.
+        compression_level (int): Optional. The compression level of the
+            `.synalinks` archives (see `Program.save()`).
+
+    The checkpoint files are written atomically (to a temporary file renamed
+    once complete), so an interrupted training never leaves a partial checkpoint.
+    If the `filepath` ends with `".json.gz"` (or `".variables.json.gz"`), the
+    checkpoints are compressed with gzip, and can still be loaded with
+    `Program.load()` (or `program.load_variables()`). If it ends with
+    `".synalinks"` (or `".variables.synalinks"`), the checkpoints are saved
+    as program archives, whose variables are loaded lazily.
     """
 
     def __init__(
@@ -154,6 +203,13 @@ class ProgramCheckpoint(Callback):
         mode="auto",
         save_freq="epoch",
         initial_value_threshold=None,
+        incremental=False,
+        snapshot_freq=10,
+        max_snapshots=None,
+        background=False,
+        max_pending_writes=2,
+        compression=None,
+        compression_level=None,
     ):
         super().__init__()
         self.monitor = monitor
@@ -165,6 +221,14 @@ class ProgramCheckpoint(Callback):
         self._batches_seen_since_last_saving = 0
         self._last_batch_seen = 0
         self.best = initial_value_threshold
+        if compression not in program_archive.ARCHIVE_COMPRESSIONS:
+            raise ValueError(
+                "Invalid compression, expected one of "
+                f"{program_archive.ARCHIVE_COMPRESSIONS}, "
+                f"received compression={compression}"
+            )
+        self.compression = compression
+        self.compression_level = compression_level
 
         if mode not in ["auto", "min", "max"]:
             warnings.warn(
@@ -192,8 +256,31 @@ class ProgramCheckpoint(Callback):
                 "Expected save_freq are 'epoch' or integer values"
             )
 
-        if save_variables_only:
-            if not self.filepath.endswith(".variables.json"):
+        self.incremental = incremental
+        self._checkpoint = None
+        self._writer = None
+        if background:
+            self._writer = checkpoint_writer.CheckpointWriter(
+                max_pending_writes=max_pending_writes
+            )
+        if incremental:
+            if "{" in self.filepath:
+                raise ValueError(
+                    "When using `incremental=True` in `ProgramCheckpoint`, "
+                    "the filepath provided cannot contain formatting options, "
+                    "all the checkpoints are appended to the same file. "
+                    f"Received: filepath={self.filepath}"
+                )
+            self._checkpoint = IncrementalCheckpoint(
+                self.filepath,
+                snapshot_freq=snapshot_freq,
+                max_snapshots=max_snapshots,
+                save_program_config=not save_variables_only,
+            )
+        elif save_variables_only:
+            if not self.filepath.endswith(
+                (".variables.json", ".variables.json.gz", ".variables.synalinks")
+            ):
                 raise ValueError(
                     "When using `save_variables_only=True` in `ProgramCheckpoint`"
                     ", the filepath provided must end in `.variables.json` "
@@ -201,7 +288,7 @@ class ProgramCheckpoint(Callback):
                     f"filepath={self.filepath}"
                 )
         else:
-            if not self.filepath.endswith(".json"):
+            if not self.filepath.endswith((".json", ".json.gz", ".synalinks")):
                 raise ValueError(
                     "The filepath provided must end in `.json` "
                     "(Synalinks program format). Received: "
@@ -219,6 +306,10 @@ class ProgramCheckpoint(Callback):
         if self.save_freq == "epoch":
             self._save_program(epoch=epoch, batch=None, logs=logs)
 
+    def on_train_end(self, logs=None):
+        if self._writer is not None:
+            self._writer.close()
+
     def _should_save_on_batch(self, batch):
         """Handles batch-level saving logic, supports steps_per_execution."""
         if self.save_freq == "epoch":
@@ -267,7 +358,7 @@ class ProgramCheckpoint(Callback):
                         f"a scalar value. Received: {current}. "
                         "Falling back to `save_best_only=False`."
                     )
-                    self.program.save(filepath, overwrite=True)
+                    self._write_checkpoint(filepath, epoch, batch, logs)
                 else:
                     if self.monitor_op(current, self.best):
                         if self.verbose > 0:
@@ -278,10 +369,7 @@ class ProgramCheckpoint(Callback):
                                 f"saving program to {filepath}"
                             )
                         self.best = current
-                        if self.save_variables_only:
-                            self.program.save_variables(filepath, overwrite=True)
-                        else:
-                            self.program.save(filepath, overwrite=True)
+                        self._write_checkpoint(filepath, epoch, batch, logs)
                     else:
                         if self.verbose > 0:
                             io_utils.print_msg(
@@ -292,10 +380,7 @@ class ProgramCheckpoint(Callback):
             else:
                 if self.verbose > 0:
                     io_utils.print_msg(f"\nEpoch {epoch + 1}: saving model to {filepath}")
-                if self.save_variables_only:
-                    self.program.save_variables(filepath, overwrite=True)
-                else:
-                    self.program.save(filepath, overwrite=True)
+                self._write_checkpoint(filepath, epoch, batch, logs)
         except IsADirectoryError:  # h5py 3.x
             raise IOError(
                 "Please specify a non-directory filepath for "
@@ -314,6 +399,51 @@ class ProgramCheckpoint(Callback):
             # Re-throw the error for any other causes.
             raise e
 
+    def _write_checkpoint(self, filepath, epoch, batch, logs):
+        if self.incremental:
+            self._checkpoint.save(
+                self.program,
+                metadata={"epoch": epoch, "batch": batch, "logs": pythonify_logs(logs)},
+                writer=self._writer,
+            )
+        elif self._writer is not None:
+            program_config = None
+            if not self.save_variables_only:
+                program_config = serialization_lib.serialize_synalinks_object(
+                    self.program
+                )
+            if filepath.endswith(".synalinks"):
+                variables = checkpoint_writer.snapshot_json(
+                    self.program._get_flat_state()
+                )
+                self._writer.submit(
+                    program_archive.save_archive,
+                    filepath,
+                    variables,
+                    config=program_config,
+                    compression=self.compression,
+                    compression_level=self.compression_level,
+                )
+                return
+            config = checkpoint_writer.snapshot_json(self.program.get_state_tree())
+            if program_config is not None:
+                config = {**program_config, "variables": config}
+            self._writer.submit(checkpoint_writer.write_json, filepath, config)
+        elif self.save_variables_only:
+            self.program.save_variables(
+                filepath,
+                overwrite=True,
+                compression=self.compression,
+                compression_level=self.compression_level,
+            )
+        else:
+            self.program.save(
+                filepath,
+                overwrite=True,
+                compression=self.compression,
+                compression_level=self.compression_level,
+            )
+
     def _get_file_path(self, epoch, batch, logs):
         """Returns the file path for checkpoint."""
 
@@ -1,6 +1,10 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import functools
+import hashlib
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 import matplotlib.pyplot as plt
@@ -9,7 +13,10 @@ from matplotlib import colors
 
 from synalinks.src.api_export import synalinks_export
 from synalinks.src.backend import DataModel
+from synalinks.src.backend import config
+from synalinks.src.saving import checkpoint_writer
 from synalinks.src.utils import file_utils
+from synalinks.src.utils import json_codec
 
 from .dsl import Grid
 
@@ -821,6 +828,13 @@ EVALUATION_TASK_NAMES = [
     "ff72ca3e",
 ]
 
+_TASK_SPLITS = {
+    **{task_name: "training" for task_name in TRAINING_TASK_NAMES},
+    **{task_name: "evaluation" for task_name in EVALUATION_TASK_NAMES},
+}
+
+_CACHE_FORMAT_VERSION = 1
+
 
 class TaskExample(DataModel):
     """An example of task"""
@@ -990,50 +1004,109 @@ def plot_task(
 
 
 @synalinks_export("synalinks.datasets.arcagi.load_data")
-def load_data(task_names=None):
+def load_data(task_names=None, data_dir=None, cache_dir=None, max_workers=None):
     """
     Load and format data from github
 
+    The tasks are fetched and formatted in parallel, then stored in a cache
+    file per source (`<cache_dir>/datasets/arcagi_tasks_<source hash>.json.gz`),
+    so the next loads from the same source only read this file.
+
     Example:
 
     ```python
     (x_train, y_train), (x_test, y_test) = synalinks.datasets.arcagi.load_data()
     ```
 
+    To load the tasks offline, provide a local copy of the `data` directory of the
+    [ARC-AGI repository](https://github.com/fchollet/ARC-AGI) (containing the
+    `training` and `evaluation` directories):
+
+    ```python
+    (x_train, y_train), (x_test, y_test) = synalinks.datasets.arcagi.load_data(
+        data_dir="ARC-AGI/data",
+    )
+    ```
+
     Args:
         task_names (list): Optional. The list of tasks to fetch.
+        data_dir (str): Optional. The local directory to read the tasks from,
+            instead of fetching them from github.
+        cache_dir (str): Optional. The directory of the cache file.
+            Defaults to `~/.synalinks/` (or `$SYNALINKS_HOME`).
+        max_workers (int): Optional. The number of threads fetching and
+            formatting the tasks not in the cache.
 
     Returns:
         (tuple): The train and test data ready for training
     """
+    if not task_names:
+        task_names = TRAINING_TASK_NAMES + EVALUATION_TASK_NAMES
+    task_names = [task_name for task_name in task_names if task_name in _TASK_SPLITS]
+
+    # The tasks of a local copy can differ from the ones on github, so each
+    # source has its own cache file.
+    source = os.path.abspath(data_dir) if data_dir else BASE_URL
+    source_hash = hashlib.sha256(source.encode("utf-8")).hexdigest()[:16]
+    cache_path = os.path.join(
+        cache_dir or config.synalinks_home(),
+        "datasets",
+        f"arcagi_tasks_{source_hash}.json.gz",
+    )
+    cached_tasks = {}
+    if file_utils.exists(cache_path):
+        cache = json_codec.loads(checkpoint_writer.read_file(cache_path))
+        if (
+            cache.get("format_version") == _CACHE_FORMAT_VERSION
+            and cache.get("source") == source
+        ):
+            cached_tasks = cache["tasks"]
+
+    tasks = {}
+    for task_name in task_names:
+        if task_name in cached_tasks:
+            task = cached_tasks[task_name]
+            tasks[task_name] = (
+                ARCAGIInput.model_validate(task["inputs"]),
+                ARCAGIOutput.model_validate(task["outputs"]),
+            )
+
+    missing_task_names = [task_name for task_name in task_names if task_name not in tasks]
+    if missing_task_names:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                functools.partial(fetch_and_format, data_dir=data_dir),
+                missing_task_names,
+            )
+            for task_name, (x, y) in zip(missing_task_names, results):
+                tasks[task_name] = (x, y)
+                cached_tasks[task_name] = {
+                    "inputs": x.get_json(),
+                    "outputs": y.get_json(),
+                }
+        checkpoint_writer.write_json(
+            cache_path,
+            {
+                "format_version": _CACHE_FORMAT_VERSION,
+                "source": source,
+                "tasks": cached_tasks,
+            },
+        )
+
     x_train = []
     y_train = []
     x_test = []
     y_test = []
 
-    if not task_names:
-        for task_name in TRAINING_TASK_NAMES:
-            (x, y) = fetch_and_format(task_name)
+    for task_name in task_names:
+        (x, y) = tasks[task_name]
+        if _TASK_SPLITS[task_name] == "training":
             x_train.append(x)
             y_train.append(y)
-
-        for task_name in EVALUATION_TASK_NAMES:
-            (x, y) = fetch_and_format(task_name)
+        else:
             x_test.append(x)
             y_test.append(y)
 
-    else:
-        for task_name in task_names:
-            if task_name in TRAINING_TASK_NAMES:
-                (x, y) = fetch_and_format(task_name)
-                x_train.append(x)
-                y_train.append(y)
-
-            if task_name in EVALUATION_TASK_NAMES:
-                (x, y) = fetch_and_format(task_name)
-                x_test.append(x)
-                x_test.append(y)
-
     x_train = np.array(x_train, dtype="object")
     y_train = np.array(y_train, dtype="object")
     x_test = np.array(x_test, dtype="object")
@@ -1043,7 +1116,7 @@ def load_data(task_names=None):
 
 
 @synalinks_export("synalinks.datasets.arcagi.fetch_and_format")
-def fetch_and_format(task_name):
+def fetch_and_format(task_name, data_dir=None):
     """
     Fetch and format one task by name
 
@@ -1052,43 +1125,37 @@ def fetch_and_format(task_name):
     ```python
     x, y = synalinks.datasets.arcagi.fetch_and_format("62c24649")
     ```
+
+    Args:
+        task_name (str): The name of the task.
+        data_dir (str): Optional. The local directory to read the task from,
+            instead of fetching it from github (see `load_data()`).
+
+    Returns:
+        (tuple): The task inputs and target data.
     """
-    if task_name in TRAINING_TASK_NAMES:
-        url = f"{BASE_URL}/training/{task_name}.json"
-    elif task_name in EVALUATION_TASK_NAMES:
-        url = f"{BASE_URL}/evaluation/{task_name}.json"
-    else:
+    split = _TASK_SPLITS.get(task_name)
+    if split is None:
         raise ValueError(
             f"Task '{task_name}' not recognized, make sure that the task name is valid."
         )
 
-    x = None
-    y = None
-
-    file_path = file_utils.get_file(origin=url, progbar=False)
+    if data_dir:
+        file_path = os.path.join(data_dir, split, f"{task_name}.json")
+    else:
+        url = f"{BASE_URL}/{split}/{task_name}.json"
+        file_path = file_utils.get_file(origin=url, progbar=False)
     with open(file_path, "r") as f:
         json_data = json.loads(f.read())
-        trainset = json_data.get("train")
-        testset = json_data.get("test")
-        x = ARCAGIInput(grid=testset[0].get("input"))
-        x.examples.append(
-            TaskExample(
-                inputs=tuple(map(tuple, trainset[0].get("input"))),
-                outputs=tuple(map(tuple, trainset[0].get("output"))),
-            )
-        )
+    trainset = json_data.get("train")
+    testset = json_data.get("test")
+    x = ARCAGIInput(grid=testset[0].get("input"))
+    for example in trainset[:3]:
         x.examples.append(
             TaskExample(
-                inputs=tuple(map(tuple, trainset[1].get("input"))),
-                outputs=tuple(map(tuple, trainset[1].get("output"))),
+                inputs=tuple(map(tuple, example.get("input"))),
+                outputs=tuple(map(tuple, example.get("output"))),
             )
         )
-        if len(trainset) > 2:
-            x.examples.append(
-                TaskExample(
-                    inputs=tuple(map(tuple, trainset[2].get("input"))),
-                    outputs=tuple(map(tuple, trainset[2].get("output"))),
-                )
-            )
-        y = ARCAGIOutput(grid=tuple(map(tuple, testset[0].get("output"))))
+    y = ARCAGIOutput(grid=tuple(map(tuple, testset[0].get("output"))))
     return x, y
@@ -0,0 +1,95 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import json
+import os
+import shutil
+
+from synalinks.src import testing
+from synalinks.src.datasets.arcagi import arcagi
+
+
+def make_task(value):
+    return {
+        "train": [
+            {"input": [[value, 0]], "output": [[0, value]]},
+            {"input": [[value, 1]], "output": [[1, value]]},
+            {"input": [[value, 2]], "output": [[2, value]]},
+            {"input": [[value, 3]], "output": [[3, value]]},
+        ],
+        "test": [{"input": [[value, 4]], "output": [[4, value]]}],
+    }
+
+
+class ARCAGITest(testing.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.training_task_name = arcagi.TRAINING_TASK_NAMES[0]
+        self.evaluation_task_name = arcagi.EVALUATION_TASK_NAMES[0]
+        self.data_dir = os.path.join(self.get_temp_dir(), "data")
+        for split, task_name, value in (
+            ("training", self.training_task_name, 1),
+            ("evaluation", self.evaluation_task_name, 2),
+        ):
+            os.makedirs(os.path.join(self.data_dir, split))
+            with open(os.path.join(self.data_dir, split, f"{task_name}.json"), "w") as f:
+                json.dump(make_task(value), f)
+        self.cache_dir = os.path.join(self.get_temp_dir(), "cache")
+
+    def test_fetch_and_format(self):
+        x, y = arcagi.fetch_and_format(self.training_task_name, data_dir=self.data_dir)
+        self.assertEqual(x.grid, ((1, 4),))
+        self.assertEqual(len(x.examples), 3)
+        self.assertEqual(x.examples[2].outputs, ((2, 1),))
+        self.assertEqual(y.grid, ((4, 1),))
+        with self.assertRaisesRegex(ValueError, "not recognized"):
+            arcagi.fetch_and_format("unknown", data_dir=self.data_dir)
+
+    def test_load_data(self):
+        task_names = [self.training_task_name, self.evaluation_task_name, "unknown"]
+        (x_train, y_train), (x_test, y_test) = arcagi.load_data(
+            task_names=task_names,
+            data_dir=self.data_dir,
+            cache_dir=self.cache_dir,
+        )
+        self.assertEqual(len(x_train), 1)
+        self.assertEqual(len(y_train), 1)
+        self.assertEqual(len(x_test), 1)
+        self.assertEqual(len(y_test), 1)
+        self.assertIsInstance(x_test[0], arcagi.ARCAGIInput)
+        self.assertIsInstance(y_test[0], arcagi.ARCAGIOutput)
+        self.assertEqual(y_test[0].grid, ((4, 2),))
+
+        # The next loads from the same source read the cache file
+        shutil.rmtree(self.data_dir)
+        (x_train_cached, y_train_cached), (x_test_cached, y_test_cached) = (
+            arcagi.load_data(
+                task_names=task_names,
+                data_dir=self.data_dir,
+                cache_dir=self.cache_dir,
+            )
+        )
+        self.assertEqual(x_train_cached[0].get_json(), x_train[0].get_json())
+        self.assertEqual(y_train_cached[0].get_json(), y_train[0].get_json())
+        self.assertEqual(x_test_cached[0].get_json(), x_test[0].get_json())
+        self.assertEqual(y_test_cached[0].get_json(), y_test[0].get_json())
+
+    def test_cache_per_source(self):
+        task_names = [self.training_task_name]
+        arcagi.load_data(
+            task_names=task_names,
+            data_dir=self.data_dir,
+            cache_dir=self.cache_dir,
+        )
+        other_data_dir = os.path.join(self.get_temp_dir(), "other_data")
+        os.makedirs(os.path.join(other_data_dir, "training"))
+        with open(
+            os.path.join(other_data_dir, "training", f"{self.training_task_name}.json"),
+            "w",
+        ) as f:
+            json.dump(make_task(3), f)
+        (x_train, y_train), _ = arcagi.load_data(
+            task_names=task_names,
+            data_dir=other_data_dir,
+            cache_dir=self.cache_dir,
+        )
+        self.assertEqual(y_train[0].grid, ((4, 3),))
@@ -1,3 +1,4 @@
+from . import numpy_dsl
 from .dsl import *  # noqa: F403
 
 DSL_FUNCTIONS = {
@@ -163,14 +164,29 @@ DSL_FUNCTIONS = {
     "width": width,  # noqa: F405
 }
 
+# The functions of the NumPy backend, where the grids are NumPy arrays.
+NUMPY_DSL_FUNCTIONS = {name: getattr(numpy_dsl, name) for name in DSL_FUNCTIONS}
 
-def get(identifier):
+DSL_BACKENDS = {
+    "tuple": DSL_FUNCTIONS,
+    "numpy": NUMPY_DSL_FUNCTIONS,
+}
+
+
+def get(identifier, backend="tuple"):
     """Retrieve a ARC DSL function based on its name.
 
     Args:
         identifier (str): The function identifier.
+        backend (str): The DSL backend, either `"tuple"` (the grids are tuples
+            of tuples) or `"numpy"` (the grids are NumPy arrays).
+            Defaults to `"tuple"`.
     """
+    if backend not in DSL_BACKENDS:
+        raise ValueError(
+            f"Unknown dsl backend: {backend}, expected one of {list(DSL_BACKENDS)}"
+        )
     if isinstance(identifier, str):
-        return DSL_FUNCTIONS.get(identifier)
+        return DSL_BACKENDS[backend].get(identifier)
     else:
         raise ValueError(f"Could not interpret dsl function identifier: {identifier}")
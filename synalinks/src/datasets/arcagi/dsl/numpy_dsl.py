@@ -0,0 +1,542 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+# NumPy backend of the ARC-AGI DSL.
+#
+# The grids are 2D integer NumPy arrays (`ArrayGrid`) instead of tuples of
+# tuples, and the primitives taking or returning grids are implemented with
+# array operations (the objects are found with a connected-component
+# labelling). The patches, objects and numerical values keep the types of the
+# tuple implementation, and the other primitives are shared with it (use
+# `to_array()` and `to_grid()` to convert the grids).
+#
+# Like the tuple grids, the `ArrayGrid`s are compared and hashed by value, so
+# the container primitives (e.g. `initset()`, `mostcommon()`, `other()`) also
+# work on grids, and a program gives the same results with both backends.
+# The only difference is the tie-breaking of `mostcolor()` and `leastcolor()`
+# on grids: the smallest color is returned, while the tuple implementation
+# returns the first color of a Python set. Inside this module, the grids are
+# compared element-wise with `np.equal()` and `np.not_equal()`.
+
+import itertools
+
+import numpy as np
+
+from . import dsl
+from .dsl import *  # noqa: F403
+
+_DIRECT_NEIGHBORS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+_DIAGONAL_NEIGHBORS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+
+class ArrayGrid(np.ndarray):
+    """array grid, compared and hashed by value like the tuple grids"""
+
+    def __eq__(self, other):
+        if not isinstance(other, np.ndarray):
+            return NotImplemented
+        return self.shape == other.shape and np.array_equal(self, other)
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __hash__(self):
+        # The hash of the tuple grid, so the containers of grids are iterated
+        # in the same order with both backends.
+        return hash(to_grid(self))
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def __array_wrap__(self, array, context=None, return_scalar=False):
+        # The reductions (e.g. `grid.max()`) return NumPy scalars, not grids.
+        if array.ndim == 0:
+            return array[()]
+        return super().__array_wrap__(array, context)
+
+
+def _grid(array):
+    return array.view(ArrayGrid)
+
+
+def to_array(grid):
+    """conversion of tuple grid to array grid"""
+    if isinstance(grid, ArrayGrid):
+        return grid
+    if len(grid) == 0:
+        return _grid(np.zeros((0, 0), dtype=np.int64))
+    return _grid(np.array(grid, dtype=np.int64))
+
+
+def to_grid(array):
+    """conversion of array grid to tuple grid"""
+    return tuple(map(tuple, array.tolist()))
+
+
+def _is_grid(element):
+    return isinstance(element, np.ndarray)
+
+
+def _to_array(indices, n):
+    # Faster than `np.array()` for the lists of tuples.
+    indices = itertools.chain.from_iterable(indices)
+    return np.fromiter(indices, dtype=np.int64, count=2 * n).reshape(n, 2)
+
+
+def _patch_indices(patch, grid):
+    # The rows and columns of the patch cells inside the grid.
+    indices = dsl.toindices(patch)
+    indices = _to_array(indices, len(indices))
+    rows, cols = indices[:, 0], indices[:, 1]
+    h, w = grid.shape
+    inside = (rows >= 0) & (rows < h) & (cols >= 0) & (cols < w)
+    return rows[inside], cols[inside]
+
+
+def _object_cells(obj, grid):
+    # The values, rows and columns of the object cells inside the grid.
+    values = np.fromiter((v for v, _ in obj), dtype=np.int64, count=len(obj))
+    indices = _to_array((index for _, index in obj), len(obj))
+    rows, cols = indices[:, 0], indices[:, 1]
+    h, w = grid.shape
+    inside = (rows >= 0) & (rows < h) & (cols >= 0) & (cols < w)
+    return values[inside], rows[inside], cols[inside]
+
+
+def _to_object(values, rows, cols):
+    return frozenset(zip(values.tolist(), zip(rows.tolist(), cols.tolist())))
+
+
+def _color_counts(grid):
+    # The colors of the grid in increasing order, and their number of cells.
+    values = np.asarray(grid).ravel()
+    if values.size and values.min() >= 0:
+        counts = np.bincount(values)
+        colors = np.flatnonzero(counts)
+        return colors, counts[colors]
+    return np.unique(values, return_counts=True)
+
+
+def equality(a, b):
+    """equality"""
+    if _is_grid(a) or _is_grid(b):
+        if not (_is_grid(a) and _is_grid(b)):
+            return False
+        return a is b or (a.shape == b.shape and np.array_equal(a, b))
+    return a == b
+
+
+def mostcolor(element):
+    """most common color"""
+    if not _is_grid(element):
+        return dsl.mostcolor(element)
+    colors, counts = _color_counts(element)
+    return int(colors[np.argmax(counts)])
+
+
+def leastcolor(element):
+    """least common color"""
+    if not _is_grid(element):
+        return dsl.leastcolor(element)
+    colors, counts = _color_counts(element)
+    return int(colors[np.argmin(counts)])
+
+
+def height(piece):
+    """height of grid or patch"""
+    if not _is_grid(piece):
+        return dsl.height(piece)
+    return piece.shape[0]
+
+
+def width(piece):
+    """width of grid or patch"""
+    if not _is_grid(piece):
+        return dsl.width(piece)
+    return piece.shape[1] if piece.shape[0] else 0
+
+
+def shape(piece):
+    """height and width of grid or patch"""
+    return (height(piece), width(piece))
+
+
+def portrait(piece):
+    """whether height is greater than width"""
+    return height(piece) > width(piece)
+
+
+def square(piece):
+    """whether the piece forms a square"""
+    if not _is_grid(piece):
+        return dsl.square(piece)
+    return piece.shape[0] == piece.shape[1]
+
+
+def colorcount(element, value):
+    """number of cells with color"""
+    if not _is_grid(element):
+        return dsl.colorcount(element, value)
+    return int(np.count_nonzero(np.equal(element, value)))
+
+
+def palette(element):
+    """colors occurring in object or grid"""
+    if not _is_grid(element):
+        return dsl.palette(element)
+    colors, _ = _color_counts(element)
+    return frozenset(colors.tolist())
+
+
+def numcolors(element):
+    """number of colors occurring in object or grid"""
+    return len(palette(element))
+
+
+def asindices(grid):
+    """indices of all grid cells"""
+    h, w = grid.shape
+    return frozenset(itertools.product(range(h), range(w)))
+
+
+def ofcolor(grid, value):
+    """indices of all grid cells with value"""
+    rows, cols = np.nonzero(np.equal(grid, value))
+    return frozenset(zip(rows.tolist(), cols.tolist()))
+
+
+def crop(grid, start, dims):
+    """subgrid specified by start and dimension"""
+    return grid[start[0] : start[0] + dims[0], start[1] : start[1] + dims[1]]
+
+
+def _label(grid, univalued, diagonal, bg):
+    # Connected-component labelling by propagating the smallest cell index of
+    # each component to its neighbors, the labels of the excluded cells being
+    # `grid.size`.
+    h, w = grid.shape
+    if bg is not None:
+        valid = np.not_equal(grid, bg)
+    else:
+        valid = np.ones(grid.shape, dtype=bool)
+    labels = np.where(valid, np.arange(grid.size).reshape(h, w), grid.size)
+    offsets = _DIRECT_NEIGHBORS + (_DIAGONAL_NEIGHBORS if diagonal else ())
+    edges = []
+    for di, dj in offsets:
+        cell = (slice(max(-di, 0), h - max(di, 0)), slice(max(-dj, 0), w - max(dj, 0)))
+        neighbor = (
+            slice(max(di, 0), h + min(di, 0)),
+            slice(max(dj, 0), w + min(dj, 0)),
+        )
+        connected = valid[cell] & valid[neighbor]
+        if univalued:
+            connected &= np.equal(grid[cell], grid[neighbor])
+        edges.append((cell, neighbor, connected))
+    flat_labels = np.append(labels.ravel(), grid.size)
+    while True:
+        new_labels = labels.copy()
+        for cell, neighbor, connected in edges:
+            np.minimum(
+                new_labels[cell],
+                np.where(connected, labels[neighbor], grid.size),
+                out=new_labels[cell],
+            )
+        # Each label is the index of a cell of the component, so following
+        # the labels of the labels speeds up the propagation.
+        flat_labels[:-1] = new_labels.ravel()
+        new_labels = flat_labels[new_labels]
+        if np.array_equal(new_labels, labels):
+            return labels, valid
+        labels = new_labels
+
+
+def gobjects(grid, univalued, diagonal, without_bg):
+    """objects occurring on the grid"""
+    if grid.size == 0:
+        return frozenset()
+    bg = mostcolor(grid) if without_bg else None
+    labels, valid = _label(grid, univalued, diagonal, bg)
+    rows, cols = np.nonzero(valid)
+    if len(rows) == 0:
+        return frozenset()
+    cell_labels = labels[rows, cols]
+    order = np.argsort(cell_labels, kind="stable")
+    rows, cols, cell_labels = rows[order], cols[order], cell_labels[order]
+    values = grid[rows, cols]
+    boundaries = np.flatnonzero(np.diff(cell_labels)) + 1
+    return frozenset(
+        _to_object(values[start:stop], rows[start:stop], cols[start:stop])
+        for start, stop in zip(
+            [0, *boundaries.tolist()], [*boundaries.tolist(), len(rows)]
+        )
+    )
+
+
+def _color_object(grid, value):
+    rows, cols = np.nonzero(np.equal(grid, value))
+    return _to_object(np.full(len(rows), value), rows, cols)
+
+
+def partition(grid):
+    """each cell with the same value part of the same object"""
+    return frozenset(_color_object(grid, value) for value in palette(grid))
+
+
+def fgpartition(grid):
+    """each cell with the same value part of the same object without background"""
+    return frozenset(
+        _color_object(grid, value) for value in palette(grid) - {mostcolor(grid)}
+    )
+
+
+def toobject(patch, grid):
+    """object from patch and grid"""
+    rows, cols = _patch_indices(patch, grid)
+    return _to_object(grid[rows, cols], rows, cols)
+
+
+def asobject(grid):
+    """conversion of grid to object"""
+    rows, cols = np.indices(grid.shape)
+    return _to_object(grid.ravel(), rows.ravel(), cols.ravel())
+
+
+def rot90(grid):
+    """quarter clockwise rotation"""
+    return grid[::-1].T
+
+
+def rot180(grid):
+    """half rotation"""
+    return grid[::-1, ::-1]
+
+
+def rot270(grid):
+    """quarter anticlockwise rotation"""
+    return grid[:, ::-1].T
+
+
+def hmirror(piece):
+    """mirroring along horizontal"""
+    if not _is_grid(piece):
+        return dsl.hmirror(piece)
+    return piece[::-1]
+
+
+def vmirror(piece):
+    """mirroring along vertical"""
+    if not _is_grid(piece):
+        return dsl.vmirror(piece)
+    return piece[:, ::-1]
+
+
+def dmirror(piece):
+    """mirroring along diagonal"""
+    if not _is_grid(piece):
+        return dsl.dmirror(piece)
+    return piece.T
+
+
+def cmirror(piece):
+    """mirroring along counterdiagonal"""
+    if not _is_grid(piece):
+        return dsl.cmirror(piece)
+    return piece[::-1, ::-1].T
+
+
+def fill(grid, value, patch):
+    """fill value at indices"""
+    rows, cols = _patch_indices(patch, grid)
+    grid_filled = grid.copy()
+    grid_filled[rows, cols] = value
+    return grid_filled
+
+
+def paint(grid, obj):
+    """paint object to grid"""
+    values, rows, cols = _object_cells(obj, grid)
+    grid_painted = grid.copy()
+    grid_painted[rows, cols] = values
+    return grid_painted
+
+
+def underfill(grid, value, patch):
+    """fill value at indices that are background"""
+    rows, cols = _patch_indices(patch, grid)
+    background = np.equal(grid[rows, cols], mostcolor(grid))
+    grid_filled = grid.copy()
+    grid_filled[rows[background], cols[background]] = value
+    return grid_filled
+
+
+def underpaint(grid, obj):
+    """paint object to grid where there is background"""
+    values, rows, cols = _object_cells(obj, grid)
+    background = np.equal(grid[rows, cols], mostcolor(grid))
+    grid_painted = grid.copy()
+    grid_painted[rows[background], cols[background]] = values[background]
+    return grid_painted
+
+
+def hupscale(grid, factor):
+    """upscale grid horizontally"""
+    return _grid(np.repeat(grid, factor, axis=1))
+
+
+def vupscale(grid, factor):
+    """upscale grid vertically"""
+    return _grid(np.repeat(grid, factor, axis=0))
+
+
+def upscale(element, factor):
+    """upscale object or grid"""
+    if not _is_grid(element):
+        return dsl.upscale(element, factor)
+    return _grid(np.repeat(np.repeat(element, factor, axis=0), factor, axis=1))
+
+
+def downscale(grid, factor):
+    """downscale grid"""
+    return grid[::factor, ::factor]
+
+
+def hconcat(a, b):
+    """concatenate two grids horizontally"""
+    return _grid(np.concatenate((a, b), axis=1))
+
+
+def vconcat(a, b):
+    """concatenate two grids vertically"""
+    return _grid(np.concatenate((a, b), axis=0))
+
+
+def subgrid(patch, grid):
+    """smallest subgrid containing object"""
+    return crop(grid, dsl.ulcorner(patch), dsl.shape(patch))
+
+
+def hsplit(grid, n):
+    """split grid horizontally"""
+    h, w = grid.shape[0], grid.shape[1] // n
+    offset = grid.shape[1] % n != 0
+    return tuple(crop(grid, (0, w * i + i * offset), (h, w)) for i in range(n))
+
+
+def vsplit(grid, n):
+    """split grid vertically"""
+    h, w = grid.shape[0] // n, grid.shape[1]
+    offset = grid.shape[0] % n != 0
+    return tuple(crop(grid, (h * i + i * offset, 0), (h, w)) for i in range(n))
+
+
+def cellwise(a, b, fallback):
+    """cellwise match of two grids"""
+    return _grid(np.where(np.equal(a, b), a, fallback))
+
+
+def replace(grid, replacee, replacer):
+    """color substitution"""
+    return _grid(np.where(np.equal(grid, replacee), replacer, grid))
+
+
+def switch(grid, a, b):
+    """color switching"""
+    return _grid(np.where(np.equal(grid, a), b, np.where(np.equal(grid, b), a, grid)))
+
+
+def index(grid, loc):
+    """color at location"""
+    i, j = loc
+    h, w = grid.shape
+    if not (0 <= i < h and 0 <= j < w):
+        return None
+    return int(grid[i, j])
+
+
+def canvas(value, dimensions):
+    """grid construction"""
+    return _grid(np.full(dimensions, value, dtype=np.int64))
+
+
+def cover(grid, patch):
+    """remove object from grid"""
+    return fill(grid, mostcolor(grid), patch)
+
+
+def trim(grid):
+    """trim border of grid"""
+    return grid[1:-1, 1:-1]
+
+
+def move(grid, obj, offset):
+    """move object on grid"""
+    return paint(cover(grid, obj), dsl.shift(obj, offset))
+
+
+def tophalf(grid):
+    """upper half of grid"""
+    return grid[: grid.shape[0] // 2]
+
+
+def bottomhalf(grid):
+    """lower half of grid"""
+    h = grid.shape[0]
+    return grid[h // 2 + h % 2 :]
+
+
+def _columns(grid, start, stop):
+    # Like the tuple implementation (rotating the rows), the grids without
+    # columns have no rows.
+    columns = grid[:, start:stop]
+    return columns if columns.shape[1] else columns[:0]
+
+
+def lefthalf(grid):
+    """left half of grid"""
+    return _columns(grid, 0, grid.shape[1] // 2)
+
+
+def righthalf(grid):
+    """right half of grid"""
+    w = grid.shape[1]
+    return _columns(grid, w // 2 + w % 2, w)
+
+
+def occurrences(grid, obj):
+    """locations of occurrences of object in grid"""
+    h, w = grid.shape
+    if len(obj) == 0:
+        return asindices(grid)
+    normed = dsl.normalize(obj)
+    oh, ow = dsl.shape(normed)
+    if oh > h or ow > w:
+        return frozenset()
+    # Whether the object occurs at each location where it fits in the grid.
+    occurs = np.ones((h - oh + 1, w - ow + 1), dtype=bool)
+    for v, (a, b) in normed:
+        occurs &= np.equal(grid[a : a + h - oh + 1, b : b + w - ow + 1], v)
+    rows, cols = np.nonzero(occurs)
+    return frozenset(zip(rows.tolist(), cols.tolist()))
+
+
+def _uniform_rows(grid):
+    return np.equal(grid, grid[:, :1]).all(axis=1)
+
+
+def frontiers(grid):
+    """set of frontiers"""
+    h, w = grid.shape
+    hfrontiers = frozenset(
+        _to_object(grid[i], np.full(w, i), np.arange(w))
+        for i in np.flatnonzero(_uniform_rows(grid)).tolist()
+    )
+    vfrontiers = frozenset(
+        _to_object(grid[:, j], np.arange(h), np.full(h, j))
+        for j in np.flatnonzero(_uniform_rows(grid.T)).tolist()
+    )
+    return hfrontiers | vfrontiers
+
+
+def compress(grid):
+    """removes frontiers from grid"""
+    return grid[~_uniform_rows(grid)][:, ~_uniform_rows(grid.T)]
@@ -0,0 +1,222 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import numpy as np
+from absl.testing import parameterized
+
+from synalinks.src import testing
+from synalinks.src.datasets.arcagi import dsl as dsl_module
+from synalinks.src.datasets.arcagi.dsl import dsl
+from synalinks.src.datasets.arcagi.dsl import numpy_dsl
+
+
+def make_grids():
+    # Grids with a dominant background color, so the most common color is
+    # never tied (the backends break the ties differently).
+    rng = np.random.RandomState(0)
+    grids = [((0,),), ((1, 2, 2),)]
+    for h, w in ((3, 5), (6, 6), (10, 7), (30, 30)):
+        grid = np.zeros((h, w), dtype=np.uint8)
+        for _ in range(max(h, w) // 2):
+            i, j = rng.randint(h), rng.randint(w)
+            grid[i : i + rng.randint(1, 4), j : j + rng.randint(1, 4)] = rng.randint(
+                1, 10
+            )
+        noise = rng.rand(h, w) < 0.1
+        grid[noise] = rng.randint(1, 10, size=noise.sum())
+        grid[h // 2] = 3
+        grids.append(numpy_dsl.to_grid(grid))
+    # A single serpentine object, the worst case of the labelling
+    grid = np.zeros((11, 11), dtype=np.uint8)
+    grid[::2] = 5
+    grid[1::4, -1] = 5
+    grid[3::4, 0] = 5
+    grids.append(numpy_dsl.to_grid(grid))
+    return grids
+
+
+def largest_object(grid):
+    objs = dsl.gobjects(grid, True, False, True) or dsl.gobjects(grid, True, False, False)
+    return max(objs, key=lambda obj: (len(obj), sorted(obj)))
+
+
+# Each case is called with the DSL module, a grid and an object of the grid
+# (the grid being a NumPy array for the NumPy backend).
+CASES = {
+    "mostcolor": lambda m, g, o: m.mostcolor(g),
+    "mostcolor_object": lambda m, g, o: m.mostcolor(o),
+    "leastcolor_object": lambda m, g, o: m.leastcolor(o),
+    "height": lambda m, g, o: m.height(g),
+    "height_object": lambda m, g, o: m.height(o),
+    "width": lambda m, g, o: m.width(g),
+    "width_object": lambda m, g, o: m.width(o),
+    "shape": lambda m, g, o: m.shape(g),
+    "portrait": lambda m, g, o: m.portrait(g),
+    "square": lambda m, g, o: m.square(g),
+    "square_object": lambda m, g, o: m.square(o),
+    "colorcount": lambda m, g, o: [m.colorcount(g, c) for c in range(10)],
+    "colorcount_object": lambda m, g, o: m.colorcount(o, m.color(o)),
+    "palette": lambda m, g, o: m.palette(g),
+    "palette_object": lambda m, g, o: m.palette(o),
+    "numcolors": lambda m, g, o: m.numcolors(g),
+    "asindices": lambda m, g, o: m.asindices(g),
+    "ofcolor": lambda m, g, o: [m.ofcolor(g, c) for c in range(10)],
+    "crop": lambda m, g, o: m.crop(g, (1, 1), (3, 4)),
+    "gobjects": lambda m, g, o: [
+        m.gobjects(g, univalued, diagonal, without_bg)
+        for univalued in (True, False)
+        for diagonal in (True, False)
+        for without_bg in (True, False)
+    ],
+    "partition": lambda m, g, o: m.partition(g),
+    "fgpartition": lambda m, g, o: m.fgpartition(g),
+    "toobject": lambda m, g, o: m.toobject(m.shift(m.backdrop(o), (-1, 1)), g),
+    "asobject": lambda m, g, o: m.asobject(g),
+    "rot90": lambda m, g, o: m.rot90(g),
+    "rot180": lambda m, g, o: m.rot180(g),
+    "rot270": lambda m, g, o: m.rot270(g),
+    "hmirror": lambda m, g, o: m.hmirror(g),
+    "hmirror_object": lambda m, g, o: m.hmirror(o),
+    "vmirror": lambda m, g, o: m.vmirror(g),
+    "vmirror_object": lambda m, g, o: m.vmirror(o),
+    "dmirror": lambda m, g, o: m.dmirror(g),
+    "dmirror_object": lambda m, g, o: m.dmirror(o),
+    "cmirror": lambda m, g, o: m.cmirror(g),
+    "cmirror_object": lambda m, g, o: m.cmirror(o),
+    "fill": lambda m, g, o: m.fill(g, 5, m.shift(m.backdrop(o), (-1, -1))),
+    "paint": lambda m, g, o: m.paint(g, m.shift(m.recolor(7, o), (1, 2))),
+    "underfill": lambda m, g, o: m.underfill(g, 5, m.outbox(o)),
+    "underpaint": lambda m, g, o: m.underpaint(g, m.shift(m.recolor(7, o), (1, 2))),
+    "hupscale": lambda m, g, o: m.hupscale(g, 3),
+    "vupscale": lambda m, g, o: m.vupscale(g, 2),
+    "upscale": lambda m, g, o: m.upscale(g, 3),
+    "upscale_object": lambda m, g, o: m.upscale(o, 2),
+    "downscale": lambda m, g, o: [m.downscale(g, 1), m.downscale(g, 2)],
+    "hconcat": lambda m, g, o: m.hconcat(g, m.vmirror(g)),
+    "vconcat": lambda m, g, o: m.vconcat(g, m.hmirror(g)),
+    "subgrid": lambda m, g, o: m.subgrid(o, g),
+    "hsplit": lambda m, g, o: [m.hsplit(g, n) for n in (1, 2, 3) if n <= m.width(g)],
+    "vsplit": lambda m, g, o: [m.vsplit(g, n) for n in (1, 2, 3) if n <= m.height(g)],
+    "cellwise": lambda m, g, o: m.cellwise(g, m.fill(g, 0, m.backdrop(o)), 8),
+    "replace": lambda m, g, o: m.replace(g, 3, 4),
+    "switch": lambda m, g, o: m.switch(g, 0, 3),
+    "index": lambda m, g, o: [
+        m.index(g, (0, 0)),
+        m.index(g, (1, 2)),
+        m.index(g, (30, 0)),
+    ],
+    "canvas": lambda m, g, o: m.canvas(4, m.shape(g)),
+    "canvas_large_value": lambda m, g, o: [m.canvas(300, (1, 1)), m.canvas(-1, (2, 1))],
+    "cover": lambda m, g, o: m.cover(g, o),
+    "trim": lambda m, g, o: m.trim(g),
+    "move": lambda m, g, o: m.move(g, o, (1, -1)),
+    "tophalf": lambda m, g, o: m.tophalf(g),
+    "bottomhalf": lambda m, g, o: m.bottomhalf(g),
+    "lefthalf": lambda m, g, o: m.lefthalf(g),
+    "righthalf": lambda m, g, o: m.righthalf(g),
+    "occurrences": lambda m, g, o: [
+        m.occurrences(g, o),
+        m.occurrences(g, m.recolor(m.mostcolor(g), m.initset((0, 0)))),
+        m.occurrences(g, m.toobject(m.asindices(m.crop(g, (0, 0), (2, 2))), g)),
+    ],
+    "frontiers": lambda m, g, o: m.frontiers(g),
+    "compress": lambda m, g, o: m.compress(g),
+    "equality": lambda m, g, o: [
+        m.equality(g, g),
+        m.equality(g, m.rot180(m.rot180(g))),
+        m.equality(g, m.fill(g, 9, m.initset((0, 0)))),
+    ],
+    "bordering": lambda m, g, o: m.bordering(o, g),
+    # The container primitives of the tuple implementation, on grids
+    "other_grids": lambda m, g, o: m.other((m.vconcat(g, g), m.rot90(g)), m.rot90(g)),
+    "mostcommon_grids": lambda m, g, o: m.mostcommon((g, m.vconcat(g, g), g)),
+    "leastcommon_grids": lambda m, g, o: m.leastcommon((g, m.vconcat(g, g), g)),
+    "initset_grid": lambda m, g, o: m.initset(g),
+    "insert_grid": lambda m, g, o: m.insert(m.rot180(m.rot180(g)), m.initset(g)),
+    "apply_grids": lambda m, g, o: m.apply(m.rot90, m.initset(g)),
+    "dedupe_grids": lambda m, g, o: m.dedupe((g, m.rot180(m.rot180(g)), m.rot90(g))),
+    "contained_grid": lambda m, g, o: [
+        m.contained(g, (m.hconcat(g, g), m.rot180(m.rot180(g)))),
+        m.contained(g, m.initset(m.vconcat(g, g))),
+    ],
+    # A few compositions, as in the ARC-AGI solvers
+    "solver_largest_object": lambda m, g, o: (
+        m.subgrid(m.argmax(m.gobjects(g, True, True, True) or m.asobject(g), m.size), g)
+        if m.gobjects(g, True, True, True)
+        else g
+    ),
+    "solver_mirror": lambda m, g, o: m.vconcat(
+        m.hconcat(g, m.vmirror(g)), m.hconcat(m.hmirror(g), m.rot180(g))
+    ),
+    "solver_recolor_objects": lambda m, g, o: m.paint(
+        m.canvas(m.mostcolor(g), m.shape(g)),
+        m.merge(
+            m.apply(
+                m.lbind(m.recolor, 1),
+                m.sizefilter(m.gobjects(g, True, False, True), 1),
+            )
+        ),
+    ),
+}
+
+
+def to_tuples(value):
+    if isinstance(value, np.ndarray):
+        return numpy_dsl.to_grid(value)
+    if isinstance(value, (tuple, list, frozenset)):
+        return type(value)(to_tuples(element) for element in value)
+    return value
+
+
+class NumpyDSLTest(testing.TestCase):
+    @parameterized.named_parameters((name, name) for name in CASES)
+    def test_equivalence(self, name):
+        case = CASES[name]
+        for grid in make_grids():
+            obj = largest_object(grid)
+            expected = case(dsl, grid, obj)
+            result = case(numpy_dsl, numpy_dsl.to_array(grid), obj)
+            self.assertEqual(to_tuples(result), expected, msg=f"{name} on {grid}")
+
+    def test_leastcolor(self):
+        for grid in make_grids():
+            result = numpy_dsl.leastcolor(numpy_dsl.to_array(grid))
+            # The ties can be broken differently
+            self.assertEqual(
+                dsl.colorcount(grid, result),
+                dsl.colorcount(grid, dsl.leastcolor(grid)),
+            )
+
+    def test_all_grid_primitives_are_tested(self):
+        overridden = {
+            name
+            for name, function in dsl_module.NUMPY_DSL_FUNCTIONS.items()
+            if function is not dsl_module.DSL_FUNCTIONS[name]
+        }
+        tested = {name.split("_")[0] for name in CASES}
+        self.assertEqual(overridden - tested, set())
+
+    def test_conversions(self):
+        for grid in make_grids():
+            array = numpy_dsl.to_array(grid)
+            self.assertIsInstance(array, numpy_dsl.ArrayGrid)
+            self.assertEqual(array.dtype, np.int64)
+            self.assertEqual(numpy_dsl.to_grid(array), grid)
+        self.assertEqual(numpy_dsl.to_array(()).shape, (0, 0))
+        self.assertEqual(numpy_dsl.to_grid(numpy_dsl.to_array(())), ())
+
+    def test_get(self):
+        self.assertIs(dsl_module.get("rot90"), dsl.rot90)
+        self.assertIs(dsl_module.get("rot90", backend="numpy"), numpy_dsl.rot90)
+        self.assertIs(dsl_module.get("add", backend="numpy"), dsl.add)
+        with self.assertRaisesRegex(ValueError, "Unknown dsl backend"):
+            dsl_module.get("rot90", backend="torch")
+
+    def test_grids_are_compared_by_value(self):
+        grid = numpy_dsl.to_array(((1, 2), (3, 4)))
+        self.assertEqual(grid, numpy_dsl.rot180(numpy_dsl.rot180(grid)))
+        self.assertNotEqual(grid, numpy_dsl.rot90(grid))
+        self.assertNotEqual(grid, numpy_dsl.vconcat(grid, grid))
+        self.assertEqual(hash(grid), hash(numpy_dsl.to_grid(grid)))
+        self.assertFalse(numpy_dsl.to_array(()))
+        # The reductions are not grids
+        self.assertEqual(grid.max(), 4)
@@ -0,0 +1,381 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import asyncio
+import os
+import signal
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from synalinks.src.api_export import synalinks_export
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# The builtins available to the programs, the DSL doesn't need the others.
+_SAFE_BUILTINS = (
+    "abs",
+    "all",
+    "any",
+    "bool",
+    "dict",
+    "enumerate",
+    "filter",
+    "frozenset",
+    "int",
+    "isinstance",
+    "len",
+    "list",
+    "map",
+    "max",
+    "min",
+    "range",
+    "reversed",
+    "set",
+    "sorted",
+    "sum",
+    "tuple",
+    "zip",
+)
+
+# Added to the deadline of a batch, to account for the worker startup.
+_DEADLINE_MARGIN = 5.0
+
+# The interval of the timer once a program timed out, so a program catching
+# the timeout is interrupted again.
+_TIMER_INTERVAL = 0.05
+
+
+class ProgramTimeoutError(BaseException):
+    # Not an `Exception`, so the `except Exception` of a program doesn't
+    # catch it.
+    pass
+
+
+@synalinks_export("synalinks.datasets.arcagi.ProgramExecutor")
+class ProgramExecutor:
+    """Runs the ARC-AGI DSL programs in a pool of worker processes.
+
+    Useful to score the candidate programs generated by a language model: the
+    programs run in parallel on several cores, and a program stuck in an
+    infinite loop or using too much memory only fails itself.
+
+    A program is the source code of a `solve(I)` function, taking an input
+    grid and returning the output grid, using the DSL primitives
+    (e.g. `vmirror`, `gobjects`) and constants (e.g. `ZERO`, `T`), like the
+    solvers of [arc-dsl](https://github.com/michaelhodel/arc-dsl):
+
+    ```python
+    program = '''
+    def solve(I):
+        x1 = vmirror(I)
+        O = hconcat(I, x1)
+        return O
+    '''
+    ```
+
+    Each program runs on the inputs of all the examples, and its reward is the
+    fraction of the examples whose output grid exactly matches the expected one.
+
+    Example:
+
+    ```python
+    (x_train, y_train), _ = synalinks.datasets.arcagi.load_data()
+
+    with synalinks.datasets.arcagi.ProgramExecutor(timeout=1.0) as executor:
+        results = await executor.run(programs, examples=x_train[0].examples)
+
+    rewards = [result["reward"] for result in results]
+    best_program = programs[rewards.index(max(rewards))]
+    ```
+
+    The programs run with the DSL primitives and a few builtins only (no
+    import, no file access), and the time and memory limits are enforced in
+    the workers. This protects the caller from the faulty programs, but it is
+    not a security sandbox against malicious code.
+
+    Args:
+        max_workers (int): Optional. The number of worker processes.
+            Defaults to the number of CPUs.
+        timeout (float): The maximum time in seconds to run a program on one
+            example (Default to 1.0).
+        memory_limit (int): Optional. The maximum memory in MB that a worker can
+            allocate, in addition to its memory at startup (Default to 512).
+            Only supported on Linux.
+        batch_size (int): The number of programs sent to a worker at once
+            (Default to 8).
+        backend (str): The DSL backend, either `"tuple"` or `"numpy"`
+            (Default to `"tuple"`).
+        entry_point (str): The name of the function defined by the programs
+            (Default to `"solve"`).
+    """
+
+    def __init__(
+        self,
+        max_workers=None,
+        timeout=1.0,
+        memory_limit=512,
+        batch_size=8,
+        backend="tuple",
+        entry_point="solve",
+    ):
+        if backend not in ("tuple", "numpy"):
+            raise ValueError(
+                f"Unknown dsl backend: {backend}, expected one of ['tuple', 'numpy']"
+            )
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self.batch_size = batch_size
+        self.backend = backend
+        self.entry_point = entry_point
+        self._pool = None
+        self._semaphore = None
+        self._semaphore_loop = None
+
+    async def run(self, programs, examples):
+        """Runs the programs on the inputs of the examples.
+
+        Args:
+            programs (list): The source code of the programs.
+            examples (list): The `TaskExample`s (or their JSON), the programs
+                run on their inputs, and are rewarded on their outputs.
+
+        Returns:
+            (list): For each program, a dict with the output `grids` (one per
+                example, `None` if the program failed), the `reward` (the
+                fraction of exactly matching grids) and the `error` of the
+                first failing example (`None` if the program didn't fail).
+        """
+        examples = [_get_json(example) for example in examples]
+        inputs = [_to_grid(example["inputs"]) for example in examples]
+        outputs = [_to_grid(example["outputs"]) for example in examples]
+        batches = [
+            programs[i : i + self.batch_size]
+            for i in range(0, len(programs), self.batch_size)
+        ]
+        batch_results = await asyncio.gather(
+            *[self._run_batch(batch, inputs) for batch in batches]
+        )
+        results = []
+        for grids, error in (result for batch in batch_results for result in batch):
+            matches = [grid == output for grid, output in zip(grids, outputs)]
+            results.append(
+                {
+                    "grids": grids,
+                    "reward": sum(matches) / len(matches) if matches else 0.0,
+                    "error": error,
+                }
+            )
+        return results
+
+    async def _run_batch(self, programs, inputs):
+        # At most one batch per worker is submitted, so the batches don't wait
+        # in the queue of the pool, and their deadline only covers their run.
+        async with self._get_semaphore():
+            return await self._submit_batch(programs, inputs)
+
+    async def _submit_batch(self, programs, inputs):
+        # The programs interrupt themselves after `timeout`, the deadline only
+        # catches the workers that can't be interrupted (e.g. stuck in C code).
+        deadline = self.timeout * len(programs) * max(len(inputs), 1)
+        deadline += _DEADLINE_MARGIN
+        for _ in range(2):
+            pool = self._get_pool()
+            try:
+                future = pool.submit(
+                    _run_programs,
+                    programs,
+                    inputs,
+                    self.entry_point,
+                    self.backend,
+                    self.timeout,
+                )
+                return await asyncio.wait_for(asyncio.wrap_future(future), deadline)
+            except asyncio.TimeoutError:
+                self._terminate_pool(pool)
+                error = f"The programs didn't complete in {deadline} seconds"
+                return [([None] * len(inputs), error)] * len(programs)
+            except BrokenProcessPool:
+                # A worker died (e.g. killed by the system, or terminated after
+                # another batch exceeded its deadline), the batch is retried once.
+                self._terminate_pool(pool)
+        error = "The worker process running the programs died"
+        return [([None] * len(inputs), error)] * len(programs)
+
+    def _get_semaphore(self):
+        # A semaphore is bound to the event loop it is first used in.
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_workers)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    def _get_pool(self):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_initialize_worker,
+                initargs=(self.memory_limit,),
+            )
+        return self._pool
+
+    def _terminate_pool(self, pool):
+        if self._pool is pool:
+            self._pool = None
+        # `ProcessPoolExecutor` can't terminate its workers before Python 3.14.
+        for process in list((pool._processes or {}).values()):
+            process.terminate()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def close(self):
+        """Stops the worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def _get_json(example):
+    if hasattr(example, "get_json"):
+        return example.get_json()
+    return example
+
+
+def _to_grid(grid):
+    if grid is None:
+        return None
+    return tuple(tuple(row) for row in grid)
+
+
+def _initialize_worker(memory_limit):
+    # The workers don't handle the interruptions of the parent process.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if memory_limit and resource is not None and os.path.exists("/proc/self/statm"):
+        # The limit is on the address space, which already holds the memory
+        # inherited from the parent process.
+        with open("/proc/self/statm") as f:
+            size = int(f.read().split()[0]) * resource.getpagesize()
+        limit = size + memory_limit * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _get_globals(backend):
+    from synalinks.src.datasets.arcagi import dsl
+    from synalinks.src.datasets.arcagi.dsl import constants
+
+    builtins = __builtins__ if isinstance(__builtins__, dict) else vars(__builtins__)
+    return {
+        "__builtins__": {name: builtins[name] for name in _SAFE_BUILTINS},
+        **{
+            name: value
+            for name, value in vars(constants).items()
+            if not name.startswith("_")
+        },
+        **dsl.DSL_BACKENDS[backend],
+    }
+
+
+class _Timer:
+    """Interrupts the code running for more than `timeout` seconds.
+
+    Once expired, the timer fires again every `_TIMER_INTERVAL` seconds until
+    it is stopped, and a program catching the timeout and returning still
+    times out.
+    """
+
+    def __init__(self, timeout):
+        self.timeout = timeout
+        self.enabled = hasattr(signal, "setitimer")
+        self.running = False
+        self.expired = False
+        if self.enabled:
+            signal.signal(signal.SIGALRM, self._interrupt)
+
+    def _interrupt(self, signum, frame):
+        if self.running:
+            self.expired = True
+            raise ProgramTimeoutError()
+
+    def stop(self):
+        self.running = False
+        if self.enabled:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+    def __enter__(self):
+        self.expired = False
+        if self.enabled:
+            self.running = True
+            signal.setitimer(signal.ITIMER_REAL, self.timeout, _TIMER_INTERVAL)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        if self.expired and exc_type is None:
+            raise ProgramTimeoutError()
+
+
+def _run_programs(programs, inputs, entry_point, backend, timeout):
+    # Runs in the worker processes.
+    dsl_globals = _get_globals(backend)
+    if backend == "numpy":
+        from synalinks.src.datasets.arcagi.dsl import numpy_dsl
+
+        inputs = [numpy_dsl.to_array(grid) for grid in inputs]
+    timer = _Timer(timeout)
+    timeout_error = f"The program didn't complete in {timeout} seconds"
+    results = []
+    for program in programs:
+        grids = [None] * len(inputs)
+        error = None
+        try:
+            program_globals = dict(dsl_globals)
+            with timer:
+                exec(compile(program, "<program>", "exec"), program_globals)
+            function = program_globals.get(entry_point)
+            if not callable(function):
+                raise ValueError(f"The program doesn't define a `{entry_point}` function")
+        except ProgramTimeoutError:
+            # The timer can fire again before it is stopped by the `with`.
+            timer.stop()
+            results.append((grids, timeout_error))
+            continue
+        except Exception:
+            error = _format_error()
+            results.append((grids, error))
+            continue
+        for i, grid in enumerate(inputs):
+            try:
+                with timer:
+                    output = function(grid)
+                grids[i] = _to_output_grid(output)
+            except ProgramTimeoutError:
+                timer.stop()
+                error = error or timeout_error
+            except MemoryError:
+                error = error or "The program exceeded the memory limit"
+            except Exception:
+                error = error or _format_error()
+        results.append((grids, error))
+    return results
+
+
+def _to_output_grid(output):
+    if hasattr(output, "tolist"):
+        output = output.tolist()
+    grid = tuple(tuple(int(value) for value in row) for row in output)
+    if len(set(len(row) for row in grid)) > 1:
+        raise ValueError("The program returned rows of different lengths")
+    return grid
+
+
+def _format_error():
+    lines = traceback.format_exc().strip().splitlines()
+    return lines[-1] if lines else "Unknown error"
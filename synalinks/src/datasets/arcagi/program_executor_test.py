@@ -0,0 +1,182 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import sys
+import unittest
+from unittest.mock import patch
+
+from synalinks.src import testing
+from synalinks.src.datasets.arcagi import program_executor
+from synalinks.src.datasets.arcagi.arcagi import TaskExample
+from synalinks.src.datasets.arcagi.program_executor import ProgramExecutor
+
+MIRROR_PROGRAM = """
+def solve(I):
+    x1 = vmirror(I)
+    O = hconcat(I, x1)
+    return O
+"""
+
+IDENTITY_PROGRAM = """
+def solve(I):
+    return I
+"""
+
+CONTAINER_PROGRAM = """
+def solve(I):
+    x1 = vmirror(I)
+    x2 = other((I, x1), I)
+    x3 = mostcommon((I, x2, I))
+    x4 = first(apply(lbind(hconcat, x3), initset(x2)))
+    return x4
+"""
+
+EXAMPLES = [
+    TaskExample(inputs=[[1, 2]], outputs=[[1, 2, 2, 1]]),
+    TaskExample(inputs=[[3, 0], [0, 3]], outputs=[[3, 0, 0, 3], [0, 3, 3, 0]]),
+]
+
+
+class ProgramExecutorTest(testing.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.executor = ProgramExecutor(max_workers=2, timeout=0.5, batch_size=2)
+
+    def tearDown(self):
+        self.executor.close()
+        super().tearDown()
+
+    async def test_run(self):
+        results = await self.executor.run(
+            [MIRROR_PROGRAM, IDENTITY_PROGRAM, "def solve(I) return I"],
+            examples=EXAMPLES,
+        )
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0]["reward"], 1.0)
+        self.assertEqual(results[0]["grids"][0], ((1, 2, 2, 1),))
+        self.assertIsNone(results[0]["error"])
+        self.assertEqual(results[1]["reward"], 0.0)
+        self.assertEqual(results[1]["grids"][1], ((3, 0), (0, 3)))
+        self.assertIsNone(results[1]["error"])
+        self.assertEqual(results[2]["reward"], 0.0)
+        self.assertEqual(results[2]["grids"], [None, None])
+        self.assertIn("SyntaxError", results[2]["error"])
+
+    async def test_run_with_json_examples(self):
+        examples = [example.get_json() for example in EXAMPLES]
+        results = await self.executor.run([MIRROR_PROGRAM], examples=examples)
+        self.assertEqual(results[0]["reward"], 1.0)
+
+    async def test_partial_reward(self):
+        program = """
+def solve(I):
+    if height(I) > ONE:
+        return I
+    return hconcat(I, vmirror(I))
+"""
+        results = await self.executor.run([program], examples=EXAMPLES)
+        self.assertEqual(results[0]["reward"], 0.5)
+
+    async def test_errors(self):
+        programs = [
+            "def main(I):\n    return I\n",
+            "def solve(I):\n    return open('/etc/passwd').read()\n",
+            "import os\ndef solve(I):\n    return I\n",
+            "def solve(I):\n    return ((1, 2), (3,))\n",
+        ]
+        results = await self.executor.run(programs, examples=EXAMPLES)
+        self.assertIn("doesn't define a `solve` function", results[0]["error"])
+        self.assertIn("NameError", results[1]["error"])
+        self.assertIn("ImportError", results[2]["error"])
+        self.assertIn("rows of different lengths", results[3]["error"])
+        for result in results:
+            self.assertEqual(result["reward"], 0.0)
+
+    async def test_more_batches_than_workers(self):
+        # The deadline of a batch shouldn't include the time spent waiting for
+        # a worker, with a margin of 0.5 seconds the last batches would wait
+        # much longer than their deadline.
+        program = (
+            "def solve(I):\n"
+            "    x1 = sum(i for i in range(10 ** 6))\n"
+            "    return hconcat(I, vmirror(I))\n"
+        )
+        executor = ProgramExecutor(max_workers=1, timeout=0.5, batch_size=1)
+        try:
+            with patch.object(program_executor, "_DEADLINE_MARGIN", 0.5):
+                results = await executor.run([program] * 16, examples=EXAMPLES[:1])
+        finally:
+            executor.close()
+        for result in results:
+            self.assertIsNone(result["error"])
+            self.assertEqual(result["reward"], 1.0)
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "Needs the timers")
+    async def test_timeout(self):
+        program = "def solve(I):\n    while True:\n        pass\n"
+        results = await self.executor.run(
+            [program, MIRROR_PROGRAM], examples=EXAMPLES[:1]
+        )
+        self.assertIn("didn't complete", results[0]["error"])
+        self.assertIsNone(results[0]["grids"][0])
+        # The other programs of the batch still run
+        self.assertEqual(results[1]["reward"], 1.0)
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "Needs the timers")
+    async def test_caught_timeout(self):
+        programs = [
+            # Catching the timeout and returning
+            "def solve(I):\n"
+            "    try:\n"
+            "        while True:\n"
+            "            pass\n"
+            "    except:\n"
+            "        return I\n",
+            # Catching the timeout and running again
+            "def solve(I):\n"
+            "    for x1 in range(3):\n"
+            "        try:\n"
+            "            while True:\n"
+            "                pass\n"
+            "        except:\n"
+            "            pass\n"
+            "    while True:\n"
+            "        pass\n",
+            # Running when defined
+            "while True:\n    pass\n",
+            MIRROR_PROGRAM,
+        ]
+        results = await self.executor.run(programs, examples=EXAMPLES[:1])
+        for result in results[:3]:
+            # Interrupted by the timer, not by the deadline of the batch
+            self.assertIn("didn't complete in 0.5 seconds", result["error"])
+            self.assertEqual(result["grids"], [None])
+        self.assertEqual(results[3]["reward"], 1.0)
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "Needs the memory limit")
+    async def test_memory_limit(self):
+        executor = ProgramExecutor(max_workers=1, memory_limit=64)
+        program = "def solve(I):\n    x1 = [ZERO] * (10 ** 9)\n    return I\n"
+        try:
+            results = await executor.run([program, MIRROR_PROGRAM], examples=EXAMPLES)
+        finally:
+            executor.close()
+        self.assertIn("memory limit", results[0]["error"])
+        self.assertEqual(results[1]["reward"], 1.0)
+
+    async def test_numpy_backend(self):
+        executor = ProgramExecutor(max_workers=1, backend="numpy")
+        try:
+            results = await executor.run(
+                [MIRROR_PROGRAM, CONTAINER_PROGRAM], examples=EXAMPLES
+            )
+        finally:
+            executor.close()
+        self.assertEqual(results[0]["reward"], 1.0)
+        self.assertEqual(results[0]["grids"][0], ((1, 2, 2, 1),))
+        # The container primitives work on the array grids
+        self.assertIsNone(results[1]["error"])
+        self.assertEqual(results[1]["reward"], 1.0)
+
+    def test_unknown_backend(self):
+        with self.assertRaisesRegex(ValueError, "Unknown dsl backend"):
+            ProgramExecutor(backend="torch")
@@ -1,9 +1,20 @@
+import os
+import re
+
 import numpy as np
-from datasets import load_dataset
 
 from synalinks.src.api_export import synalinks_export
 from synalinks.src.backend import DataModel
 from synalinks.src.backend import Field
+from synalinks.src.backend import config
+from synalinks.src.saving import checkpoint_writer
+from synalinks.src.trainers.data_adapters.jsonl_data_adapter import JsonlDataAdapter
+from synalinks.src.utils import file_utils
+from synalinks.src.utils import json_codec
+
+_SPLITS = ("train", "test")
+
+_COMMIT_HASH = re.compile(r"^[0-9a-f]{40}$")
 
 
 class GSM8KInput(DataModel):
@@ -48,54 +59,144 @@ def get_output_data_model():
 
 
 @synalinks_export("synalinks.datasets.gsm8k.load_data")
-def load_data():
+def load_data(revision=None, cache_dir=None, lazy=False, batch_size=32, shuffle=False):
     """
     Load and format data from HuggingFace
 
+    The first load downloads the dataset and stores the formatted samples in
+    a JSON Lines file per split (`<cache_dir>/datasets/gsm8k/<commit hash>/`),
+    so the next loads of the same commit only read these files.
+
     Example:
 
     ```python
     (x_train, y_train), (x_test, y_test) = synalinks.datasets.gsm8k.load_data()
     ```
 
+    With `lazy=True`, the data models are only created for the samples of the
+    batches being used, the splits are returned as data adapters to provide
+    as `x` to `fit()`, `evaluate()` or `predict()`:
+
+    ```python
+    train_data, test_data = synalinks.datasets.gsm8k.load_data(
+        lazy=True,
+        batch_size=32,
+        shuffle=True,
+    )
+    history = await program.fit(x=train_data, epochs=10)
+    ```
+
+    A branch or a tag (e.g. `"main"`) is resolved to the commit it points to
+    on HuggingFace, so the dataset is downloaded again when the branch
+    changes. Offline, the commit last resolved is used, and a commit hash
+    doesn't need to be resolved (use it for reproducible experiments).
+
+    Args:
+        revision (str): Optional. The revision of the dataset on HuggingFace
+            (a branch, tag or commit hash). Defaults to `"main"`.
+        cache_dir (str): Optional. The directory of the cache files.
+            Defaults to `~/.synalinks/` (or `$SYNALINKS_HOME`).
+        lazy (bool): Whether to return data adapters creating the data models
+            batch by batch, instead of arrays of data models (Default to False).
+        batch_size (int): The number of samples per batch of the data
+            adapters. Only used if `lazy` is True (Default to 32).
+        shuffle (bool | str): Whether the data adapters shuffle the samples at
+            each epoch. Only used if `lazy` is True (Default to False).
+
     Returns:
         (tuple): The train and test data ready for training
     """
-    dataset = load_dataset("gsm8k", "main")
-
-    x_train = []
-    y_train = []
-    x_test = []
-    y_test = []
-
-    for datapoint in dataset["train"]:
-        question = datapoint["question"]
-        thinking = datapoint["answer"].split("####")[0].strip()
-        answer = datapoint["answer"].split("####")[-1].strip()
-        x_train.append(GSM8KInput(question=question))
-        y_train.append(
-            GSM8KOutput(
-                thinking=thinking,
-                answer=float(answer.replace(",", "")),
+    revision = revision or "main"
+    dataset_path = os.path.join(cache_dir or config.synalinks_home(), "datasets", "gsm8k")
+    commit_hash = _get_commit_hash(revision, dataset_path)
+    cache_path = os.path.join(dataset_path, commit_hash)
+    filepaths = [os.path.join(cache_path, f"{split}.jsonl") for split in _SPLITS]
+    if not all(file_utils.exists(filepath) for filepath in filepaths):
+        dataset = _load_dataset(commit_hash)
+        for split, filepath in zip(_SPLITS, filepaths):
+            checkpoint_writer.write_file(
+                filepath,
+                "".join(
+                    json_codec.dumps(format_sample(datapoint)) + "\n"
+                    for datapoint in dataset[split]
+                ),
             )
-        )
 
-    for datapoint in dataset["test"]:
-        question = datapoint["question"]
-        thinking = datapoint["answer"].split("####")[0].strip()
-        answer = datapoint["answer"].split("####")[-1].strip()
-        x_test.append(GSM8KInput(question=question))
-        y_test.append(
-            GSM8KOutput(
-                thinking=thinking,
-                answer=float(answer.replace(",", "")),
+    if lazy:
+        return tuple(
+            JsonlDataAdapter(
+                filepath,
+                input_data_model=GSM8KInput,
+                output_data_model=GSM8KOutput,
+                batch_size=batch_size,
+                shuffle=shuffle,
             )
+            for filepath in filepaths
         )
 
-    x_train = np.array(x_train, dtype="object")
-    y_train = np.array(y_train, dtype="object")
+    data = []
+    for filepath in filepaths:
+        x = []
+        y = []
+        # Split on "\n" only, like `JsonlDataAdapter`, since `str.splitlines()`
+        # also splits on the unicode line separators left unescaped in strings.
+        for line in checkpoint_writer.read_file(filepath).split("\n"):
+            if not line:
+                continue
+            sample = json_codec.loads(line)
+            x.append(GSM8KInput(question=sample["question"]))
+            y.append(GSM8KOutput(thinking=sample["thinking"], answer=sample["answer"]))
+        data.append((np.array(x, dtype="object"), np.array(y, dtype="object")))
+
+    return tuple(data)
 
-    x_test = np.array(x_test, dtype="object")
-    y_test = np.array(y_test, dtype="object")
 
-    return (x_train, y_train), (x_test, y_test)
+def format_sample(datapoint):
+    """Splits the answer of a GSM8K datapoint in the thinking and the answer.
+
+    Args:
+        datapoint (dict): The datapoint with the `question` and `answer` fields.
+
+    Returns:
+        (dict): The `question`, the `thinking` and the numerical `answer`.
+    """
+    parts = datapoint["answer"].split("####")
+    return {
+        "question": datapoint["question"],
+        "thinking": parts[0].strip(),
+        "answer": float(parts[-1].strip().replace(",", "")),
+    }
+
+
+def _get_commit_hash(revision, dataset_path):
+    # The commit last resolved for each branch or tag is kept in `refs/`, to
+    # find the cache when HuggingFace can't be reached.
+    if _COMMIT_HASH.match(revision):
+        return revision
+    ref_path = os.path.join(dataset_path, "refs", revision.replace("/", "_"))
+    try:
+        commit_hash = _resolve_revision(revision)
+    except Exception:
+        if not file_utils.exists(ref_path):
+            raise
+        return checkpoint_writer.read_file(ref_path).strip()
+    if (
+        not file_utils.exists(ref_path)
+        or checkpoint_writer.read_file(ref_path).strip() != commit_hash
+    ):
+        checkpoint_writer.write_file(ref_path, commit_hash)
+    return commit_hash
+
+
+def _resolve_revision(revision):
+    from huggingface_hub import HfApi
+
+    return HfApi().dataset_info("gsm8k", revision=revision).sha
+
+
+def _load_dataset(revision):
+    # Imported here, since importing `datasets` takes about a second and it is
+    # only needed before the dataset is cached.
+    from datasets import load_dataset
+
+    return load_dataset("gsm8k", "main", revision=revision)
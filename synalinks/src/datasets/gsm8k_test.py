@@ -0,0 +1,142 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import os
+from unittest.mock import patch
+
+from synalinks.src import testing
+from synalinks.src.datasets import gsm8k
+from synalinks.src.trainers.data_adapters.jsonl_data_adapter import JsonlDataAdapter
+
+DATASET = {
+    "train": [
+        {"question": "What is 1 + 1?", "answer": "1 + 1 = 2\n#### 2"},
+        {"question": "What is 600 * 2?", "answer": "600 * 2 = 1200\n#### 1,200"},
+        {"question": "What is 3 / 2?", "answer": "3 / 2 = 1.5\n#### 1.5"},
+    ],
+    "test": [
+        {"question": "What is 2 + 2?", "answer": "2 + 2 = 4\n#### 4"},
+    ],
+}
+
+COMMIT_HASHES = {
+    "main": "a" * 40,
+    "refs/convert/parquet": "b" * 40,
+}
+
+
+class GSM8KTest(testing.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.cache_dir = self.get_temp_dir()
+        patcher = patch(
+            "synalinks.src.datasets.gsm8k._resolve_revision",
+            side_effect=COMMIT_HASHES.__getitem__,
+        )
+        self.mock_resolve_revision = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_format_sample(self):
+        self.assertEqual(
+            gsm8k.format_sample(DATASET["train"][1]),
+            {
+                "question": "What is 600 * 2?",
+                "thinking": "600 * 2 = 1200",
+                "answer": 1200.0,
+            },
+        )
+
+    @patch("synalinks.src.datasets.gsm8k._load_dataset", return_value=DATASET)
+    def test_load_data(self, mock_load_dataset):
+        (x_train, y_train), (x_test, y_test) = gsm8k.load_data(cache_dir=self.cache_dir)
+        mock_load_dataset.assert_called_once_with(COMMIT_HASHES["main"])
+        self.assertEqual(len(x_train), 3)
+        self.assertEqual(len(y_train), 3)
+        self.assertEqual(len(x_test), 1)
+        self.assertEqual(len(y_test), 1)
+        self.assertIsInstance(x_train[0], gsm8k.GSM8KInput)
+        self.assertIsInstance(y_train[0], gsm8k.GSM8KOutput)
+        self.assertEqual(x_test[0].question, "What is 2 + 2?")
+        self.assertEqual(y_train[1].thinking, "600 * 2 = 1200")
+        self.assertEqual(y_train[1].answer, 1200.0)
+        self.assertTrue(
+            os.path.exists(
+                os.path.join(
+                    self.cache_dir,
+                    "datasets",
+                    "gsm8k",
+                    COMMIT_HASHES["main"],
+                    "train.jsonl",
+                )
+            )
+        )
+
+        # The next loads read the cache files
+        (x_train_cached, y_train_cached), (x_test_cached, y_test_cached) = (
+            gsm8k.load_data(cache_dir=self.cache_dir)
+        )
+        mock_load_dataset.assert_called_once()
+        self.assertEqual(
+            [x.get_json() for x in x_train_cached], [x.get_json() for x in x_train]
+        )
+        self.assertEqual(
+            [y.get_json() for y in y_train_cached], [y.get_json() for y in y_train]
+        )
+        self.assertEqual(x_test_cached[0].get_json(), x_test[0].get_json())
+        self.assertEqual(y_test_cached[0].get_json(), y_test[0].get_json())
+
+        # Each revision has its own cache
+        gsm8k.load_data(revision="refs/convert/parquet", cache_dir=self.cache_dir)
+        mock_load_dataset.assert_called_with(COMMIT_HASHES["refs/convert/parquet"])
+
+    @patch("synalinks.src.datasets.gsm8k._load_dataset", return_value=DATASET)
+    def test_load_data_when_the_branch_changes(self, mock_load_dataset):
+        gsm8k.load_data(cache_dir=self.cache_dir)
+        self.mock_resolve_revision.side_effect = None
+        self.mock_resolve_revision.return_value = "c" * 40
+        gsm8k.load_data(cache_dir=self.cache_dir)
+        self.assertEqual(mock_load_dataset.call_count, 2)
+        mock_load_dataset.assert_called_with("c" * 40)
+
+    @patch("synalinks.src.datasets.gsm8k._load_dataset", return_value=DATASET)
+    def test_load_data_offline(self, mock_load_dataset):
+        gsm8k.load_data(cache_dir=self.cache_dir)
+        self.mock_resolve_revision.side_effect = ConnectionError()
+        # The commit last resolved is used
+        (x_train, _), _ = gsm8k.load_data(cache_dir=self.cache_dir)
+        mock_load_dataset.assert_called_once()
+        self.assertEqual(len(x_train), 3)
+        # A commit hash isn't resolved
+        gsm8k.load_data(revision=COMMIT_HASHES["main"], cache_dir=self.cache_dir)
+        mock_load_dataset.assert_called_once()
+        # Nothing was resolved for this branch
+        with self.assertRaises(ConnectionError):
+            gsm8k.load_data(revision="refs/convert/parquet", cache_dir=self.cache_dir)
+
+    def test_load_data_with_line_separators(self):
+        dataset = {
+            "train": [
+                {"question": "What is\u2028 1 + 1?", "answer": "1\x85 + 1 = 2\n#### 2"}
+            ],
+            "test": DATASET["test"],
+        }
+        with patch("synalinks.src.datasets.gsm8k._load_dataset", return_value=dataset):
+            gsm8k.load_data(cache_dir=self.cache_dir)
+        (x_train, y_train), _ = gsm8k.load_data(cache_dir=self.cache_dir)
+        self.assertEqual(len(x_train), 1)
+        self.assertEqual(x_train[0].question, "What is\u2028 1 + 1?")
+        self.assertEqual(y_train[0].thinking, "1\x85 + 1 = 2")
+
+    @patch("synalinks.src.datasets.gsm8k._load_dataset", return_value=DATASET)
+    def test_load_data_lazy(self, mock_load_dataset):
+        train_data, test_data = gsm8k.load_data(
+            cache_dir=self.cache_dir, lazy=True, batch_size=2
+        )
+        self.assertIsInstance(train_data, JsonlDataAdapter)
+        self.assertEqual(train_data.num_samples, 3)
+        self.assertEqual(train_data.num_batches, 2)
+        self.assertEqual(test_data.num_samples, 1)
+        batches = list(train_data.get_numpy_iterator())
+        x, y = batches[0]
+        self.assertEqual(len(x), 2)
+        self.assertIsInstance(x[0], gsm8k.GSM8KInput)
+        self.assertEqual(y[1].answer, 1200.0)
@@ -1,13 +1,14 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
-import json
 import warnings
 
 import litellm
 
 from synalinks.src.api_export import synalinks_export
 from synalinks.src.backend import ChatRole
+from synalinks.src.backend import validate_json
 from synalinks.src.saving.synalinks_saveable import SynalinksSaveable
+from synalinks.src.utils import json_codec
 
 
 @synalinks_export(["synalinks.LanguageModel", "synalinks.language_models.LanguageModel"])
@@ -237,7 +238,9 @@ class LanguageModel(SynalinksSaveable):
                 else:
                     response_str = response["choices"][0]["message"]["content"].strip()
                 if schema:
-                    json_instance = json.loads(response_str)
+                    json_instance = json_codec.loads(response_str)
+                    # Raises on schema violations, triggering a retry
+                    json_instance = validate_json(json_instance, schema)
                 else:
                     json_instance = {"role": ChatRole.ASSISTANT, "content": response_str}
                 return json_instance
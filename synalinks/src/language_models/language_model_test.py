@@ -74,6 +74,28 @@ class LanguageModelTest(testing.TestCase):
         self.assertEqual(result, AnswerWithRationale(**result).get_json())
         self.assertEqual(result, expected.get_json())
 
+    @patch("litellm.completion")
+    async def test_retry_on_schema_violation(self, mock_completion):
+        lm = LanguageModel(model="ollama/deepseek-r1")
+
+        messages = ChatMessages(
+            messages=[ChatMessage(role=ChatRole.USER, content="What is 2 + 2?")]
+        )
+
+        mock_completion.side_effect = [
+            {"choices": [{"message": {"content": '{"answer": "four"}'}}]},
+            {"choices": [{"message": {"content": '{"answer": 4.0}'}}]},
+        ]
+
+        class Answer(DataModel):
+            answer: int
+
+        with self.assertWarns(UserWarning):
+            result = await lm(messages, schema=Answer.get_schema())
+        self.assertEqual(mock_completion.call_count, 2)
+        self.assertEqual(result, {"answer": 4})
+        self.assertIsInstance(result["answer"], int)
+
     @patch("litellm.completion")
     async def test_call_api_streaming_mode(self, mock_completion):
         lm = LanguageModel(model="ollama/deepseek-r1")
@@ -2,15 +2,18 @@
 # Original authors: François Chollet et al. (Keras Team)
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import itertools
 from typing import List
 from typing import Optional
 
+import numpy as np
+
 from synalinks.src import backend
 from synalinks.src import ops
 from synalinks.src import tree
 from synalinks.src.api_export import synalinks_export
 from synalinks.src.backend import DataModel
-from synalinks.src.backend.common import numpy as np
+from synalinks.src.backend.common import numpy
 from synalinks.src.metrics.metric import Metric
 from synalinks.src.utils import nlp_utils
 
@@ -116,84 +119,101 @@ class FBetaScore(Metric):
         y_true = tree.flatten(tree.map_structure(lambda x: str(x), y_true.get_json()))
         y_pred = tree.flatten(tree.map_structure(lambda x: str(x), y_pred.get_json()))
 
-        true_positives = []
-        false_positives = []
-        false_negatives = []
-        intermediate_weights = []
-        # For each field of y_true and y_pred
-        for yt, yp in zip(y_true, y_pred):
-            y_true_tokens = nlp_utils.normalize_and_tokenize(yt)
-            y_pred_tokens = nlp_utils.normalize_and_tokenize(yp)
-            common_tokens = set(y_true_tokens) & set(y_pred_tokens)
-            true_positives.append(len(common_tokens))
-            false_positives.append(len(y_pred_tokens) - len(common_tokens))
-            false_negatives.append(len(y_true_tokens) - len(common_tokens))
-            intermediate_weights.append(len(y_true_tokens))
-
-        true_positives = np.convert_to_numpy(true_positives)
-        false_positives = np.convert_to_numpy(false_positives)
-        false_negatives = np.convert_to_numpy(false_negatives)
-        intermediate_weights = np.convert_to_numpy(intermediate_weights)
-
-        current_true_positives = self.state.get("true_positives")
-        if current_true_positives:
-            true_positives = np.add(current_true_positives, true_positives)
-
-        current_false_positives = self.state.get("false_positives")
-        if current_false_positives:
-            false_positives = np.add(current_false_positives, false_positives)
-
-        current_false_negatives = self.state.get("false_negatives")
-        if current_false_negatives:
-            false_negatives = np.add(current_false_negatives, false_negatives)
-
-        current_intermediate_weights = self.state.get("intermediate_weights")
-        if current_intermediate_weights:
-            intermediate_weights = np.add(
-                current_intermediate_weights, intermediate_weights
-            )
+        # For each field of y_true and y_pred. The token IDs are only compared
+        # within this update, so the vocabulary doesn't outlive it.
+        num_fields = min(len(y_true), len(y_pred))
+        vocabulary = {}
+        y_true_ids = [_get_token_ids(yt, vocabulary) for yt in y_true[:num_fields]]
+        y_pred_ids = [_get_token_ids(yp, vocabulary) for yp in y_pred[:num_fields]]
+        y_true_lengths = np.array([len(ids) for ids in y_true_ids], dtype="int64")
+        y_pred_lengths = np.array([len(ids) for ids in y_pred_ids], dtype="int64")
+
+        # Make the token IDs unique across fields, then count the common ones
+        vocabulary_size = max(len(vocabulary), 1)
+        fields = np.arange(num_fields, dtype="int64") * vocabulary_size
+        y_true_keys = np.unique(
+            np.repeat(fields, y_true_lengths)
+            + np.fromiter(itertools.chain.from_iterable(y_true_ids), dtype="int64")
+        )
+        y_pred_keys = np.unique(
+            np.repeat(fields, y_pred_lengths)
+            + np.fromiter(itertools.chain.from_iterable(y_pred_ids), dtype="int64")
+        )
+        common_keys = np.intersect1d(y_true_keys, y_pred_keys, assume_unique=True)
+        true_positives = np.bincount(common_keys // vocabulary_size, minlength=num_fields)
+
+        self._accumulate(
+            true_positives=true_positives,
+            false_positives=y_pred_lengths - true_positives,
+            false_negatives=y_true_lengths - true_positives,
+            intermediate_weights=y_true_lengths,
+        )
+
+    def _get_counts(self):
+        """Returns the accumulated counts as a NumPy array (or `None`).
 
+        The missing or empty counts are considered as zeros.
+        """
+        counts = [
+            self.state.get("true_positives"),
+            self.state.get("false_positives"),
+            self.state.get("false_negatives"),
+            self.state.get("intermediate_weights"),
+        ]
+        num_fields = max(len(c) if c else 0 for c in counts)
+        if not num_fields:
+            return None
+        return np.array(
+            [c if c else [0.0] * num_fields for c in counts],
+            dtype=backend.floatx(),
+        )
+
+    def _accumulate(
+        self,
+        true_positives,
+        false_positives,
+        false_negatives,
+        intermediate_weights,
+    ):
+        counts = np.array(
+            [true_positives, false_positives, false_negatives, intermediate_weights],
+            dtype=backend.floatx(),
+        )
+        current_counts = self._get_counts()
+        if current_counts is not None:
+            counts = np.add(current_counts, counts)
+        # A single conversion of the 4 counts to the JSON lists of the state
+        true_positives, false_positives, false_negatives, intermediate_weights = (
+            counts.tolist()
+        )
         self.state.update(
             {
-                "true_positives": true_positives.tolist(),
-                "false_positives": false_positives.tolist(),
-                "false_negatives": false_negatives.tolist(),
-                "intermediate_weights": intermediate_weights.tolist(),
+                "true_positives": true_positives,
+                "false_positives": false_positives,
+                "false_negatives": false_negatives,
+                "intermediate_weights": intermediate_weights,
             }
         )
 
     def result(self):
-        if (
-            self.state.get("true_positives") is None
-            and self.state.get("false_positives") is None
-            and self.state.get("false_negatives") is None
-        ):
+        counts = self._get_counts()
+        if counts is None:
             return 0.0
+        true_positives, false_positives, false_negatives, intermediate_weights = counts
         precision = np.divide(
-            self.state.get("true_positives"),
-            np.add(
-                self.state.get("true_positives"),
-                self.state.get("false_positives"),
-            )
-            + backend.epsilon(),
+            true_positives,
+            true_positives + false_positives + backend.epsilon(),
         )
         recall = np.divide(
-            self.state.get("true_positives"),
-            np.add(
-                self.state.get("true_positives"),
-                self.state.get("false_negatives"),
-            )
-            + backend.epsilon(),
+            true_positives,
+            true_positives + false_negatives + backend.epsilon(),
         )
-        precision = np.convert_to_tensor(precision)
-        recall = np.convert_to_tensor(recall)
 
         mul_value = precision * recall
         add_value = ((self.beta**2) * precision) + recall
         mean = np.divide(mul_value, add_value + backend.epsilon())
         f1_score = mean * (1 + (self.beta**2))
         if self.average == "weighted":
-            intermediate_weights = self.state.get("intermediate_weights")
             weights = np.divide(
                 intermediate_weights,
                 np.sum(intermediate_weights) + backend.epsilon(),
@@ -203,10 +223,9 @@ class FBetaScore(Metric):
         elif self.average is not None:  # [micro, macro]
             f1_score = np.mean(f1_score, self.axis)
 
-        try:
-            return float(f1_score)
-        except Exception:
-            return list(f1_score)
+        if np.size(f1_score) == 1:
+            return float(np.reshape(f1_score, ()))
+        return f1_score.tolist()
 
     def get_config(self):
         """Return the serializable config of the metric.
@@ -394,39 +413,14 @@ class BinaryFBetaScore(FBetaScore):
         y_pred = tree.flatten(
             tree.map_structure(lambda x: convert_to_binary(x), y_pred.get_json())
         )
-        y_true = np.convert_to_tensor(y_true)
-        y_pred = np.convert_to_tensor(y_pred)
-
-        true_positives = y_pred * y_true
-        false_positives = y_pred * (1 - y_true)
-        false_negatives = (1 - y_pred) * y_true
-        intermediate_weights = y_true
-
-        current_true_positives = self.state.get("true_positives")
-        if current_true_positives:
-            true_positives = np.add(current_true_positives, true_positives)
-
-        current_false_positives = self.state.get("false_positives")
-        if current_false_positives:
-            false_positives = np.add(current_false_positives, false_positives)
-
-        current_false_negatives = self.state.get("false_negatives")
-        if current_false_negatives:
-            false_negatives = np.add(current_false_negatives, false_negatives)
-
-        current_intermediate_weights = self.state.get("intermediate_weights")
-        if current_intermediate_weights:
-            intermediate_weights = np.add(
-                current_intermediate_weights, intermediate_weights
-            )
-
-        self.state.update(
-            {
-                "true_positives": true_positives.tolist(),
-                "false_positives": false_positives.tolist(),
-                "false_negatives": false_negatives.tolist(),
-                "intermediate_weights": intermediate_weights.tolist(),
-            }
+        y_true = numpy.convert_to_tensor(y_true)
+        y_pred = numpy.convert_to_tensor(y_pred)
+
+        self._accumulate(
+            true_positives=y_pred * y_true,
+            false_positives=y_pred * (1 - y_true),
+            false_negatives=(1 - y_pred) * y_true,
+            intermediate_weights=y_true,
         )
 
     def get_config(self):
@@ -513,3 +507,8 @@ class BinaryF1Score(BinaryFBetaScore):
         base_config = super().get_config()
         del base_config["beta"]
         return base_config
+
+
+def _get_token_ids(text, vocabulary):
+    tokens = nlp_utils.normalize_and_tokenize(text)
+    return [vocabulary.setdefault(token, len(vocabulary)) for token in tokens]
@@ -34,6 +34,86 @@ class FBetaScoreTest(testing.TestCase):
         score = await metric(y_true, y_pred)
         self.assertAlmostEqual(score, 0.0, delta=3 * backend.epsilon())
 
+    async def test_multiple_fields_with_repeated_tokens(self):
+        class Answer(DataModel):
+            thinking: str
+            answer: str
+
+        y_true = Answer(thinking="capital capital France", answer="Paris")
+        y_pred = Answer(thinking="capital capital capital Paris", answer="Paris")
+
+        metric = FBetaScore()
+        await metric(y_true, y_pred)
+        # The fields are sorted, common tokens: {"paris"} and {"capital"}
+        self.assertEqual(metric.state.get("true_positives"), [1.0, 1.0])
+        self.assertEqual(metric.state.get("false_positives"), [0.0, 3.0])
+        self.assertEqual(metric.state.get("false_negatives"), [0.0, 2.0])
+        self.assertEqual(metric.state.get("intermediate_weights"), [1.0, 3.0])
+
+        await metric(y_true, y_pred)
+        self.assertEqual(metric.state.get("true_positives"), [2.0, 2.0])
+
+        metric.reset_state()
+        self.assertEqual(metric.result(), 0.0)
+        await metric(y_true, y_pred)
+        self.assertEqual(metric.state.get("true_positives"), [1.0, 1.0])
+
+    async def test_state_assigned_between_updates(self):
+        class Answer(DataModel):
+            answer: str
+
+        y_true = Answer(answer="Paris is the capital of France.")
+        y_pred = Answer(answer="Paris is the capital of France.")
+
+        metric = FBetaScore()
+        await metric(y_true, y_pred)
+        metric.state.assign(
+            {
+                "true_positives": [0.0],
+                "false_positives": [0.0],
+                "false_negatives": [10.0],
+                "intermediate_weights": [10.0],
+            }
+        )
+        await metric(y_true, y_pred)
+        self.assertEqual(metric.state.get("true_positives"), [3.0])
+        self.assertEqual(metric.state.get("false_negatives"), [10.0])
+
+    async def test_state_modified_in_place(self):
+        class Answer(DataModel):
+            answer: str
+
+        y_true = Answer(answer="Paris is the capital of France.")
+        y_pred = Answer(answer="Paris is the capital of France.")
+
+        metric = FBetaScore()
+        await metric(y_true, y_pred)
+        metric.state.get("true_positives")[0] = 0.0
+        self.assertAlmostEqual(metric.result(), 0.0, places=5)
+        await metric(y_true, y_pred)
+        self.assertEqual(metric.state.get("true_positives"), [3.0])
+
+    async def test_empty_state_lists(self):
+        class Answer(DataModel):
+            answer: str
+
+        y_true = Answer(answer="Paris is the capital of France.")
+        y_pred = Answer(answer="Paris is the capital of France.")
+
+        metric = FBetaScore()
+        metric.state.assign(
+            {
+                "true_positives": [],
+                "false_positives": [],
+                "false_negatives": [],
+                "intermediate_weights": [],
+            }
+        )
+        self.assertEqual(metric.result(), 0.0)
+        await metric(y_true, y_pred)
+        self.assertEqual(metric.state.get("true_positives"), [3.0])
+        self.assertAlmostEqual(metric.result(), 1.0, places=5)
+
 
 class F1ScoreTest(testing.TestCase):
     async def test_same_field(self):
@@ -1,10 +1,12 @@
 from synalinks.src.api_export import synalinks_export
+from synalinks.src.optimizers.few_shot_search import FewShotSearch
 from synalinks.src.optimizers.optimizer import Optimizer
 from synalinks.src.optimizers.random_few_shot import RandomFewShot
 from synalinks.src.saving import serialization_lib
 
 ALL_OBJECTS = {
     Optimizer,
+    FewShotSearch,
     RandomFewShot,
 }
 
@@ -0,0 +1,255 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import asyncio
+import warnings
+
+import numpy as np
+
+from synalinks.src.api_export import synalinks_export
+from synalinks.src.optimizers.random_few_shot import RandomFewShot
+from synalinks.src.saving import serialization_lib
+from synalinks.src.trainers.data_adapters import array_data_adapter
+
+
+@synalinks_export("synalinks.optimizers.FewShotSearch")
+class FewShotSearch(RandomFewShot):
+    """Search the best examples to populate the LM's prompt by evaluating
+        candidate example sets on held-out data.
+
+    At each step, `num_candidates` example sets are sampled among the best
+    predictions, the current examples being always kept as a candidate.
+    Each candidate is scored with `test_on_batch` on a minibatch sampled from the
+    `validation_data` provided to `program.fit()`. The candidates are evaluated
+    concurrently on copies of the program, at most `max_concurrency` at a time.
+
+    The minibatch is evaluated in two halves: the candidates whose reward on the
+    first half is lower than the best one by more than `pruning_margin` are
+    discarded before evaluating the second half. The candidate with the best
+    reward on the whole minibatch is kept.
+
+    If no validation data is provided to `program.fit()`, or if it is not a tuple
+    of arrays (e.g. a generator or a data adapter), the examples are randomly
+    selected like with `RandomFewShot`.
+
+    Example:
+
+    ```python
+    import synalinks
+    import asyncio
+
+    async def main():
+        # ... your program definition
+
+        program.compile(
+            reward=synalinks.rewards.ExactMatch(),
+            optimizer=synalinks.optimizers.FewShotSearch(
+                k=3, # The number of examples to provide to the prompt
+                k_best=10, # The number of best examples to select from
+                num_candidates=4, # The number of example sets to evaluate
+                max_concurrency=2, # The number of concurrent evaluations
+            ),
+        )
+
+        history = await program.fit(
+            x=x_train,
+            y=y_train,
+            validation_data=(x_test, y_test),
+        )
+    ```
+
+    Args:
+        k (int): The number of examples to select (default 3) among the best predictions.
+        k_best (int): The max number of best predictions to select from (default 10).
+            Only these predictions are kept between the training steps.
+        num_candidates (int): The number of example sets sampled at each step
+            (default 4).
+        validation_batch_size (int): The number of held-out samples used to score
+            the candidates (default 8).
+        max_concurrency (int): The maximum number of candidates evaluated
+            concurrently (default 2). Each concurrent evaluation uses its own
+            copy of the program.
+        pruning_margin (float): The reward margin, relative to the best candidate,
+            below which a candidate is discarded after the first half of the
+            minibatch (default 0.2).
+    """
+
+    def __init__(
+        self,
+        k=3,
+        k_best=10,
+        num_candidates=4,
+        validation_batch_size=8,
+        max_concurrency=2,
+        pruning_margin=0.2,
+        name=None,
+        description=None,
+    ):
+        super().__init__(
+            k=k,
+            k_best=k_best,
+            name=name,
+            description=description,
+        )
+        if max_concurrency < 1:
+            raise ValueError(
+                "`max_concurrency` should be a strictly positive integer, "
+                f"received max_concurrency={max_concurrency}"
+            )
+        self.num_candidates = num_candidates
+        self.validation_batch_size = validation_batch_size
+        self.max_concurrency = max_concurrency
+        self.pruning_margin = pruning_margin
+        self._program_copies = None
+
+    def set_program(self, program, validation_data=None):
+        if validation_data is not None and not _is_array_data(validation_data):
+            # The minibatches are sampled by index, which generators and
+            # data adapters don't support.
+            warnings.warn(
+                "`FewShotSearch` needs the `validation_data` to be an `(x, y)` "
+                "tuple of arrays to evaluate the candidate examples, received "
+                f"validation_data of type {type(validation_data[0])}, falling back "
+                "to random selection.",
+                stacklevel=2,
+            )
+            validation_data = None
+        elif validation_data is None:
+            warnings.warn(
+                "`FewShotSearch` needs `validation_data` to evaluate "
+                "the candidate examples, falling back to random selection.",
+                stacklevel=2,
+            )
+        else:
+            validation_data = tuple(
+                array_data_adapter.convert_to_object_array(data)
+                for data in validation_data
+            )
+        super().set_program(program, validation_data=validation_data)
+        self._program_copies = None
+
+    async def optimize(self, trainable_variable, reward=None):
+        """Perform a backprop/optimization on a single variable."""
+        top_k_predictions = self.select_best_predictions(trainable_variable, reward)
+        if (
+            self._program is None
+            or self._validation_data is None
+            or len(top_k_predictions) <= self.k
+        ):
+            examples = self.sample_examples(top_k_predictions)
+            trainable_variable.update({"examples": examples})
+            return
+        candidates = []
+        if trainable_variable.get("examples"):
+            candidates.append(trainable_variable.get("examples"))
+        for _ in range(self.num_candidates):
+            candidates.append(self.sample_examples(top_k_predictions))
+        best_candidate = await self.search(trainable_variable, candidates)
+        trainable_variable.update({"examples": best_candidate})
+
+    async def search(self, trainable_variable, candidates):
+        """Evaluate the candidate examples and return the best ones.
+
+        Args:
+            trainable_variable (Variable): The variable to optimize.
+            candidates (list): The list of candidate examples.
+
+        Returns:
+            (list): The examples with the best reward on the held-out minibatch.
+        """
+        x_val, y_val = self._validation_data
+        indices = np.random.permutation(len(x_val))[: self.validation_batch_size]
+        half = (len(indices) + 1) // 2
+        state_tree = self._program.get_state_tree()
+        state_tree = {
+            key: value
+            for key, value in state_tree.items()
+            if key in ("trainable_variables", "non_trainable_variables")
+        }
+        totals = [0.0] * len(candidates)
+        counts = [0] * len(candidates)
+        survivors = list(range(len(candidates)))
+        for minibatch_indices in (indices[:half], indices[half:]):
+            if len(minibatch_indices) == 0:
+                break
+            rewards = await asyncio.gather(
+                *[
+                    self._evaluate(
+                        _replace_examples(
+                            state_tree, trainable_variable.path, candidates[i]
+                        ),
+                        x_val[minibatch_indices],
+                        y_val[minibatch_indices],
+                    )
+                    for i in survivors
+                ]
+            )
+            for i, reward in zip(survivors, rewards):
+                totals[i] += reward * len(minibatch_indices)
+                counts[i] += len(minibatch_indices)
+            best_reward = max(totals[i] / counts[i] for i in survivors)
+            survivors = [
+                i
+                for i in survivors
+                if totals[i] / counts[i] >= best_reward - self.pruning_margin
+            ]
+        best_index = max(survivors, key=lambda i: totals[i] / counts[i])
+        return candidates[best_index]
+
+    async def _evaluate(self, state_tree, x, y):
+        programs = self._get_program_copies()
+        program = await programs.get()
+        try:
+            program.set_state_tree(state_tree)
+            program.reset_metrics()
+            logs = await program.test_on_batch(x=x, y=y, return_dict=True)
+            return logs["reward"]
+        finally:
+            programs.put_nowait(program)
+
+    def _get_program_copies(self):
+        if self._program_copies is None:
+            compile_config = dict(self._program._compile_config.config)
+            compile_config.update({"optimizer": None, "metrics": None})
+            self._program_copies = asyncio.Queue()
+            for _ in range(self.max_concurrency):
+                # The config is consumed by the deserialization
+                program_config = serialization_lib.serialize_synalinks_object(
+                    self._program
+                )
+                program = serialization_lib.deserialize_synalinks_object(program_config)
+                program.compile(**compile_config)
+                self._program_copies.put_nowait(program)
+        return self._program_copies
+
+    def get_config(self):
+        config = super().get_config()
+        config.update(
+            {
+                "num_candidates": self.num_candidates,
+                "validation_batch_size": self.validation_batch_size,
+                "max_concurrency": self.max_concurrency,
+                "pruning_margin": self.pruning_margin,
+            }
+        )
+        return config
+
+
+def _replace_examples(state_tree, variable_path, examples):
+    """Returns a copy of the state tree with the given variable examples.
+
+    Only the dicts along the variable path are copied, the other values are shared.
+    """
+    state_tree = dict(state_tree)
+    current = state_tree["trainable_variables"] = dict(state_tree["trainable_variables"])
+    for part in variable_path.split("/"):
+        current[part] = dict(current[part])
+        current = current[part]
+    current["examples"] = examples
+    return state_tree
+
+
+def _is_array_data(validation_data):
+    x, y = validation_data
+    return (
+        x is not None and y is not None and array_data_adapter.can_convert_arrays((x, y))
+    )
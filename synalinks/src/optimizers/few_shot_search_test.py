@@ -0,0 +1,132 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import json
+from unittest.mock import patch
+
+from synalinks.src import rewards
+from synalinks.src import testing
+from synalinks.src.backend import Prediction
+from synalinks.src.optimizers.few_shot_search import FewShotSearch
+from synalinks.src.optimizers.few_shot_search import _replace_examples
+from synalinks.src.testing.test_utils import AnswerWithRationale
+from synalinks.src.testing.test_utils import load_test_data
+from synalinks.src.trainers.trainer_test import program_test
+
+
+class FewShotSearchTest(testing.TestCase):
+    def test_replace_examples_does_not_mutate_state_tree(self):
+        state_tree = {
+            "trainable_variables": {
+                "generator": {"generator_state": {"examples": [], "predictions": []}},
+                "other": {"state": {"examples": []}},
+            },
+            "non_trainable_variables": {},
+        }
+        examples = [Prediction(inputs={}, outputs={}).get_json()]
+        new_state_tree = _replace_examples(
+            state_tree, "generator/generator_state", examples
+        )
+        self.assertEqual(
+            new_state_tree["trainable_variables"]["generator"]["generator_state"][
+                "examples"
+            ],
+            examples,
+        )
+        self.assertEqual(
+            state_tree["trainable_variables"]["generator"]["generator_state"]["examples"],
+            [],
+        )
+        self.assertIs(
+            new_state_tree["trainable_variables"]["other"],
+            state_tree["trainable_variables"]["other"],
+        )
+
+    def test_invalid_max_concurrency(self):
+        with self.assertRaisesRegex(ValueError, "max_concurrency"):
+            FewShotSearch(max_concurrency=0)
+
+    def test_get_config(self):
+        optimizer = FewShotSearch(k=2, num_candidates=3, pruning_margin=0.1)
+        config = optimizer.get_config()
+        self.assertEqual(config["k"], 2)
+        self.assertEqual(config["num_candidates"], 3)
+        self.assertEqual(config["pruning_margin"], 0.1)
+        self.assertEqual(FewShotSearch.from_config(config).num_candidates, 3)
+
+    async def test_set_program_with_array_validation_data(self):
+        program = await program_test()
+        (_, _), (x_test, y_test) = load_test_data()
+        optimizer = FewShotSearch()
+        optimizer.set_program(program, validation_data=(x_test, y_test))
+        x_val, y_val = optimizer._validation_data
+        self.assertEqual(len(x_val), len(x_test))
+        self.assertEqual(len(y_val), len(y_test))
+
+    async def test_set_program_with_non_array_validation_data(self):
+        program = await program_test()
+        (_, _), (x_test, y_test) = load_test_data()
+
+        def generator():
+            yield x_test, y_test
+
+        optimizer = FewShotSearch()
+        for validation_data in ((generator(), None), (x_test, None)):
+            with self.assertWarnsRegex(UserWarning, "tuple of arrays"):
+                optimizer.set_program(program, validation_data=validation_data)
+            self.assertIsNone(optimizer._validation_data)
+
+    async def test_search_prunes_losing_candidates(self):
+        program = await program_test()
+        (_, _), (x_test, y_test) = load_test_data()
+        optimizer = FewShotSearch(validation_batch_size=2, pruning_margin=0.5)
+        optimizer.set_program(program, validation_data=(x_test, y_test))
+
+        variable = program.trainable_variables[0]
+        candidates = [
+            [Prediction(inputs={"id": i}, outputs={}).get_json()] for i in range(3)
+        ]
+        rewards_per_candidate = {0: 0.5, 1: 0.9, 2: 0.1}
+        evaluated = []
+
+        async def evaluate(state_tree, x, y):
+            state = state_tree["trainable_variables"]["generator"]["generator_state"]
+            candidate_id = state["examples"][0]["inputs"]["id"]
+            evaluated.append(candidate_id)
+            return rewards_per_candidate[candidate_id]
+
+        optimizer._evaluate = evaluate
+        best_candidate = await optimizer.search(variable, candidates)
+        self.assertEqual(best_candidate, candidates[1])
+        # The last candidate is pruned after the first half of the minibatch
+        self.assertEqual(sorted(evaluated), [0, 0, 1, 1, 2])
+        self.assertEqual(variable.get("examples"), [])
+
+    @patch("litellm.completion")
+    async def test_fit_with_validation_data(self, mock_completion):
+        mock_answer = AnswerWithRationale(
+            rationale="""The capital of France is well-known and is the seat of """
+            """the French government.""",
+            answer="Paris",
+        )
+        mock_completion.return_value = {
+            "choices": [{"message": {"content": json.dumps(mock_answer.get_json())}}]
+        }
+
+        program = await program_test()
+        program.compile(
+            optimizer=FewShotSearch(k=1, k_best=2, num_candidates=2),
+            reward=rewards.ExactMatch(in_mask=["answer"]),
+        )
+        (x_train, y_train), (x_test, y_test) = load_test_data()
+
+        await program.fit(
+            x=x_train,
+            y=y_train,
+            validation_data=(x_test, y_test),
+            batch_size=1,
+            epochs=2,
+            verbose=0,
+        )
+        state = program.trainable_variables[0]
+        self.assertEqual(len(state.get("examples")), 1)
+        self.assertEqual(state.get("predictions"), [])
@@ -85,6 +85,8 @@ class Optimizer(SynalinksSaveable):
             )
         self._track_variable(iterations)
         self._iteration = iterations
+        self._program = None
+        self._validation_data = None
 
     def get_schema(self):
         return self._schema
@@ -122,6 +124,20 @@ class Optimizer(SynalinksSaveable):
         for i, variable in enumerate(self.variables):
             variable.assign(store[str(i)])
 
+    def set_program(self, program, validation_data=None):
+        """Sets the program trained with this optimizer.
+
+        Called by `Program.fit()` before training, so optimizers can evaluate
+        the program (e.g. to compare candidate variable values).
+
+        Args:
+            program (Program): The program being trained.
+            validation_data (tuple): Optional. The `(x, y)` validation data
+                provided to `Program.fit()`.
+        """
+        self._program = program
+        self._validation_data = validation_data
+
     def _check_super_called(self):
         if not hasattr(self, "_lock"):
             raise RuntimeError(
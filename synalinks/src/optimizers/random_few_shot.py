@@ -1,5 +1,6 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import heapq
 import random
 from typing import List
 
@@ -45,6 +46,7 @@ class RandomFewShot(Optimizer):
     Args:
         k (int): The number of examples to select (default 3) among the best predictions.
         k_best (int): The max number of best predictions to select from (default 10).
+            Only these predictions are kept between the training steps.
     """
 
     def __init__(
@@ -67,26 +69,54 @@ class RandomFewShot(Optimizer):
 
     async def optimize(self, trainable_variable, reward=None):
         """Perform a backprop/optimization on a single variable."""
-        # Reward backpropagation
+        top_k_predictions = self.select_best_predictions(trainable_variable, reward)
+        trainable_variable.update({"examples": self.sample_examples(top_k_predictions)})
+
+    def select_best_predictions(self, trainable_variable, reward=None):
+        """Backpropagate the reward and keep the `k_best` predictions of a variable.
+
+        The predictions list only holds the `k_best` predictions retained
+        at the previous step plus the ones made since then, so each step
+        costs O((k_best + batch_size) * log(k_best)) whatever the epoch length.
+
+        Args:
+            trainable_variable (Variable): The variable to optimize.
+            reward (float): The reward of the predictions made since the last step.
+
+        Returns:
+            (list): The `k_best` predictions, sorted by decreasing reward.
+        """
         predictions = trainable_variable.get("predictions")
-        backpropagated_predictions = []
-        for p in predictions:
+        heap = []
+        for i, p in enumerate(predictions):
             if p["reward"] is None:
                 p["reward"] = reward
-            backpropagated_predictions.append(p)
-        trainable_variable.update({"predictions": backpropagated_predictions})
-        # Get the k best predictions (sorted by reward)
-        sorted_predictions = sorted(
-            backpropagated_predictions,
-            key=lambda x: x["reward"] if x["reward"] is not None else float("-inf"),
-            reverse=True,
-        )
-        top_k_predictions = sorted_predictions[: self.k_best]
-        if len(top_k_predictions) > self.k:
-            selected_predictions = random.sample(top_k_predictions, self.k)
-        else:
-            selected_predictions = top_k_predictions
-        trainable_variable.update({"examples": selected_predictions})
+            score = p["reward"] if p["reward"] is not None else float("-inf")
+            # On equal rewards, the oldest predictions are kept first
+            item = (score, -i, p)
+            if len(heap) < self.k_best:
+                heapq.heappush(heap, item)
+            elif item[:2] > heap[0][:2]:
+                heapq.heapreplace(heap, item)
+        top_k_predictions = [
+            item[2] for item in sorted(heap, key=lambda x: x[:2], reverse=True)
+        ]
+        # Evict the other predictions eagerly to keep the memory bounded
+        trainable_variable.update({"predictions": top_k_predictions})
+        return top_k_predictions
+
+    def sample_examples(self, predictions):
+        """Randomly select `k` examples among the given predictions.
+
+        Args:
+            predictions (list): The predictions to select from.
+
+        Returns:
+            (list): The selected examples.
+        """
+        if len(predictions) > self.k:
+            return random.sample(predictions, self.k)
+        return list(predictions)
 
     async def finalize(self, trainable_variable):
         """Finalize the optimization of a single variable (cleanup/scaling etc.)."""
@@ -0,0 +1,64 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+from synalinks.src import testing
+from synalinks.src.backend import Prediction
+from synalinks.src.backend import Variable
+from synalinks.src.optimizers.random_few_shot import FewShotOptimizedVariable
+from synalinks.src.optimizers.random_few_shot import RandomFewShot
+
+
+def make_prediction(i, reward=None):
+    return Prediction(
+        inputs={"query": f"query {i}"},
+        outputs={"answer": f"answer {i}"},
+        reward=reward,
+    ).get_json()
+
+
+class RandomFewShotTest(testing.TestCase):
+    async def test_keeps_only_k_best_predictions(self):
+        variable = Variable(
+            initializer=FewShotOptimizedVariable().get_json(),
+            data_model=FewShotOptimizedVariable,
+        )
+        optimizer = RandomFewShot(k=2, k_best=3)
+
+        for step, reward in enumerate([0.2, 0.9, 0.5, 0.1]):
+            variable.get("predictions").extend(
+                [make_prediction(2 * step), make_prediction(2 * step + 1)]
+            )
+            await optimizer.optimize(variable, reward=reward)
+            self.assertLessEqual(len(variable.get("predictions")), 3)
+            self.assertEqual(len(variable.get("examples")), 2)
+
+        rewards = [p["reward"] for p in variable.get("predictions")]
+        self.assertEqual(rewards, [0.9, 0.9, 0.5])
+        # On equal rewards, the oldest predictions are kept
+        self.assertEqual(
+            variable.get("predictions")[2]["inputs"],
+            {"query": "query 4"},
+        )
+        for example in variable.get("examples"):
+            self.assertIn(example, variable.get("predictions"))
+
+    async def test_examples_do_not_alias_predictions(self):
+        variable = Variable(
+            initializer=FewShotOptimizedVariable().get_json(),
+            data_model=FewShotOptimizedVariable,
+        )
+        optimizer = RandomFewShot(k=3)
+        variable.get("predictions").append(make_prediction(0))
+        await optimizer.optimize(variable, reward=1.0)
+        variable.get("predictions").append(make_prediction(1))
+        self.assertEqual(len(variable.get("examples")), 1)
+
+    async def test_finalize(self):
+        variable = Variable(
+            initializer=FewShotOptimizedVariable(
+                predictions=[make_prediction(0, reward=1.0)]
+            ).get_json(),
+            data_model=FewShotOptimizedVariable,
+        )
+        optimizer = RandomFewShot()
+        await optimizer.finalize(variable)
+        self.assertEqual(variable.get("predictions"), [])
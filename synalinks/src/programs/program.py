@@ -10,10 +10,14 @@ import warnings
 from synalinks.src import utils
 from synalinks.src.api_export import synalinks_export
 from synalinks.src.modules import Module
+from synalinks.src.saving import checkpoint_writer
+from synalinks.src.saving import program_archive
 from synalinks.src.trainers.trainer import Trainer
 from synalinks.src.utils import file_utils
 from synalinks.src.utils import io_utils
+from synalinks.src.utils import json_codec
 from synalinks.src.utils import summary_utils
+from synalinks.src.utils import tracking
 from synalinks.src.utils.nlp_utils import remove_numerical_suffix
 
 
@@ -279,7 +283,14 @@ class Program(Trainer, Module):
             module_range=module_range,
         )
 
-    def save(self, filepath, overwrite=True, **kwargs):
+    def save(
+        self,
+        filepath,
+        overwrite=True,
+        compression=None,
+        compression_level=None,
+        **kwargs,
+    ):
         """Saves a program as a `.json` file.
 
         Example:
@@ -318,28 +329,52 @@ class Program(Trainer, Module):
 
         Thus programs can be reinstantiated in the exact same state.
 
+        The program can also be saved as a `.synalinks` archive, holding the
+        value of each variable separately. When loading an archive, the value
+        of each variable is only decoded when first accessed, which makes
+        loading the programs with a large state faster. The archive members
+        can be compressed with gzip or zstd (which requires the `zstandard`
+        package), the stored examples and predictions being very repetitive.
+
         Args:
             filepath (str | os.PathLike): `str` or `os.PathLike` object.
-                The path where to save the model. Must end in `.json`.
+                The path where to save the model. Must end in `.json`,
+                in `.json.gz` to compress the file or in `.synalinks`.
             overwrite (bool): Whether we should overwrite any existing program at
                 the target location, or instead ask the user via
                 an interactive prompt. Default to `True`.
+            compression (str): Optional. The compression of the `.synalinks`
+                archives, one of `"gzip"` or `"zstd"` (Default to None).
+            compression_level (int): Optional. The compression level, between
+                0 and 9 for gzip (Default to 6), or between 1 and 22 for zstd
+                (Default to 3).
         """
         from synalinks.src.saving import serialization_lib
 
         filepath = file_utils.path_to_string(filepath)
-        if not filepath.endswith(".json"):
+        if not filepath.endswith((".json", ".json.gz", ".synalinks")):
             raise ValueError(
-                f"The filepath should ends with '.json', received filepath={filepath}"
+                "The filepath should ends with '.json' or '.synalinks', "
+                f"received filepath={filepath}"
             )
         program_config = serialization_lib.serialize_synalinks_object(self)
+        if filepath.endswith(".synalinks"):
+            if file_utils.exists(filepath) and not overwrite:
+                io_utils.ask_to_proceed_with_overwrite(filepath)
+            program_archive.save_archive(
+                filepath,
+                self._get_flat_state(),
+                config=program_config,
+                compression=compression,
+                compression_level=compression_level,
+            )
+            return
         variables_config = self.get_state_tree()
         program_config.update({"variables": variables_config})
-        program_config_string = json.dumps(program_config, indent=2)
+        program_config_string = json_codec.dumps(program_config)
         if file_utils.exists(filepath) and not overwrite:
             io_utils.ask_to_proceed_with_overwrite(filepath)
-        with open(filepath, "w") as f:
-            f.write(program_config_string)
+        checkpoint_writer.write_file(filepath, program_config_string)
 
     async def build_from_config(self, config):
         if not config:
@@ -405,7 +440,9 @@ class Program(Trainer, Module):
         from synalinks.src.saving import serialization_lib
 
         program_config = serialization_lib.serialize_synalinks_object(self)
-        return json.dumps(program_config, **kwargs)
+        if kwargs:
+            return json.dumps(program_config, **kwargs)
+        return json_codec.dumps(program_config)
 
     @classmethod
     def from_config(cls, config, custom_objects=None):
@@ -480,21 +517,29 @@ class Program(Trainer, Module):
                 requested variables. The keys are the variable names, and the
                 values are the corresponding nested dictionaries.
         """
-        variables = {}
-        variables["trainable_variables"] = self._create_nested_dict(
-            self.trainable_variables
-        )
-        variables["non_trainable_variables"] = self._create_nested_dict(
-            self.non_trainable_variables
-        )
+        return {
+            name: self._create_nested_dict(variables)
+            for name, variables in self._get_variable_collections().items()
+        }
+
+    def _get_variable_collections(self):
+        collections = {
+            "trainable_variables": self.trainable_variables,
+            "non_trainable_variables": self.non_trainable_variables,
+        }
         if self.optimizer:
-            variables["optimizer_variables"] = self._create_nested_dict(
-                self.optimizer.variables
-            )
-        variables["metrics_variables"] = self._create_nested_dict(self.metrics_variables)
-        return variables
-
-    def _create_nested_dict(self, variables):
+            collections["optimizer_variables"] = self.optimizer.variables
+        collections["metrics_variables"] = self.metrics_variables
+        return collections
+
+    def _get_flat_state(self):
+        # Like `get_state_tree()`, with the variables indexed by path.
+        return {
+            name: self._create_flat_dict(variables)
+            for name, variables in self._get_variable_collections().items()
+        }
+
+    def _create_flat_dict(self, variables):
         flat_dict = {}
         for v in variables:
             if v.path in flat_dict:
@@ -505,7 +550,10 @@ class Program(Trainer, Module):
                     "names to your modules (and other objects)."
                 )
             flat_dict[v.path] = v.get_json()
+        return flat_dict
 
+    def _create_nested_dict(self, variables):
+        flat_dict = self._create_flat_dict(variables)
         nested_dict = {}
         for path, value in flat_dict.items():
             parts = path.split("/")
@@ -533,33 +581,96 @@ class Program(Trainer, Module):
                 The keys are the variable names, and the values are nested
                 dictionaries representing the variable paths and their values.
         """
+        collections = self._get_variable_collections()
         for k, v in state_tree.items():
-            path_value_dict = self._flatten_nested_dict(v)
-            if k == "trainable_variables":
-                self._assign_variable_values(self.trainable_variables, path_value_dict)
-            elif k == "non_trainable_variables":
-                self._assign_variable_values(
-                    self.non_trainable_variables, path_value_dict
-                )
-            elif k == "optimizer_variables":
-                if self.optimizer:
-                    self._assign_variable_values(
-                        self.optimizer.variables, path_value_dict
-                    )
-            elif k == "metrics_variables":
-                self._assign_variable_values(self.metrics_variables, path_value_dict)
-            else:
+            if k not in collections:
+                if k == "optimizer_variables":
+                    continue
                 raise ValueError(f"Unknown variable name: {k}")
+            self._assign_variable_values(
+                self._get_variable_index(k, collections[k]),
+                self._flatten_nested_dict(v),
+            )
 
-    def _assign_variable_values(self, variables, path_value_dict):
-        for full_path, value in path_value_dict.items():
-            path = "/".join(full_path.split("/")[:-1])
-            field_name = full_path.split("/")[-1]
-            for variable in variables:
-                if remove_numerical_suffix(variable.path) == path:
-                    variable.get_json()[field_name] = value
+    def _load_archive_variables(self, archive):
+        # The variables are updated lazily, so their value is only decoded
+        # from the (memory-mapped) archive when first accessed. The archive
+        # is closed once they are all decoded.
+        try:
+            collections = self._get_variable_collections()
+            for k, paths in archive.variables.items():
+                if k not in collections:
+                    if k == "optimizer_variables":
+                        continue
+                    raise ValueError(f"Unknown variable name: {k}")
+                variable_index = self._get_variable_index(k, collections[k])
+                for path in paths:
+                    for variable in variable_index.get(path, ()):
+                        variable.lazy_update(archive.lazy_read_variable(k, path))
+        except Exception:
+            archive.close()
+            raise
+        archive.close_when_read()
+
+    def assign_variables(self, values):
+        """Assigns the values of several variables at once.
+
+        Each variable is updated with a single call to `Variable.update()`,
+        and looked up in constant time by its path.
+
+        Example:
+
+        ```python
+        program.assign_variables(
+            {
+                "generator/generator_state": {
+                    "examples": examples,
+                },
+            }
+        )
+        ```
+
+        Args:
+            values (dict): A dictionary mapping the variable paths to the
+                fields to update.
+        """
+        variables = self.variables
+        if self.optimizer:
+            variables = variables + self.optimizer.variables
+        variables = variables + self.metrics_variables
+        self._assign_variable_values(
+            self._get_variable_index("variables", variables), values
+        )
+
+    @tracking.no_automatic_dependency_tracking
+    def _get_variable_index(self, name, variables):
+        """Returns a dictionary mapping the variable paths to the variables.
+
+        The index is built once per collection of variables, and rebuilt only
+        when the collection changes (e.g. when modules, an optimizer or metrics
+        are added to the program).
+        """
+        key = tuple(id(variable) for variable in variables)
+        if getattr(self, "_variable_indices", None) is None:
+            self._variable_indices = {}
+        cached = self._variable_indices.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        index = {}
+        for variable in variables:
+            index.setdefault(remove_numerical_suffix(variable.path), []).append(variable)
+        # The index keeps a reference to the variables, so their ids are not reused.
+        self._variable_indices[name] = (key, index)
+        return index
+
+    def _assign_variable_values(self, variable_index, values):
+        for path, fields in values.items():
+            for variable in variable_index.get(path, ()):
+                variable.update(fields)
 
     def _flatten_nested_dict(self, nested_dict):
+        # Groups the leaves of the state tree by variable path:
+        # {"a": {"b": {"x": 1, "y": 2}}} -> {"a/b": {"x": 1, "y": 2}}
         flat_dict = {}
 
         def _flatten(current_dict, prefix=""):
@@ -567,33 +678,57 @@ class Program(Trainer, Module):
                 if isinstance(value, dict):
                     _flatten(value, prefix + key + "/")
                 else:
-                    flat_dict[prefix + key] = value
+                    flat_dict.setdefault(prefix[:-1], {})[key] = value
 
         _flatten(nested_dict)
         return flat_dict
 
-    def save_variables(self, filepath, overwrite=True):
+    def save_variables(
+        self,
+        filepath,
+        overwrite=True,
+        compression=None,
+        compression_level=None,
+    ):
         """Saves all module variables to a `.variables.json` file.
 
         Args:
             filepath (str | pathlib.Path): `str` or `pathlib.Path` object.
-                Path where to save the program. Must end in `.variables.json`.
+                Path where to save the program. Must end in `.variables.json`,
+                in `.variables.json.gz` to compress the file, or in
+                `.variables.synalinks` to save an archive (see `save()`).
             overwrite (bool): Whether we should overwrite any existing program
                 at the target location, or instead ask the user
                 via an interactive prompt.
+            compression (str): Optional. The compression of the
+                `.variables.synalinks` archives, one of `"gzip"` or `"zstd"`
+                (Default to None).
+            compression_level (int): Optional. The compression level
+                (see `save()`).
         """
         filepath = file_utils.path_to_string(filepath)
-        if not filepath.endswith(".variables.json"):
+        if not filepath.endswith(
+            (".variables.json", ".variables.json.gz", ".variables.synalinks")
+        ):
             raise ValueError(
-                "The filepath should ends with '.variables.json', "
-                f"received filepath={filepath}"
+                "The filepath should ends with '.variables.json' or "
+                f"'.variables.synalinks', received filepath={filepath}"
+            )
+        if filepath.endswith(".synalinks"):
+            if file_utils.exists(filepath) and not overwrite:
+                io_utils.ask_to_proceed_with_overwrite(filepath)
+            program_archive.save_archive(
+                filepath,
+                self._get_flat_state(),
+                compression=compression,
+                compression_level=compression_level,
             )
+            return
         config = self.get_state_tree()
-        config_string = json.dumps(config, indent=2)
+        config_string = json_codec.dumps(config)
         if file_utils.exists(filepath) and not overwrite:
             io_utils.ask_to_proceed_with_overwrite(filepath)
-        with open(filepath, "w") as f:
-            f.write(config_string)
+        checkpoint_writer.write_file(filepath, config_string)
 
     def load_variables(self, filepath):
         """Load all module variables from a `.variable.json` file.
@@ -601,16 +736,21 @@ class Program(Trainer, Module):
         Args:
             filepath (str | pathlib.Path): `str` or `pathlib.Path` object.
                 Path to load the program's variables from.
-                Must end in `.variables.json`.
+                Must end in `.variables.json` (or `.variables.json.gz`),
+                or in `.variables.synalinks`.
         """
         filepath = file_utils.path_to_string(filepath)
-        if not filepath.endswith(".variables.json"):
+        if not filepath.endswith(
+            (".variables.json", ".variables.json.gz", ".variables.synalinks")
+        ):
             raise ValueError(
-                "The filepath should ends with '.variables.json', "
-                f"received filepath={filepath}"
+                "The filepath should ends with '.variables.json' or "
+                f"'.variables.synalinks', received filepath={filepath}"
             )
-        with open(filepath, "r") as f:
-            state_tree_config = json.loads(f.read())
+        if filepath.endswith(".synalinks"):
+            self._load_archive_variables(program_archive.ProgramArchive(filepath))
+            return
+        state_tree_config = json_codec.loads(checkpoint_writer.read_file(filepath))
         self.set_state_tree(state_tree_config)
 
     @classmethod
@@ -627,8 +767,8 @@ class Program(Trainer, Module):
 
         Args:
             filepath (str | pathlib.Path): `str` or `pathlib.Path` object.
-                Path to load the program's variables from.
-                Must end in `.variables.json`.
+                Path to load the program from.
+                Must end in `.json` (or `.json.gz`), or in `.synalinks`.
             custom_objects (dict): Optional dictionary mapping names
                 (strings) to custom classes or functions to be
                 considered during deserialization.
@@ -636,13 +776,32 @@ class Program(Trainer, Module):
         Returns:
             (Program): A Synalinks program instance (uncompiled).
         """
+        from synalinks.src.saving import serialization_lib
+
         filepath = file_utils.path_to_string(filepath)
-        if not filepath.endswith(".json"):
+        if not filepath.endswith((".json", ".json.gz", ".synalinks")):
             raise ValueError(
-                f"The filepath should ends with '.json', received filepath={filepath}"
+                "The filepath should ends with '.json' or '.synalinks', "
+                f"received filepath={filepath}"
             )
-        with open(filepath, "r") as f:
-            json_config = f.read()
+        if filepath.endswith(".synalinks"):
+            archive = program_archive.ProgramArchive(filepath)
+            try:
+                program_config = archive.get_config()
+                if program_config is None:
+                    raise ValueError(
+                        f"The archive {filepath} only contains variables, "
+                        "use `program.load_variables()` to load them."
+                    )
+                program = serialization_lib.deserialize_synalinks_object(
+                    program_config, custom_objects=custom_objects
+                )
+            except Exception:
+                archive.close()
+                raise
+            program._load_archive_variables(archive)
+            return program
+        json_config = checkpoint_writer.read_file(filepath)
         return program_from_json(json_config, custom_objects=custom_objects)
 
 
@@ -689,7 +848,7 @@ def program_from_json(json_string, custom_objects=None):
     """
     from synalinks.src.saving import serialization_lib
 
-    program_config = json.loads(json_string)
+    program_config = json_codec.loads(json_string)
     variables_config = program_config.get("variables")
     program = serialization_lib.deserialize_synalinks_object(
         program_config, custom_objects=custom_objects
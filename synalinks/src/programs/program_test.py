@@ -341,3 +341,61 @@ class ProgramTest(testing.TestCase):
                     var2.path
                 ):
                     self.assertEqual(var1.get_json(), var2.get_json())
+
+    async def test_assign_variables(self):
+        class Query(DataModel):
+            query: str
+
+        class Answer(DataModel):
+            answer: str
+
+        language_model = LanguageModel(model="ollama/mistral")
+
+        x0 = Input(data_model=Query)
+        x1 = await Generator(
+            data_model=Answer,
+            language_model=language_model,
+        )(x0)
+        x2 = await Generator(
+            data_model=Answer,
+            language_model=language_model,
+        )(x1)
+
+        program = Program(
+            inputs=x0,
+            outputs=x2,
+            name="chain",
+        )
+        variable_1, variable_2 = program.trainable_variables
+        version = variable_1.version
+        program.assign_variables(
+            {
+                "generator/generator_state": {
+                    "prompt_template": "Dummy prompt template",
+                    "instructions": [],
+                },
+                "unknown/unknown_state": {"prompt_template": "Unused"},
+            }
+        )
+        self.assertEqual(variable_1.get("prompt_template"), "Dummy prompt template")
+        self.assertEqual(variable_1.version, version + 1)
+        self.assertEqual(variable_2.get("prompt_template"), default_prompt_template())
+
+        index = program._get_variable_index("variables", program.variables)
+        self.assertIs(program._get_variable_index("variables", program.variables), index)
+
+        # The index is rebuilt when the optimizer variables are added
+        program.compile(
+            reward=rewards.ExactMatch(),
+            optimizer=optimizers.RandomFewShot(),
+        )
+        program.assign_variables({"random_few_shot/iteration": {"iteration": 3}})
+        self.assertEqual(program.optimizer.iterations.get("iteration"), 3)
+
+        state_tree = program.get_state_tree()
+        state_tree["trainable_variables"]["generator_1"]["generator_1_state"][
+            "prompt_template"
+        ] = "Another prompt template"
+        program.set_state_tree(state_tree)
+        self.assertEqual(variable_2.get("prompt_template"), "Another prompt template")
+        self.assertEqual(state_tree, program.get_state_tree())
@@ -2,10 +2,12 @@ import inspect
 
 from synalinks.src.api_export import synalinks_export
 from synalinks.src.rewards.cosine_similarity import CosineSimilarity
+from synalinks.src.rewards.cosine_similarity import batch_cosine_similarity
 from synalinks.src.rewards.cosine_similarity import cosine_similarity
 from synalinks.src.rewards.exact_match import ExactMatch
 from synalinks.src.rewards.exact_match import exact_match
 from synalinks.src.rewards.reward import Reward
+from synalinks.src.rewards.reward_cache import RewardCache
 from synalinks.src.rewards.reward_wrappers import RewardFunctionWrapper
 from synalinks.src.saving import serialization_lib
 from synalinks.src.utils.naming import to_snake_case
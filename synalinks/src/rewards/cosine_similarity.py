@@ -3,6 +3,7 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
 from synalinks.src import ops
+from synalinks.src import tree
 from synalinks.src.api_export import synalinks_export
 from synalinks.src.backend.common import numpy as np
 from synalinks.src.rewards.reward import Reward
@@ -50,6 +51,67 @@ async def cosine_similarity(y_true, y_pred, embedding_model=None, axis=-1):
     return reward
 
 
+@synalinks_export("synalinks.rewards.batch_cosine_similarity")
+async def batch_cosine_similarity(y_true, y_pred, embedding_model=None, axis=-1):
+    """
+    Computes the cosine similarity between each pair of `y_true` and `y_pred`.
+
+    This is the batched version of `cosine_similarity`: all the unique texts of
+    the batch are embedded with a single call to the embedding model, and the
+    similarities of all the pairs are computed at once.
+
+    Args:
+        y_true (list): The batch of ground truth JSON data_models.
+        y_pred (list): The batch of predicted JSON data_models.
+        embedding_model (EmbeddingModel): The embedding model to use to compute the
+            cosine similarity.
+        axis (int): (Optional) Defaults to `-1`. The dimension along which the cosine
+            similarity is computed.
+
+    Returns:
+        (list): The reward values (one per sample), which tend to 1.0 if the
+            values are similar, and towards 0.0 otherwise.
+    """
+    texts = {}
+
+    def get_text_indices(x):
+        fields = tree.flatten(tree.map_structure(lambda field: str(field), x.get_json()))
+        return [texts.setdefault(field, len(texts)) for field in fields]
+
+    rewards = [0.0] * len(y_pred)
+    samples = []
+    true_indices = []
+    pred_indices = []
+    for i, (y_t, y_p) in enumerate(zip(y_true, y_pred)):
+        if y_p is None:
+            continue
+        t_indices = get_text_indices(y_t)
+        p_indices = get_text_indices(y_p)
+        # Broadcast single fields like `squeeze_or_expand_to_same_rank`
+        if len(t_indices) == 1:
+            t_indices = t_indices * len(p_indices)
+        elif len(p_indices) == 1:
+            p_indices = p_indices * len(t_indices)
+        if len(t_indices) != len(p_indices):
+            raise ValueError(
+                "`y_true` and `y_pred` should have the same number of fields, "
+                f"received {len(t_indices)} and {len(p_indices)} fields."
+            )
+        samples.append((i, len(true_indices), len(true_indices) + len(t_indices)))
+        true_indices.extend(t_indices)
+        pred_indices.extend(p_indices)
+    if not texts:
+        return rewards
+    embeddings = await embedding_model(list(texts))
+    embeddings = np.normalize(np.convert_to_tensor(embeddings["embeddings"]), axis=axis)
+    similarities = (
+        np.sum(embeddings[true_indices] * embeddings[pred_indices], axis=axis) + 1
+    ) / 2
+    for i, start, end in samples:
+        rewards[i] = similarities[start:end]
+    return rewards
+
+
 @synalinks_export("synalinks.rewards.CosineSimilarity")
 class CosineSimilarity(RewardFunctionWrapper):
     """
@@ -65,6 +127,9 @@ class CosineSimilarity(RewardFunctionWrapper):
     but scaled to [0.0, 1.0] and adjusted to have a reward that tend
     towards 1.0 if the two objects are similar (and 0.0 otherwise).
 
+    When used to train a program, the rewards of a batch are computed with
+    a single call to the embedding model (see `batch_cosine_similarity`).
+
     Example:
 
     ```python
@@ -84,6 +149,10 @@ class CosineSimilarity(RewardFunctionWrapper):
         name (str): (Optional) string name of the reward instance.
         in_mask (list): (Optional) list of keys to keep to compute the reward.
         out_mask (list): (Optional) list of keys to remove to compute the reward.
+        cache (RewardCache): (Optional) The cache used to memoize the rewards
+            (see `RewardCache`).
+        max_concurrency (int): (Optional) The maximum number of samples whose
+            reward is computed concurrently by `batch_call()` (Default to 16).
     """
 
     def __init__(
@@ -93,12 +162,17 @@ class CosineSimilarity(RewardFunctionWrapper):
         name="cosine_similarity",
         in_mask=None,
         out_mask=None,
+        cache=None,
+        max_concurrency=16,
     ):
         super().__init__(
             fn=cosine_similarity,
+            batch_fn=batch_cosine_similarity,
             name=name,
             in_mask=in_mask,
             out_mask=out_mask,
+            cache=cache,
+            max_concurrency=max_concurrency,
             axis=axis,
             embedding_model=embedding_model,
         )
@@ -43,3 +43,38 @@ class CosineSimilarityTest(testing.TestCase):
         cosine_similarity = CosineSimilarity(embedding_model=embedding_model)
         reward = await cosine_similarity(y_true, y_pred)
         self.assertEqual(reward, 1.0)
+
+    @patch("litellm.embedding")
+    async def test_batch_call(self, mock_embedding):
+        embedding_model = EmbeddingModel(model="ollama/all-minilm")
+        vectors = {
+            "Paris": [1.0, 0.0],
+            "Toulouse": [0.0, 1.0],
+            "Lyon": [-1.0, 0.0],
+        }
+
+        def embedding(model, input, **kwargs):
+            return {"data": [{"embedding": vectors[text]} for text in input]}
+
+        mock_embedding.side_effect = embedding
+
+        class Answer(DataModel):
+            answer: str
+
+        y_true = [Answer(answer="Paris"), Answer(answer="Paris"), Answer(answer="Paris")]
+        y_pred = [
+            Answer(answer="Paris"),
+            Answer(answer="Toulouse"),
+            Answer(answer="Lyon"),
+        ]
+
+        cosine_similarity = CosineSimilarity(embedding_model=embedding_model)
+        rewards = await cosine_similarity.batch_call(y_true, y_pred)
+        self.assertEqual(mock_embedding.call_count, 1)
+        self.assertEqual(
+            mock_embedding.call_args.kwargs["input"], ["Paris", "Toulouse", "Lyon"]
+        )
+        self.assertEqual(rewards, [1.0, 0.5, 0.0])
+
+        for y_t, y_p, expected in zip(y_true, y_pred, rewards):
+            self.assertAlmostEqual(await cosine_similarity(y_t, y_p), expected)
@@ -43,6 +43,10 @@ class ExactMatch(RewardFunctionWrapper):
         name (str): Optional. string name of the reward instance.
         in_mask (list): Optional. list of keys to keep to compute the reward.
         out_mask (list): Optional. list of keys to remove to compute the reward.
+        cache (RewardCache): Optional. The cache used to memoize the rewards
+            (see `RewardCache`).
+        max_concurrency (int): Optional. The maximum number of samples whose
+            reward is computed concurrently by `batch_call()` (Default to 16).
     """
 
     def __init__(
@@ -50,12 +54,16 @@ class ExactMatch(RewardFunctionWrapper):
         name="exact_match",
         in_mask=None,
         out_mask=None,
+        cache=None,
+        max_concurrency=16,
     ):
         super().__init__(
             fn=exact_match,
             name=name,
             in_mask=in_mask,
             out_mask=out_mask,
+            cache=cache,
+            max_concurrency=max_concurrency,
         )
 
     def get_config(self):
@@ -63,6 +71,8 @@ class ExactMatch(RewardFunctionWrapper):
             "name": self.name,
             "in_mask": self.in_mask,
             "out_mask": self.out_mask,
+            "cache": self.cache.get_config() if self.cache is not None else None,
+            "max_concurrency": self.max_concurrency,
         }
 
     @classmethod
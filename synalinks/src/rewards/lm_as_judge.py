@@ -1,8 +1,13 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import warnings
+from typing import List
+from typing import Optional
+
 from synalinks.src import ops
 from synalinks.src.backend import DataModel
 from synalinks.src.backend import Field
+from synalinks.src.backend import JsonDataModel
 from synalinks.src.modules import Generator
 from synalinks.src.programs import Program
 from synalinks.src.rewards.reward_wrappers import ProgramAsJudge
@@ -23,6 +28,49 @@ class RewardWithCritique(DataModel):
     )
 
 
+class JudgedItem(DataModel):
+    index: int = Field(
+        description="The index of the item to evaluate",
+    )
+    gold: Optional[dict] = Field(
+        default=None,
+        description="The ground truth, if any",
+    )
+    prediction: Optional[dict] = Field(
+        default=None,
+        description="The prediction to evaluate",
+    )
+
+
+class JudgedItems(DataModel):
+    items: List[JudgedItem] = Field(
+        description="The items to evaluate",
+    )
+
+
+class ItemReward(DataModel):
+    index: int = Field(
+        description="The index of the evaluated item",
+    )
+    critique: str = Field(
+        description="The critique of the item",
+    )
+    reward: float = Field(
+        description="The reward value between [0.0, 1.0]",
+        ge=0.0,
+        le=1.0,
+    )
+
+
+class RewardsWithCritique(DataModel):
+    thinking: str = Field(
+        description="The step by step thinking to critique the items",
+    )
+    rewards: List[ItemReward] = Field(
+        description="The reward of each item",
+    )
+
+
 class LMAsJudgeProgram(Program):
     """Evaluate the output of a program using a `LanguageModel`.
 
@@ -122,6 +170,11 @@ class LMAsJudge(ProgramAsJudge):
     )
     ```
 
+    When computing the rewards of a batch (e.g. during training), up to
+    `batch_size` samples are graded with a single LM call, the instructions
+    being shared by all of them. The samples missing from the LM answer (or all
+    of them if the answer can't be parsed) are then graded one by one.
+
     Args:
         language_model (LanguageModel): The language model to use.
         prompt_template (str): The default jinja2 prompt template
@@ -129,9 +182,16 @@ class LMAsJudge(ProgramAsJudge):
         examples (list): The default examples to use in the prompt
             (see `Generator`).
         instructions (list): The default instructions to use (see `Generator`).
+        batch_size (int): Optional. The max number of samples graded by a single
+            LM call when computing the rewards of a batch (Default to 1, which
+            grade each sample separately).
         name (str): Optional. string name of the reward instance.
         in_mask (list): Optional. list of keys to keep to compute the reward.
         out_mask (list): Optional. list of keys to remove to compute the reward.
+        cache (RewardCache): Optional. The cache used to memoize the rewards
+            (see `RewardCache`).
+        max_concurrency (int): Optional. The maximum number of samples whose
+            reward is computed concurrently by `batch_call()` (Default to 16).
     """
 
     def __init__(
@@ -140,9 +200,12 @@ class LMAsJudge(ProgramAsJudge):
         prompt_template=None,
         examples=None,
         instructions=None,
+        batch_size=1,
         name="lm_as_judge",
         in_mask=None,
         out_mask=None,
+        cache=None,
+        max_concurrency=16,
     ):
         program = LMAsJudgeProgram(
             language_model=language_model,
@@ -155,4 +218,85 @@ class LMAsJudge(ProgramAsJudge):
             name=name,
             in_mask=in_mask,
             out_mask=out_mask,
+            cache=cache,
+            max_concurrency=max_concurrency,
+        )
+        self.batch_size = batch_size
+        self.batch_generator = None
+        if batch_size > 1:
+            self.batch_generator = Generator(
+                data_model=RewardsWithCritique,
+                language_model=language_model,
+                prompt_template=prompt_template,
+                instructions=instructions,
+                name=self.name + "_batch_generator",
+            )
+
+    async def call_on_batch(self, y_true, y_pred):
+        if self.batch_generator is None:
+            return await super().call_on_batch(y_true, y_pred)
+        chunks = [
+            (y_true[i : i + self.batch_size], y_pred[i : i + self.batch_size])
+            for i in range(0, len(y_pred), self.batch_size)
+        ]
+        results = await self._gather([self._judge_items(y_t, y_p) for y_t, y_p in chunks])
+        return [reward for rewards in results for reward in rewards]
+
+    async def _judge_items(self, y_true, y_pred):
+        items = JudgedItems(
+            items=[
+                JudgedItem(
+                    index=i,
+                    gold=y_t.get_json() if y_t else None,
+                    prediction=y_p.get_json() if y_p else None,
+                )
+                for i, (y_t, y_p) in enumerate(zip(y_true, y_pred))
+            ]
+        )
+        result = await self.batch_generator(JsonDataModel(data_model=items))
+        rewards = [None] * len(y_pred)
+        if result:
+            for item_reward in result.get("rewards") or []:
+                index = item_reward.get("index")
+                if isinstance(index, int) and 0 <= index < len(rewards):
+                    rewards[index] = float(item_reward.get("reward", 0.0))
+        missing = [i for i, reward in enumerate(rewards) if reward is None]
+        if missing:
+            warnings.warn(
+                f"{self.name}: {len(missing)} item(s) missing from the batch "
+                "judgement, falling back to per-item judging.",
+                stacklevel=2,
+            )
+            fallback_rewards = await super().call_on_batch(
+                [y_true[i] for i in missing],
+                [y_pred[i] for i in missing],
+            )
+            for i, reward in zip(missing, fallback_rewards):
+                rewards[i] = reward
+        return rewards
+
+    def get_config(self):
+        config = {
+            "prompt_template": self.program.prompt_template,
+            "examples": self.program.examples,
+            "instructions": self.program.instructions,
+            "batch_size": self.batch_size,
+            "name": self.name,
+            "in_mask": self.in_mask,
+            "out_mask": self.out_mask,
+            "cache": self.cache.get_config() if self.cache is not None else None,
+            "max_concurrency": self.max_concurrency,
+        }
+        language_model_config = {
+            "language_model": serialization_lib.serialize_synalinks_object(
+                self.program.language_model
+            )
+        }
+        return {**language_model_config, **config}
+
+    @classmethod
+    def from_config(cls, config):
+        language_model = serialization_lib.deserialize_synalinks_object(
+            config.pop("language_model")
         )
+        return cls(language_model=language_model, **config)
@@ -49,3 +49,91 @@ class LMAsJudgeTest(testing.TestCase):
 
         score = await reward(y_pred=y_pred, y_true=y_true)
         self.assertEqual(score, 1.0)
+
+    def test_get_config(self):
+        language_model = LanguageModel(model="ollama_chat/deepseek-r1")
+        reward = LMAsJudge(
+            language_model=language_model,
+            instructions=["Be strict"],
+            batch_size=4,
+            in_mask=["answer"],
+            cache=True,
+        )
+        config = reward.get_config()
+        self.assertEqual(config["batch_size"], 4)
+        new_reward = LMAsJudge.from_config(config)
+        self.assertEqual(new_reward.batch_size, 4)
+        self.assertIsNotNone(new_reward.batch_generator)
+        self.assertEqual(new_reward.name, reward.name)
+        self.assertEqual(new_reward.in_mask, ["answer"])
+        self.assertEqual(new_reward.program.instructions, ["Be strict"])
+        self.assertEqual(new_reward.program.language_model.model, language_model.model)
+        self.assertIsNotNone(new_reward.cache)
+
+    @patch("litellm.completion")
+    async def test_batch_judging(self, mock_completion):
+        class Answer(DataModel):
+            answer: str = Field(description="The correct answer")
+
+        language_model = LanguageModel(model="ollama_chat/deepseek-r1")
+
+        reward = LMAsJudge(language_model=language_model, batch_size=2)
+
+        y_true = [Answer(answer="Paris")] * 3
+        y_pred = [
+            Answer(answer="Paris"),
+            Answer(answer="Toulouse"),
+            Answer(answer="Paris"),
+        ]
+
+        batch_string = (
+            """{"thinking": "The first answer is correct, not the second", """
+            """"rewards": [{"index": 0, "critique": "Correct", "reward": 1.0}, """
+            """{"index": 1, "critique": "Incorrect", "reward": 0.0}]}"""
+        )
+        single_batch_string = (
+            """{"thinking": "The answer is correct", """
+            """"rewards": [{"index": 0, "critique": "Correct", "reward": 1.0}]}"""
+        )
+
+        def completion(messages, **kwargs):
+            # The chunks are judged concurrently, answer based on their content
+            if "Toulouse" in str(messages):
+                return {"choices": [{"message": {"content": batch_string}}]}
+            return {"choices": [{"message": {"content": single_batch_string}}]}
+
+        mock_completion.side_effect = completion
+
+        rewards = await reward.batch_call(y_true, y_pred)
+        self.assertEqual(rewards, [1.0, 0.0, 1.0])
+        self.assertEqual(mock_completion.call_count, 2)
+
+    @patch("litellm.completion")
+    async def test_batch_judging_fallback(self, mock_completion):
+        class Answer(DataModel):
+            answer: str = Field(description="The correct answer")
+
+        language_model = LanguageModel(model="ollama_chat/deepseek-r1")
+
+        reward = LMAsJudge(language_model=language_model, batch_size=2)
+
+        y_true = [Answer(answer="Paris")] * 2
+        y_pred = [Answer(answer="Paris"), Answer(answer="Toulouse")]
+
+        batch_string = (
+            """{"thinking": "The first answer is correct", """
+            """"rewards": [{"index": 0, "critique": "Correct", "reward": 1.0}]}"""
+        )
+        expected_string = (
+            """{"thinking": "The provided answer is incorrect", """
+            """"critique": "The answer is wrong so we attribute a low reward", """
+            """"reward": 0.0}"""
+        )
+
+        mock_completion.side_effect = [
+            {"choices": [{"message": {"content": batch_string}}]},
+        ] + [{"choices": [{"message": {"content": expected_string}}]}] * 2
+
+        with self.assertWarnsRegex(UserWarning, "falling back"):
+            rewards = await reward.batch_call(y_true, y_pred)
+        self.assertEqual(rewards, [1.0, 0.0])
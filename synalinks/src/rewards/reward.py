@@ -2,10 +2,15 @@
 # Original authors: François Chollet et al. (Keras Team)
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import asyncio
+import hashlib
+import json
+
 from synalinks.src import ops
 from synalinks.src import tree
 from synalinks.src.api_export import synalinks_export
 from synalinks.src.backend.common import numpy as np
+from synalinks.src.rewards import reward_cache
 from synalinks.src.saving.synalinks_saveable import SynalinksSaveable
 from synalinks.src.utils.naming import auto_name
 
@@ -18,11 +23,18 @@ class Reward(SynalinksSaveable):
 
     Args:
         name: Optional name for the reward instance.
+        cache: Optional. A `RewardCache` instance (or `True` for a default one)
+            used to memoize the rewards of identical `(y_true, y_pred)` pairs.
+        max_concurrency: Optional. The maximum number of samples whose reward
+            is computed concurrently by `batch_call()` (Default to 16).
+            If `None`, all the samples of a batch are computed concurrently.
 
     To be implemented by subclasses:
 
     * `call()`: Contains the logic for eval calculation using `y_true`,
         `y_pred`.
+    * `call_on_batch()`: Optional. Contains the logic to compute the rewards
+        of a batch of samples at once.
     """
 
     def __init__(
@@ -31,51 +43,160 @@ class Reward(SynalinksSaveable):
         reduction="mean",
         in_mask=None,
         out_mask=None,
+        cache=None,
+        max_concurrency=16,
     ):
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(
+                "`max_concurrency` should be a strictly positive integer or None, "
+                f"received max_concurrency={max_concurrency}"
+            )
         self.name = name or auto_name(self.__class__.__name__)
         self.reduction = standardize_reduction(reduction)
         self.in_mask = in_mask
         self.out_mask = out_mask
+        self.cache = reward_cache.get(cache)
+        self.max_concurrency = max_concurrency
+        self._cache_name = None
+
+    def _standardize(self, y_true, y_pred):
+        y_pred = tree.map_structure(lambda x: ops.convert_to_json_data_model(x), y_pred)
+        y_true = tree.map_structure(lambda x: ops.convert_to_json_data_model(x), y_true)
+
+        if self.in_mask:
+            y_pred = tree.map_structure(lambda x: x.in_mask(mask=self.in_mask), y_pred)
+            y_true = tree.map_structure(lambda x: x.in_mask(mask=self.in_mask), y_true)
+        if self.out_mask:
+            y_pred = tree.map_structure(lambda x: x.out_mask(mask=self.out_mask), y_pred)
+            y_true = tree.map_structure(lambda x: x.out_mask(mask=self.out_mask), y_true)
+        return y_true, y_pred
 
     async def __call__(self, y_true, y_pred):
         with ops.name_scope(self.name):
-            y_pred = tree.map_structure(
-                lambda x: ops.convert_to_json_data_model(x), y_pred
-            )
-            y_true = tree.map_structure(
-                lambda x: ops.convert_to_json_data_model(x), y_true
-            )
+            y_true, y_pred = self._standardize(y_true, y_pred)
 
-            if self.in_mask:
-                y_pred = tree.map_structure(
-                    lambda x: x.in_mask(mask=self.in_mask), y_pred
-                )
-                y_true = tree.map_structure(
-                    lambda x: x.in_mask(mask=self.in_mask), y_true
-                )
-            if self.out_mask:
-                y_pred = tree.map_structure(
-                    lambda x: x.out_mask(mask=self.out_mask), y_pred
-                )
-                y_true = tree.map_structure(
-                    lambda x: x.out_mask(mask=self.out_mask), y_true
-                )
+            if self.cache is not None:
+                key = self.cache.get_key(self.get_cache_name(), y_true, y_pred)
+                reward = self.cache.get(key)
+                if reward is not None:
+                    return reward
 
             rewards = await self.call(y_true, y_pred)
-            return reduce_values(
+            reward = reduce_values(
                 rewards,
                 reduction=self.reduction,
             )
+            if self.cache is not None:
+                self.cache.put(key, reward)
+            return reward
+
+    async def batch_call(self, y_true, y_pred):
+        """Computes the rewards of a batch of samples.
+
+        The samples are masked and looked up in the cache like with `__call__()`,
+        then the remaining ones are given to `call_on_batch()` all at once.
+
+        Args:
+            y_true (list): The batch of ground truths.
+            y_pred (list): The batch of predictions.
+
+        Returns:
+            (list): The list of rewards, one per sample.
+        """
+        with ops.name_scope(self.name):
+            samples = [self._standardize(y_t, y_p) for y_t, y_p in zip(y_true, y_pred)]
+            rewards = [None] * len(samples)
+            keys = [None] * len(samples)
+            if self.cache is not None:
+                for i, (y_t, y_p) in enumerate(samples):
+                    keys[i] = self.cache.get_key(self.get_cache_name(), y_t, y_p)
+                    rewards[i] = self.cache.get(keys[i])
+            missing = [i for i, reward in enumerate(rewards) if reward is None]
+            if missing:
+                values = await self.call_on_batch(
+                    [samples[i][0] for i in missing],
+                    [samples[i][1] for i in missing],
+                )
+                for i, value in zip(missing, values):
+                    rewards[i] = reduce_values(value, reduction=self.reduction)
+                    if self.cache is not None:
+                        self.cache.put(keys[i], rewards[i])
+            return rewards
+
+    def get_cache_name(self):
+        """Returns the name of the reward in the keys of its cache.
+
+        The name is suffixed by a fingerprint of the reward configuration, so
+        the rewards with the same name but a different configuration (e.g.
+        another language model) don't share the cache entries.
+
+        Returns:
+            (str): The name of the reward and the fingerprint of its config.
+        """
+        if self._cache_name is None:
+            try:
+                config = self.get_config()
+            except NotImplementedError:
+                config = {}
+            # The options that don't change the rewards are left out.
+            config = {
+                key: value
+                for key, value in config.items()
+                if key not in ("cache", "max_concurrency")
+            }
+            canonical_json = json.dumps(
+                config,
+                sort_keys=True,
+                separators=(",", ":"),
+                ensure_ascii=False,
+                default=str,
+            )
+            fingerprint = hashlib.sha256(canonical_json.encode("utf-8")).hexdigest()
+            self._cache_name = f"{self.name}:{fingerprint[:16]}"
+        return self._cache_name
 
     async def call(self, y_true, y_pred):
         raise NotImplementedError
 
+    async def call_on_batch(self, y_true, y_pred):
+        """Computes the (unreduced) rewards of a batch of masked samples.
+
+        By default, `call()` is run concurrently on each sample, at most
+        `max_concurrency` at a time. Subclasses can override this method to
+        compute the rewards of the whole batch at once.
+
+        Args:
+            y_true (list): The batch of ground truths.
+            y_pred (list): The batch of predictions.
+
+        Returns:
+            (list): The list of rewards, one per sample.
+        """
+        return await self._gather(
+            [self.call(y_t, y_p) for y_t, y_p in zip(y_true, y_pred)]
+        )
+
+    async def _gather(self, coroutines):
+        # The semaphore is local to the call, so the nested calls (e.g. the
+        # fallbacks of a batched judge) don't wait for the slots they hold.
+        if self.max_concurrency is None:
+            return await asyncio.gather(*coroutines)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(coroutine):
+            async with semaphore:
+                return await coroutine
+
+        return await asyncio.gather(*[run(coroutine) for coroutine in coroutines])
+
     def get_config(self):
         return {
             "name": self.name,
             "reduction": self.reduction,
             "in_mask": self.in_mask,
             "out_mask": self.out_mask,
+            "cache": self.cache.get_config() if self.cache is not None else None,
+            "max_concurrency": self.max_concurrency,
         }
 
     @classmethod
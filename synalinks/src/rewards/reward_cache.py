@@ -0,0 +1,226 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import collections
+import hashlib
+import json
+import os
+
+from synalinks.src import tree
+from synalinks.src.api_export import synalinks_export
+from synalinks.src.utils import file_utils
+from synalinks.src.utils import json_codec
+
+
+@synalinks_export("synalinks.rewards.RewardCache")
+class RewardCache:
+    """Memoize the rewards computed for identical `(y_true, y_pred)` pairs.
+
+    Across epochs, many predictions repeat exactly (especially with low
+    temperature language models). The cache avoids re-computing expensive
+    rewards (like `LMAsJudge` or `CosineSimilarity`) for these pairs.
+
+    The entries are keyed by a hash of the reward name and configuration
+    (e.g. its language model or instructions) and of the canonical JSON of the
+    (masked) `y_true` and `y_pred`, so the rewards with a different
+    configuration don't share their entries. The most recently used entries
+    are kept in memory, up to `max_size`. If a `filepath` is provided, the
+    entries are also appended to a JSONL file and loaded back when the cache is
+    created, allowing to re-use them across runs. The file is compacted to the
+    entries kept in memory when loaded, and when it grows over twice `max_size`.
+
+    Example:
+
+    ```python
+    reward = synalinks.rewards.LMAsJudge(
+        language_model=language_model,
+        cache=synalinks.rewards.RewardCache(
+            max_size=10000,
+            filepath="lm_as_judge_cache.jsonl",
+        ),
+    )
+
+    # ... after training
+
+    print(reward.cache.get_stats())
+    ```
+
+    Args:
+        max_size (int): The maximum number of entries kept in memory
+            (Default to 1024).
+        filepath (str | os.PathLike): Optional. The path of the JSONL file used
+            to persist the entries. Must end in `.jsonl`.
+    """
+
+    def __init__(self, max_size=1024, filepath=None):
+        if max_size < 1:
+            raise ValueError(
+                "`max_size` should be a strictly positive integer, "
+                f"received max_size={max_size}"
+            )
+        if filepath is not None:
+            filepath = file_utils.path_to_string(filepath)
+            if not filepath.endswith(".jsonl"):
+                raise ValueError(
+                    "The filepath should ends with '.jsonl', "
+                    f"received filepath={filepath}"
+                )
+        self.max_size = max_size
+        self.filepath = filepath
+        self._entries = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._file = None
+        self._num_lines = 0
+        if self.filepath and file_utils.exists(self.filepath):
+            self._load()
+
+    def _load(self):
+        num_lines = 0
+        with open(self.filepath, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json_codec.loads(line)
+                except ValueError:
+                    # Partially written entry from an interrupted run.
+                    continue
+                num_lines += 1
+                self._entries[entry["key"]] = entry["reward"]
+                self._entries.move_to_end(entry["key"])
+                if len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+        self._num_lines = num_lines
+        if num_lines > len(self._entries):
+            self._compact()
+
+    def _compact(self):
+        """Rewrites the file with the entries kept in memory."""
+        self.close()
+        with open(self.filepath, "w", encoding="utf-8") as f:
+            for key, reward in self._entries.items():
+                f.write(json_codec.dumps({"key": key, "reward": reward}) + "\n")
+        self._num_lines = len(self._entries)
+
+    def get_key(self, name, y_true, y_pred):
+        """Computes the key of a `(y_true, y_pred)` pair.
+
+        Args:
+            name (str): The name of the reward, including the fingerprint of
+                its configuration (see `Reward.get_cache_name()`).
+            y_true (JsonDataModel | list): The (masked) ground truth.
+            y_pred (JsonDataModel | list): The (masked) prediction.
+
+        Returns:
+            (str): The hexadecimal digest of the canonical JSON of the pair.
+        """
+        y_true = tree.map_structure(lambda x: x.get_json(), y_true)
+        y_pred = tree.map_structure(lambda x: x.get_json(), y_pred)
+        canonical_json = json.dumps(
+            [name, y_true, y_pred],
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(canonical_json.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        """Returns the cached reward (or `None`) and updates the statistics."""
+        reward = self._entries.get(key)
+        if reward is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return reward
+
+    def put(self, key, reward):
+        """Stores a reward, evicting the least recently used entry if needed."""
+        self._entries[key] = reward
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        if self.filepath:
+            if self._num_lines >= 2 * self.max_size:
+                self._compact()
+            if self._file is None:
+                dirname = os.path.dirname(self.filepath)
+                if dirname and not file_utils.exists(dirname):
+                    file_utils.makedirs(dirname)
+                self._file = open(self.filepath, "a", encoding="utf-8")
+            self._file.write(json_codec.dumps({"key": key, "reward": reward}) + "\n")
+            self._file.flush()
+            self._num_lines += 1
+
+    def close(self):
+        """Closes the file of the cache (re-opened by the next `put()`)."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    @property
+    def hit_rate(self):
+        """The ratio of lookups that were found in the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get_stats(self):
+        """Returns the cache statistics.
+
+        Returns:
+            (dict): The number of `hits`, `misses`, the `hit_rate` and
+                the number of entries (`size`).
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "size": len(self),
+        }
+
+    def reset_stats(self):
+        """Resets the hits and misses counters."""
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        """Removes all the entries (in memory and on disk)."""
+        self._entries.clear()
+        self.reset_stats()
+        self.close()
+        self._num_lines = 0
+        if self.filepath and file_utils.exists(self.filepath):
+            file_utils.remove(self.filepath)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_config(self):
+        return {
+            "max_size": self.max_size,
+            "filepath": self.filepath,
+        }
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(**config)
+
+
+def get(identifier):
+    """Retrieves a `RewardCache` instance.
+
+    Args:
+        identifier: One of `None`/`False` (no cache), `True` (default cache),
+            a `RewardCache` configuration dict or a `RewardCache` instance.
+
+    Returns:
+        (RewardCache): The reward cache, or `None`.
+    """
+    if identifier is None or identifier is False:
+        return None
+    if identifier is True:
+        return RewardCache()
+    if isinstance(identifier, dict):
+        return RewardCache.from_config(identifier)
+    if isinstance(identifier, RewardCache):
+        return identifier
+    raise ValueError(f"Could not interpret reward cache identifier: {identifier}")
@@ -0,0 +1,139 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import os
+from unittest.mock import patch
+
+from synalinks.src import testing
+from synalinks.src.backend import DataModel
+from synalinks.src.backend import Field
+from synalinks.src.language_models import LanguageModel
+from synalinks.src.rewards.exact_match import ExactMatch
+from synalinks.src.rewards.lm_as_judge import LMAsJudge
+from synalinks.src.rewards.reward_cache import RewardCache
+
+
+class Answer(DataModel):
+    answer: str = Field(description="The correct answer")
+
+
+class AnswerWithText(DataModel):
+    text: str
+    answer: str
+
+
+class RewardCacheTest(testing.TestCase):
+    @patch("litellm.completion")
+    async def test_cache_hits_skip_the_reward_computation(self, mock_completion):
+        language_model = LanguageModel(model="ollama_chat/deepseek-r1")
+        reward = LMAsJudge(language_model=language_model, cache=True)
+
+        mock_completion.return_value = {
+            "choices": [
+                {
+                    "message": {
+                        "content": (
+                            """{"thinking": "The answer is correct", """
+                            """"critique": "The answer is correct", """
+                            """"reward": 1.0}"""
+                        )
+                    }
+                }
+            ]
+        }
+
+        y_true = Answer(answer="Paris")
+        y_pred = Answer(answer="Paris")
+        self.assertEqual(await reward(y_true, y_pred), 1.0)
+        call_count = mock_completion.call_count
+        self.assertEqual(await reward(y_true, y_pred), 1.0)
+        self.assertEqual(mock_completion.call_count, call_count)
+        self.assertEqual(
+            reward.cache.get_stats(),
+            {"hits": 1, "misses": 1, "hit_rate": 0.5, "size": 1},
+        )
+
+    async def test_cache_key_uses_masked_values(self):
+        reward = ExactMatch(in_mask=["answer"], cache=True)
+        y_true = Answer(answer="Paris")
+        y_pred = AnswerWithText(text="The capital is Paris", answer="Paris")
+        self.assertEqual(await reward(y_true, y_pred), 1.0)
+        y_pred = AnswerWithText(text="Paris is the capital", answer="Paris")
+        self.assertEqual(await reward(y_true, y_pred), 1.0)
+        self.assertEqual(reward.cache.hits, 1)
+        y_pred = AnswerWithText(text="Paris is the capital", answer="Toulouse")
+        self.assertEqual(await reward(y_true, y_pred), 0.0)
+        self.assertEqual(reward.cache.misses, 2)
+
+    async def test_lru_eviction(self):
+        reward = ExactMatch(cache=RewardCache(max_size=2))
+        y_true = Answer(answer="Paris")
+        for answer in ["Paris", "Toulouse", "Paris", "Lyon"]:
+            await reward(y_true, Answer(answer=answer))
+        self.assertEqual(len(reward.cache), 2)
+        # "Toulouse" is the least recently used entry
+        await reward(y_true, Answer(answer="Toulouse"))
+        self.assertEqual(reward.cache.hits, 1)
+        await reward(y_true, Answer(answer="Lyon"))
+        self.assertEqual(reward.cache.hits, 2)
+
+    async def test_persistence(self):
+        filepath = os.path.join(self.get_temp_dir(), "cache.jsonl")
+        reward = ExactMatch(cache=RewardCache(filepath=filepath))
+        y_true = Answer(answer="Paris")
+        await reward(y_true, Answer(answer="Paris"))
+        await reward(y_true, Answer(answer="Toulouse"))
+
+        reward = ExactMatch(cache=RewardCache(filepath=filepath))
+        self.assertEqual(len(reward.cache), 2)
+        self.assertEqual(await reward(y_true, Answer(answer="Toulouse")), 0.0)
+        self.assertEqual(reward.cache.hits, 1)
+
+        reward = ExactMatch(cache=RewardCache(max_size=1, filepath=filepath))
+        self.assertEqual(len(reward.cache), 1)
+        with open(filepath) as f:
+            self.assertEqual(len(f.readlines()), 1)
+
+    async def test_cache_key_uses_reward_config(self):
+        cache = RewardCache()
+        reward = ExactMatch(in_mask=["answer"], cache=cache)
+        other_reward = ExactMatch(out_mask=["text"], cache=cache)
+        self.assertEqual(reward.name, other_reward.name)
+        y_true = Answer(answer="Paris")
+        y_pred = Answer(answer="Paris")
+        self.assertNotEqual(
+            cache.get_key(reward.get_cache_name(), y_true, y_pred),
+            cache.get_key(other_reward.get_cache_name(), y_true, y_pred),
+        )
+        await reward(y_true, y_pred)
+        await other_reward(y_true, y_pred)
+        self.assertEqual(cache.misses, 2)
+
+    async def test_file_is_compacted(self):
+        filepath = os.path.join(self.get_temp_dir(), "cache.jsonl")
+        reward = ExactMatch(cache=RewardCache(max_size=2, filepath=filepath))
+        y_true = Answer(answer="Paris")
+        for answer in ["Paris", "Toulouse", "Lyon", "Nice", "Lille", "Nantes"]:
+            await reward(y_true, Answer(answer=answer))
+        reward.cache.close()
+        with open(filepath) as f:
+            self.assertLessEqual(len(f.readlines()), 4)
+
+    def test_get_config(self):
+        reward = ExactMatch(cache=RewardCache(max_size=16))
+        config = reward.get_config()
+        self.assertEqual(config["cache"], {"max_size": 16, "filepath": None})
+        new_reward = ExactMatch.from_config(config)
+        self.assertEqual(new_reward.cache.max_size, 16)
+
+    def test_invalid_filepath(self):
+        with self.assertRaisesRegex(ValueError, "jsonl"):
+            RewardCache(filepath="cache.json")
+
+    async def test_batch_call_uses_cache(self):
+        reward = ExactMatch(cache=True)
+        y_true = [Answer(answer="Paris"), Answer(answer="Paris")]
+        y_pred = [Answer(answer="Paris"), Answer(answer="Toulouse")]
+        self.assertEqual(await reward(y_true[0], y_pred[0]), 1.0)
+        self.assertEqual(await reward.batch_call(y_true, y_pred), [1.0, 0.0])
+        self.assertEqual(reward.cache.hits, 1)
+        self.assertEqual(reward.cache.misses, 2)
@@ -0,0 +1,45 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import asyncio
+
+from synalinks.src import testing
+from synalinks.src.backend import DataModel
+from synalinks.src.rewards.exact_match import ExactMatch
+from synalinks.src.rewards.reward_wrappers import RewardFunctionWrapper
+
+
+class Answer(DataModel):
+    answer: str
+
+
+class RewardTest(testing.TestCase):
+    async def test_batch_call_max_concurrency(self):
+        running = []
+        max_running = []
+
+        async def slow_match(y_true, y_pred):
+            running.append(None)
+            max_running.append(len(running))
+            await asyncio.sleep(0.01)
+            running.pop()
+            return float(y_true.get("answer") == y_pred.get("answer"))
+
+        reward = RewardFunctionWrapper(fn=slow_match, max_concurrency=2)
+        y_true = [Answer(answer="Paris")] * 6
+        y_pred = [Answer(answer="Paris")] * 3 + [Answer(answer="Toulouse")] * 3
+        rewards = await reward.batch_call(y_true, y_pred)
+        self.assertEqual(rewards, [1.0, 1.0, 1.0, 0.0, 0.0, 0.0])
+        self.assertEqual(max(max_running), 2)
+
+    def test_max_concurrency_config(self):
+        reward = ExactMatch(max_concurrency=4)
+        config = reward.get_config()
+        self.assertEqual(config["max_concurrency"], 4)
+        self.assertEqual(ExactMatch.from_config(config).max_concurrency, 4)
+        self.assertEqual(
+            reward.get_cache_name(), ExactMatch(max_concurrency=None).get_cache_name()
+        )
+
+    def test_invalid_max_concurrency(self):
+        with self.assertRaisesRegex(ValueError, "max_concurrency"):
+            ExactMatch(max_concurrency=0)
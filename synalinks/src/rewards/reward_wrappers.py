@@ -31,19 +31,29 @@ class RewardFunctionWrapper(Reward):
     Args:
         fn (callable): The reward function to wrap, with signature
             `fn(y_true, y_pred, **kwargs)`.
+        batch_fn (callable): Optional. A batched version of `fn`, with signature
+            `batch_fn(y_true, y_pred, **kwargs)` taking lists of samples and
+            returning the list of rewards. Used by `batch_call()`.
         name (str): Optional. string name of the reward instance.
         in_mask (list): Optional. list of keys to keep to compute the reward.
         out_mask (list): Optional. list of keys to remove to compute the reward.
+        cache (RewardCache): Optional. The cache used to memoize the rewards
+            (see `RewardCache`).
+        max_concurrency (int): Optional. The maximum number of samples whose
+            reward is computed concurrently by `batch_call()` (Default to 16).
         **kwargs (keyword arguments): Keyword arguments to pass on to `fn`.
     """
 
     def __init__(
         self,
         fn,
+        batch_fn=None,
         reduction="mean",
         name=None,
         in_mask=None,
         out_mask=None,
+        cache=None,
+        max_concurrency=16,
         **kwargs,
     ):
         super().__init__(
@@ -51,16 +61,28 @@ class RewardFunctionWrapper(Reward):
             reduction=reduction,
             in_mask=in_mask,
             out_mask=out_mask,
+            cache=cache,
+            max_concurrency=max_concurrency,
         )
         self.fn = fn
+        self.batch_fn = batch_fn
         self._fn_kwargs = kwargs
 
     async def call(self, y_true, y_pred):
         return await self.fn(y_true, y_pred, **self._fn_kwargs)
 
+    async def call_on_batch(self, y_true, y_pred):
+        if self.batch_fn is None:
+            return await super().call_on_batch(y_true, y_pred)
+        return await self.batch_fn(y_true, y_pred, **self._fn_kwargs)
+
     def get_config(self):
         config = super().get_config()
         config.update({"fn": serialization_lib.serialize_synalinks_object(self.fn)})
+        if self.batch_fn is not None:
+            config.update(
+                {"batch_fn": serialization_lib.serialize_synalinks_object(self.batch_fn)}
+            )
         config.update(serialization_lib.serialize_synalinks_object(self._fn_kwargs))
         return config
 
@@ -104,6 +126,10 @@ class ProgramAsJudge(Reward):
         name (str): Optional. string name of the reward instance.
         in_mask (list): Optional. list of keys to keep to compute the reward.
         out_mask (list): Optional. list of keys to remove to compute the reward.
+        cache (RewardCache): Optional. The cache used to memoize the rewards
+            (see `RewardCache`).
+        max_concurrency (int): Optional. The maximum number of samples whose
+            reward is computed concurrently by `batch_call()` (Default to 16).
     """
 
     def __init__(
@@ -113,12 +139,16 @@ class ProgramAsJudge(Reward):
         name=None,
         in_mask=None,
         out_mask=None,
+        cache=None,
+        max_concurrency=16,
     ):
         super().__init__(
             name=name,
             reduction=reduction,
             in_mask=in_mask,
             out_mask=out_mask,
+            cache=cache,
+            max_concurrency=max_concurrency,
         )
         self.program = program
 
@@ -0,0 +1,172 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import collections
+import contextlib
+import gzip
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from synalinks.src.utils import file_utils
+from synalinks.src.utils import json_codec
+
+
+class CheckpointWriter:
+    """Writes the checkpoints in a background thread.
+
+    The writes are executed in order by a single worker thread, so the training
+    loop doesn't wait on the serialization and the disk. When `max_pending_writes`
+    writes are pending, `submit()` waits for the oldest one to finish, bounding
+    the memory used by the snapshots waiting to be written.
+
+    The errors raised by a write are re-raised by the next call to `submit()`
+    or `wait()`.
+
+    Example:
+
+    ```python
+    writer = CheckpointWriter(max_pending_writes=2)
+    writer.submit(write_json, "state.variables.json", snapshot_json(state))
+    # ...
+    writer.wait()
+    ```
+
+    Args:
+        max_pending_writes (int): The maximum number of pending writes
+            (Default to 2).
+    """
+
+    def __init__(self, max_pending_writes=2):
+        if max_pending_writes < 1:
+            raise ValueError(
+                "`max_pending_writes` should be a strictly positive integer, "
+                f"received max_pending_writes={max_pending_writes}"
+            )
+        self.max_pending_writes = max_pending_writes
+        self._executor = None
+        self._pending = collections.deque()
+
+    @property
+    def pending_writes(self):
+        """The number of writes not finished yet."""
+        return sum(not future.done() for future in self._pending)
+
+    def submit(self, fn, *args, **kwargs):
+        """Schedules `fn(*args, **kwargs)` in the background thread.
+
+        The arguments should not be modified afterwards: use `snapshot_json()`
+        to get a copy of the values that are modified in place.
+        """
+        while self._pending and self._pending[0].done():
+            self._pending.popleft().result()
+        while len(self._pending) >= self.max_pending_writes:
+            self._pending.popleft().result()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="synalinks_checkpoint_writer"
+            )
+        self._pending.append(self._executor.submit(fn, *args, **kwargs))
+
+    def wait(self):
+        """Waits for all the pending writes to finish."""
+        while self._pending:
+            self._pending.popleft().result()
+
+    def close(self):
+        """Waits for the pending writes and stops the background thread."""
+        try:
+            self.wait()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+
+def snapshot_json(json):
+    """Returns a snapshot of a JSON value that can be written later.
+
+    The JSON values are never modified in place, except for the variables
+    dicts (by `Variable.update()`), the lists they hold (e.g. the predictions
+    appended by the generators) and the dicts of these lists (e.g. the reward
+    set on the predictions by the optimizers). The dicts and lists are copied,
+    the other values (strings, numbers) being shared with the original.
+
+    Args:
+        json (dict): A JSON value or a state tree.
+
+    Returns:
+        (dict): The snapshot.
+    """
+    if isinstance(json, dict):
+        return {key: snapshot_json(value) for key, value in json.items()}
+    if isinstance(json, list):
+        return [snapshot_json(value) for value in json]
+    return json
+
+
+@contextlib.contextmanager
+def atomic_open(filepath):
+    """Opens a binary file to be written atomically.
+
+    The content is written to a temporary file that replaces the target file
+    once complete, so an interrupted write never leaves a partial file.
+
+    Example:
+
+    ```python
+    with atomic_open("program.synalinks") as f:
+        f.write(data)
+    ```
+
+    Args:
+        filepath (str): The path of the file.
+    """
+    dirname = os.path.dirname(filepath)
+    if dirname and not file_utils.exists(dirname):
+        file_utils.makedirs(dirname)
+    tmp_filepath = f"{filepath}.tmp{os.getpid()}"
+    try:
+        with open(tmp_filepath, "wb") as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_filepath, filepath)
+    finally:
+        if file_utils.exists(tmp_filepath):
+            file_utils.remove(tmp_filepath)
+
+
+def write_file(filepath, text):
+    """Writes a text file atomically (see `atomic_open()`).
+
+    Files ending in `.gz` are compressed with gzip.
+
+    Args:
+        filepath (str): The path of the file.
+        text (str): The content to write.
+    """
+    data = text.encode("utf-8")
+    if filepath.endswith(".gz"):
+        data = gzip.compress(data, compresslevel=6, mtime=0)
+    with atomic_open(filepath) as f:
+        f.write(data)
+
+
+def read_file(filepath):
+    """Reads a text file, decompressing the files ending in `.gz`.
+
+    Args:
+        filepath (str): The path of the file.
+
+    Returns:
+        (str): The content of the file.
+    """
+    with open(filepath, "rb") as f:
+        data = f.read()
+    if filepath.endswith(".gz"):
+        data = gzip.decompress(data)
+    return data.decode("utf-8")
+
+
+def write_json(filepath, json):
+    """Encodes a JSON value and writes it atomically (see `write_file()`)."""
+    write_file(filepath, json_codec.dumps(json))
@@ -0,0 +1,142 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import os
+import threading
+from unittest.mock import patch
+
+from synalinks.src import optimizers
+from synalinks.src import rewards
+from synalinks.src import testing
+from synalinks.src.backend import DataModel
+from synalinks.src.callbacks.program_checkpoint import ProgramCheckpoint
+from synalinks.src.language_models import LanguageModel
+from synalinks.src.modules import Generator
+from synalinks.src.modules import Input
+from synalinks.src.programs import Program
+from synalinks.src.saving import checkpoint_writer
+from synalinks.src.saving.incremental_checkpoint import IncrementalCheckpoint
+from synalinks.src.testing import test_utils
+
+
+class Query(DataModel):
+    query: str
+
+
+class Answer(DataModel):
+    answer: str
+
+
+class CheckpointWriterTest(testing.TestCase):
+    def test_writes_are_ordered_and_bounded(self):
+        writer = checkpoint_writer.CheckpointWriter(max_pending_writes=2)
+        release = threading.Event()
+        written = []
+
+        def write(i):
+            release.wait()
+            written.append(i)
+
+        writer.submit(write, 0)
+        writer.submit(write, 1)
+        self.assertEqual(writer.pending_writes, 2)
+        # The third write waits for the first one to finish
+        threading.Timer(0.1, release.set).start()
+        writer.submit(write, 2)
+        self.assertIn(0, written)
+        writer.close()
+        self.assertEqual(written, [0, 1, 2])
+        self.assertEqual(writer.pending_writes, 0)
+
+    def test_errors_are_raised(self):
+        writer = checkpoint_writer.CheckpointWriter()
+
+        def write():
+            raise OSError("No space left on device")
+
+        writer.submit(write)
+        with self.assertRaisesRegex(OSError, "No space left"):
+            writer.wait()
+        writer.close()
+
+    def test_write_file(self):
+        dirname = os.path.join(self.get_temp_dir(), "dir")
+        for filename in ("state.json", "state.json.gz"):
+            filepath = os.path.join(dirname, filename)
+            checkpoint_writer.write_json(filepath, {"answer": "Paris"})
+            checkpoint_writer.write_json(filepath, {"answer": "Toulouse"})
+            self.assertEqual(
+                checkpoint_writer.read_file(filepath), '{"answer":"Toulouse"}'
+            )
+        # No temporary file is left behind
+        self.assertEqual(sorted(os.listdir(dirname)), ["state.json", "state.json.gz"])
+
+    def test_snapshot_json(self):
+        predictions = [{"answer": "Paris"}]
+        state = {"variable": {"predictions": predictions, "examples": []}}
+        snapshot = checkpoint_writer.snapshot_json(state)
+        state["variable"].update({"examples": predictions})
+        predictions.append({"answer": "Toulouse"})
+        predictions[0]["reward"] = 1.0
+        self.assertEqual(
+            snapshot, {"variable": {"predictions": [{"answer": "Paris"}], "examples": []}}
+        )
+        self.assertIsNot(snapshot["variable"]["predictions"][0], predictions[0])
+
+    @patch("litellm.completion")
+    async def test_background_program_checkpoint(self, mock_completion):
+        inputs = Input(data_model=Query)
+        outputs = await Generator(
+            data_model=Answer,
+            language_model=LanguageModel(model="ollama/mistral"),
+        )(inputs)
+        program = Program(inputs=inputs, outputs=outputs, name="qa")
+        program.compile(
+            reward=rewards.ExactMatch(in_mask=["answer"]),
+            optimizer=optimizers.RandomFewShot(),
+        )
+        (x_train, y_train), _ = test_utils.load_test_data()
+        mock_completion.return_value = {
+            "choices": [{"message": {"content": '{"answer": "Paris"}'}}]
+        }
+        filepath = os.path.join(self.get_temp_dir(), "program.json.gz")
+        variables_filepath = os.path.join(
+            self.get_temp_dir(), "program.variables.json.gz"
+        )
+        incremental_filepath = os.path.join(self.get_temp_dir(), "checkpoints.jsonl")
+        checkpoint = ProgramCheckpoint(filepath=filepath, background=True)
+        _ = await program.fit(
+            x=x_train,
+            y=y_train,
+            epochs=2,
+            callbacks=[
+                checkpoint,
+                ProgramCheckpoint(
+                    filepath=variables_filepath,
+                    save_variables_only=True,
+                    background=True,
+                ),
+                ProgramCheckpoint(
+                    filepath=incremental_filepath,
+                    incremental=True,
+                    background=True,
+                ),
+            ],
+        )
+        # The background thread is stopped at the end of the training
+        self.assertIsNone(checkpoint._writer._executor)
+        examples = [v.get("examples") for v in program.trainable_variables]
+
+        loaded_program = Program.load(filepath)
+        self.assertEqual(
+            [v.get("examples") for v in loaded_program.trainable_variables], examples
+        )
+        loaded_program.load_variables(variables_filepath)
+        self.assertEqual(
+            [v.get("examples") for v in loaded_program.trainable_variables], examples
+        )
+        checkpoint = IncrementalCheckpoint(incremental_filepath)
+        self.assertEqual(len(checkpoint.checkpoints), 2)
+        restored_program = checkpoint.restore()
+        self.assertEqual(
+            [v.get("examples") for v in restored_program.trainable_variables], examples
+        )
@@ -0,0 +1,421 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import hashlib
+import os
+import re
+
+from synalinks.src.api_export import synalinks_export
+from synalinks.src.saving.checkpoint_writer import snapshot_json
+from synalinks.src.utils import file_utils
+from synalinks.src.utils import json_codec
+
+# The records start with their checkpoint number (see `IncrementalCheckpoint.save()`)
+RECORD_PREFIX = re.compile(rb'^\{"checkpoint":(\d+),')
+
+VARIABLE_KINDS = (
+    "trainable_variables",
+    "non_trainable_variables",
+    "optimizer_variables",
+    "metrics_variables",
+)
+
+
+@synalinks_export("synalinks.saving.IncrementalCheckpoint")
+class IncrementalCheckpoint:
+    """Append-only checkpoint log only writing the variables that changed.
+
+    Each checkpoint is appended to `filepath` as a JSON line holding the
+    variables modified since the previous checkpoint (a delta). Every
+    `snapshot_freq` checkpoints, a full snapshot of the variables is written
+    instead, so restoring any checkpoint only replays the deltas since the
+    previous snapshot. The byte offsets of the checkpoints are kept in an index
+    (`filepath + ".index"`), allowing to read only the needed lines.
+
+    If `max_snapshots` is set, the log is compacted when it holds more
+    snapshots: the checkpoints written before the oldest kept snapshot are
+    dropped. The compacted log is written before its index, and the offsets of
+    the index are checked against the log when it is read, so an index left
+    out of date by an interrupted compaction is recovered.
+
+    The variables changes are tracked with a digest of their JSON, so the
+    values modified in place (e.g. the predictions appended by the generators)
+    are also detected.
+
+    Example:
+
+    ```python
+    checkpoint = synalinks.saving.IncrementalCheckpoint("checkpoints.jsonl")
+
+    for epoch in range(epochs):
+        await program.fit(x=x_train, y=y_train, epochs=1)
+        checkpoint.save(program, metadata={"epoch": epoch})
+
+    # Restore the variables of the third checkpoint
+    checkpoint.restore(program, checkpoint=2)
+    ```
+
+    Args:
+        filepath (str | os.PathLike): The path of the checkpoint log.
+            Must end in `.jsonl`.
+        snapshot_freq (int): The number of checkpoints between two full snapshots
+            (Default to 10).
+        max_snapshots (int): Optional. The maximum number of snapshots kept in
+            the log. If `None`, all the checkpoints are kept.
+        save_program_config (bool): Whether to write the program config with the
+            snapshots, allowing to restore the program without instantiating it
+            first (Default to `True`).
+    """
+
+    def __init__(
+        self,
+        filepath,
+        snapshot_freq=10,
+        max_snapshots=None,
+        save_program_config=True,
+    ):
+        filepath = file_utils.path_to_string(filepath)
+        if not filepath.endswith(".jsonl"):
+            raise ValueError(
+                f"The filepath should ends with '.jsonl', received filepath={filepath}"
+            )
+        if snapshot_freq < 1:
+            raise ValueError(
+                "`snapshot_freq` should be a strictly positive integer, "
+                f"received snapshot_freq={snapshot_freq}"
+            )
+        if max_snapshots is not None and max_snapshots < 1:
+            raise ValueError(
+                "`max_snapshots` should be a strictly positive integer, "
+                f"received max_snapshots={max_snapshots}"
+            )
+        self.filepath = filepath
+        self.index_filepath = filepath + ".index"
+        self.snapshot_freq = snapshot_freq
+        self.max_snapshots = max_snapshots
+        self.save_program_config = save_program_config
+        # The variables signatures at the last checkpoint, by (kind, path)
+        self._signatures = None
+        self._index = self._read_index()
+        self._next_checkpoint = self._index[-1]["checkpoint"] + 1 if self._index else 0
+        last_snapshot = self._last_snapshot()
+        self._last_snapshot_checkpoint = last_snapshot and last_snapshot["checkpoint"]
+
+    def _read_index(self):
+        self._index_size = 0
+        if not file_utils.exists(self.index_filepath):
+            return []
+        entries = []
+        with open(self.index_filepath, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # Partially written entry from an interrupted run.
+                    break
+                entries.append((json_codec.loads(line), len(line)))
+        size = os.path.getsize(self.filepath) if file_utils.exists(self.filepath) else 0
+        if not entries or not size:
+            return []
+        with open(self.filepath, "rb") as f:
+            if not _is_valid_entry(f, entries[0][0], size):
+                # The compaction was interrupted after replacing the log, the
+                # index still has the offsets of the previous log.
+                return self._recover_index([entry for entry, _ in entries], f, size)
+            index = []
+            for entry, line_size in entries:
+                if not _is_valid_entry(f, entry, size):
+                    # Record not written by an interrupted run.
+                    break
+                index.append(entry)
+                self._index_size += line_size
+        return index
+
+    def _recover_index(self, entries, f, size):
+        f.seek(0)
+        match = RECORD_PREFIX.match(f.read(64))
+        first = None
+        if match:
+            checkpoint = int(match.group(1))
+            first = next((e for e in entries if e["checkpoint"] == checkpoint), None)
+        if first is None:
+            raise ValueError(
+                f"The index {self.index_filepath} doesn't match "
+                f"the checkpoint log {self.filepath}"
+            )
+        index = []
+        for entry in entries:
+            if entry["checkpoint"] < first["checkpoint"]:
+                continue
+            entry = {**entry, "offset": entry["offset"] - first["offset"]}
+            if not _is_valid_entry(f, entry, size):
+                break
+            index.append(entry)
+        self._write_index(index)
+        return index
+
+    def _write_index(self, index):
+        index_data = b"".join(
+            (json_codec.dumps(entry) + "\n").encode("utf-8") for entry in index
+        )
+        tmp_index_filepath = self.index_filepath + ".tmp"
+        with open(tmp_index_filepath, "wb") as f:
+            f.write(index_data)
+        os.replace(tmp_index_filepath, self.index_filepath)
+        self._index_size = len(index_data)
+
+    @property
+    def checkpoints(self):
+        """The index entries of the checkpoints in the log.
+
+        Each entry holds the `checkpoint` number, whether it is a `snapshot` and
+        the `metadata` given when saving it.
+        """
+        return [
+            {
+                "checkpoint": entry["checkpoint"],
+                "snapshot": entry["snapshot"],
+                "metadata": entry["metadata"],
+            }
+            for entry in self._index
+        ]
+
+    def save(self, program, metadata=None, writer=None):
+        """Appends a checkpoint of the program variables to the log.
+
+        Args:
+            program (Program): The program to checkpoint.
+            metadata (dict): Optional. JSON serializable metadata saved with the
+                checkpoint (e.g. the epoch or the logs).
+            writer (CheckpointWriter): Optional. If provided, the checkpoint is
+                written in the background by this writer, call `writer.wait()`
+                before reading the log.
+
+        Returns:
+            (int): The checkpoint number.
+        """
+        checkpoint = self._next_checkpoint
+        snapshot = (
+            self._signatures is None
+            or self._last_snapshot_checkpoint is None
+            or checkpoint - self._last_snapshot_checkpoint >= self.snapshot_freq
+        )
+        signatures = {}
+        variables = {}
+        for kind, variable_list in _get_variables(program).items():
+            variables[kind] = {}
+            for variable in variable_list:
+                signature = _get_signature(variable)
+                signatures[(kind, variable.path)] = signature
+                if snapshot or self._signatures.get((kind, variable.path)) != signature:
+                    variables[kind][variable.path] = snapshot_json(variable.get_json())
+        record = {"checkpoint": checkpoint, "variables": variables}
+        if snapshot and self.save_program_config:
+            from synalinks.src.saving import serialization_lib
+
+            record["config"] = serialization_lib.serialize_synalinks_object(program)
+        if writer is not None:
+            writer.submit(self._write, record, snapshot, metadata)
+        else:
+            self._write(record, snapshot, metadata)
+        self._signatures = signatures
+        self._next_checkpoint = checkpoint + 1
+        if snapshot:
+            self._last_snapshot_checkpoint = checkpoint
+        return checkpoint
+
+    def _write(self, record, snapshot, metadata):
+        self._append(record, snapshot=snapshot, metadata=metadata)
+        if self.max_snapshots is not None:
+            snapshots = [entry for entry in self._index if entry["snapshot"]]
+            if len(snapshots) > self.max_snapshots:
+                self.compact(snapshots[-self.max_snapshots]["checkpoint"])
+
+    def _last_snapshot(self, checkpoint=None):
+        for entry in reversed(self._index):
+            if entry["snapshot"] and (
+                checkpoint is None or entry["checkpoint"] <= checkpoint
+            ):
+                return entry
+        return None
+
+    def _append(self, record, snapshot, metadata):
+        dirname = os.path.dirname(self.filepath)
+        if dirname and not file_utils.exists(dirname):
+            file_utils.makedirs(dirname)
+        data = (json_codec.dumps(record) + "\n").encode("utf-8")
+        offset = (
+            self._index[-1]["offset"] + self._index[-1]["length"] if self._index else 0
+        )
+        # Drop any record written after the last indexed one
+        with _open_truncated(self.filepath, offset) as f:
+            f.write(data)
+        entry = {
+            "checkpoint": record["checkpoint"],
+            "snapshot": snapshot,
+            "offset": offset,
+            "length": len(data),
+            "metadata": metadata,
+        }
+        data = (json_codec.dumps(entry) + "\n").encode("utf-8")
+        with _open_truncated(self.index_filepath, self._index_size) as f:
+            f.write(data)
+        self._index.append(entry)
+        self._index_size += len(data)
+
+    def _read_records(self, entries):
+        records = []
+        with open(self.filepath, "rb") as f:
+            for entry in entries:
+                f.seek(entry["offset"])
+                records.append(json_codec.loads(f.read(entry["length"])))
+        return records
+
+    def _get_entries(self, checkpoint=None):
+        if not self._index:
+            raise ValueError(f"No checkpoint found in {self.filepath}")
+        if checkpoint is None:
+            checkpoint = self._index[-1]["checkpoint"]
+        elif checkpoint < 0:
+            checkpoint = self._index[checkpoint]["checkpoint"]
+        snapshot = self._last_snapshot(checkpoint)
+        if snapshot is None or checkpoint > self._index[-1]["checkpoint"]:
+            raise ValueError(
+                f"Checkpoint {checkpoint} not found in {self.filepath}, "
+                f"available checkpoints: {[e['checkpoint'] for e in self._index]}"
+            )
+        return [
+            entry
+            for entry in self._index
+            if snapshot["checkpoint"] <= entry["checkpoint"] <= checkpoint
+        ]
+
+    def load_state_tree(self, checkpoint=None):
+        """Reads the state tree of a checkpoint.
+
+        Args:
+            checkpoint (int): Optional. The checkpoint number, negative numbers
+                index the checkpoints from the last one. Default to the last one.
+
+        Returns:
+            (dict): The state tree, as returned by `program.get_state_tree()`.
+        """
+        flat_state = {kind: {} for kind in VARIABLE_KINDS}
+        for record in self._read_records(self._get_entries(checkpoint)):
+            for kind, variables in record["variables"].items():
+                flat_state[kind].update(variables)
+        return {
+            kind: _to_nested_dict(variables)
+            for kind, variables in flat_state.items()
+            if variables
+        }
+
+    def restore(self, program=None, checkpoint=None, custom_objects=None):
+        """Restores the variables of a checkpoint.
+
+        Args:
+            program (Program): Optional. The program to restore. If `None`, the
+                program is deserialized from the config of the snapshot.
+            checkpoint (int): Optional. The checkpoint number, negative numbers
+                index the checkpoints from the last one. Default to the last one.
+            custom_objects (dict): Optional dictionary mapping names
+                (strings) to custom classes or functions to be
+                considered during deserialization.
+
+        Returns:
+            (Program): The restored program.
+        """
+        if program is None:
+            from synalinks.src.saving import serialization_lib
+
+            snapshot = self._read_records(self._get_entries(checkpoint)[:1])[0]
+            if "config" not in snapshot:
+                raise ValueError(
+                    "The checkpoint doesn't hold the program config, "
+                    "provide the `program` to restore."
+                )
+            program = serialization_lib.deserialize_synalinks_object(
+                snapshot["config"], custom_objects=custom_objects
+            )
+        state_tree = self.load_state_tree(checkpoint)
+        if not program.optimizer:
+            state_tree.pop("optimizer_variables", None)
+        program.set_state_tree(state_tree)
+        # Start from a snapshot on the next save
+        self._signatures = None
+        return program
+
+    def compact(self, checkpoint=None):
+        """Drops the checkpoints written before a snapshot.
+
+        Args:
+            checkpoint (int): Optional. The checkpoint from which to keep the
+                log. The log is kept from the snapshot preceding it. Default to
+                the last snapshot.
+        """
+        entries = self._get_entries(checkpoint)
+        first = entries[0]
+        kept = [
+            entry for entry in self._index if entry["checkpoint"] >= first["checkpoint"]
+        ]
+        with open(self.filepath, "rb") as f:
+            f.seek(first["offset"])
+            data = f.read()
+        tmp_filepath = self.filepath + ".tmp"
+        with open(tmp_filepath, "wb") as f:
+            f.write(data)
+        # The index is replaced last: if interrupted before, its offsets don't
+        # match the compacted log, which is detected and recovered when read.
+        os.replace(tmp_filepath, self.filepath)
+        index = [{**entry, "offset": entry["offset"] - first["offset"]} for entry in kept]
+        self._write_index(index)
+        self._index = index
+
+
+def _open_truncated(filepath, size):
+    f = open(filepath, "r+b" if file_utils.exists(filepath) else "wb")
+    f.truncate(size)
+    f.seek(size)
+    return f
+
+
+def _get_variables(program):
+    variables = {
+        "trainable_variables": program.trainable_variables,
+        "non_trainable_variables": program.non_trainable_variables,
+        "metrics_variables": program.metrics_variables,
+    }
+    if program.optimizer:
+        variables["optimizer_variables"] = program.optimizer.variables
+    return variables
+
+
+def _get_signature(variable):
+    """Returns the signature of the variable state.
+
+    A digest of the variable JSON, so the values modified in place at any depth
+    are detected, whether or not they went through `Variable.update()`.
+    """
+    data = json_codec.dumps(variable.get_json()).encode("utf-8")
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _is_valid_entry(f, entry, size):
+    """Checks that an index entry points to its record in the log."""
+    end = entry["offset"] + entry["length"]
+    if entry["offset"] < 0 or end > size:
+        return False
+    f.seek(end - 1)
+    if f.read(1) != b"\n":
+        return False
+    f.seek(entry["offset"])
+    match = RECORD_PREFIX.match(f.read(64))
+    return match is not None and int(match.group(1)) == entry["checkpoint"]
+
+
+def _to_nested_dict(variables):
+    nested_dict = {}
+    for path, value in variables.items():
+        parts = path.split("/")
+        current_dict = nested_dict
+        for part in parts[:-1]:
+            current_dict = current_dict.setdefault(part, {})
+        current_dict[parts[-1]] = value
+    return nested_dict
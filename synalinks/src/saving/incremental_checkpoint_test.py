@@ -0,0 +1,196 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import os
+from unittest.mock import patch
+
+from synalinks.src import optimizers
+from synalinks.src import rewards
+from synalinks.src import testing
+from synalinks.src.backend import DataModel
+from synalinks.src.callbacks.program_checkpoint import ProgramCheckpoint
+from synalinks.src.language_models import LanguageModel
+from synalinks.src.modules import Generator
+from synalinks.src.modules import Input
+from synalinks.src.programs import Program
+from synalinks.src.saving.incremental_checkpoint import IncrementalCheckpoint
+from synalinks.src.testing import test_utils
+
+
+class Query(DataModel):
+    query: str
+
+
+class Answer(DataModel):
+    answer: str
+
+
+async def build_program():
+    language_model = LanguageModel(model="ollama/mistral")
+    inputs = Input(data_model=Query)
+    outputs = await Generator(
+        data_model=Answer,
+        language_model=language_model,
+    )(inputs)
+    return Program(inputs=inputs, outputs=outputs, name="qa")
+
+
+def get_examples(program):
+    return [v.get("examples") for v in program.trainable_variables]
+
+
+class IncrementalCheckpointTest(testing.TestCase):
+    async def test_only_changed_variables_are_written(self):
+        program = await build_program()
+        filepath = os.path.join(self.get_temp_dir(), "checkpoints.jsonl")
+        checkpoint = IncrementalCheckpoint(filepath)
+
+        self.assertEqual(checkpoint.save(program), 0)
+        self.assertEqual(checkpoint.save(program), 1)
+        variable = program.trainable_variables[0]
+        variable.update({"examples": [{"inputs": {"query": "a"}}]})
+        self.assertEqual(checkpoint.save(program), 2)
+        variable.get("predictions").append({"inputs": {"query": "b"}})
+        self.assertEqual(checkpoint.save(program), 3)
+
+        records = checkpoint._read_records(checkpoint._index)
+        self.assertIn("config", records[0])
+        self.assertTrue(records[0]["variables"]["trainable_variables"])
+        self.assertEqual(records[1]["variables"]["trainable_variables"], {})
+        self.assertEqual(
+            list(records[2]["variables"]["trainable_variables"]), [variable.path]
+        )
+        self.assertEqual(
+            list(records[3]["variables"]["trainable_variables"]), [variable.path]
+        )
+        self.assertEqual(
+            [c["snapshot"] for c in checkpoint.checkpoints],
+            [True, False, False, False],
+        )
+
+    async def test_restore_any_checkpoint(self):
+        program = await build_program()
+        filepath = os.path.join(self.get_temp_dir(), "checkpoints.jsonl")
+        checkpoint = IncrementalCheckpoint(filepath, snapshot_freq=2)
+        variable = program.trainable_variables[0]
+        for i in range(5):
+            variable.update({"examples": [{"inputs": {"query": str(i)}}]})
+            checkpoint.save(program, metadata={"epoch": i})
+        self.assertEqual(
+            [c["snapshot"] for c in checkpoint.checkpoints],
+            [True, False, True, False, True],
+        )
+
+        checkpoint = IncrementalCheckpoint(filepath)
+        checkpoint.restore(program, checkpoint=3)
+        self.assertEqual(get_examples(program), [[{"inputs": {"query": "3"}}]])
+        checkpoint.restore(program, checkpoint=-1)
+        self.assertEqual(get_examples(program), [[{"inputs": {"query": "4"}}]])
+
+        restored_program = checkpoint.restore(checkpoint=1)
+        self.assertEqual(get_examples(restored_program), [[{"inputs": {"query": "1"}}]])
+
+        with self.assertRaises(ValueError):
+            checkpoint.restore(program, checkpoint=5)
+
+    async def test_compaction(self):
+        program = await build_program()
+        filepath = os.path.join(self.get_temp_dir(), "checkpoints.jsonl")
+        checkpoint = IncrementalCheckpoint(filepath, snapshot_freq=2, max_snapshots=1)
+        variable = program.trainable_variables[0]
+        for i in range(5):
+            variable.update({"examples": [{"inputs": {"query": str(i)}}]})
+            checkpoint.save(program)
+        self.assertEqual([c["checkpoint"] for c in checkpoint.checkpoints], [4])
+        self.assertEqual(os.path.getsize(filepath), checkpoint._index[-1]["length"])
+        checkpoint.restore(program)
+        self.assertEqual(get_examples(program), [[{"inputs": {"query": "4"}}]])
+
+    async def test_interrupted_compaction(self):
+        program = await build_program()
+        filepath = os.path.join(self.get_temp_dir(), "checkpoints.jsonl")
+        checkpoint = IncrementalCheckpoint(filepath, snapshot_freq=2)
+        variable = program.trainable_variables[0]
+        for i in range(5):
+            variable.update({"examples": [{"inputs": {"query": str(i)}}]})
+            checkpoint.save(program)
+        with open(filepath + ".index", "rb") as f:
+            index_data = f.read()
+        checkpoint.compact(3)
+        # Interrupted after replacing the log, before replacing the index
+        with open(filepath + ".index", "wb") as f:
+            f.write(index_data)
+
+        checkpoint = IncrementalCheckpoint(filepath)
+        self.assertEqual([c["checkpoint"] for c in checkpoint.checkpoints], [2, 3, 4])
+        checkpoint.restore(program, checkpoint=3)
+        self.assertEqual(get_examples(program), [[{"inputs": {"query": "3"}}]])
+        self.assertEqual(checkpoint.save(program), 5)
+        checkpoint = IncrementalCheckpoint(filepath)
+        self.assertEqual([c["checkpoint"] for c in checkpoint.checkpoints], [2, 3, 4, 5])
+
+    async def test_nested_in_place_changes_are_written(self):
+        program = await build_program()
+        filepath = os.path.join(self.get_temp_dir(), "checkpoints.jsonl")
+        checkpoint = IncrementalCheckpoint(filepath)
+        variable = program.trainable_variables[0]
+        variable.update({"examples": [{"inputs": {"query": "a"}, "reward": 0.0}]})
+        checkpoint.save(program)
+        variable.get("examples")[0]["reward"] = 1.0
+        checkpoint.save(program)
+        records = checkpoint._read_records(checkpoint._index)
+        self.assertEqual(
+            records[1]["variables"]["trainable_variables"][variable.path]["examples"],
+            [{"inputs": {"query": "a"}, "reward": 1.0}],
+        )
+
+    async def test_interrupted_write(self):
+        program = await build_program()
+        filepath = os.path.join(self.get_temp_dir(), "checkpoints.jsonl")
+        checkpoint = IncrementalCheckpoint(filepath)
+        checkpoint.save(program)
+        with open(filepath, "ab") as f:
+            f.write(b'{"checkpoint": 1, "varia')
+        with open(filepath + ".index", "ab") as f:
+            f.write(b'{"checkpoint": 1')
+
+        checkpoint = IncrementalCheckpoint(filepath)
+        self.assertEqual(len(checkpoint.checkpoints), 1)
+        self.assertEqual(checkpoint.save(program), 1)
+        checkpoint = IncrementalCheckpoint(filepath)
+        self.assertEqual([c["checkpoint"] for c in checkpoint.checkpoints], [0, 1])
+        checkpoint.restore(program)
+
+    @patch("litellm.completion")
+    async def test_program_checkpoint_callback(self, mock_completion):
+        program = await build_program()
+        program.compile(
+            reward=rewards.ExactMatch(in_mask=["answer"]),
+            optimizer=optimizers.RandomFewShot(),
+        )
+        (x_train, y_train), _ = test_utils.load_test_data()
+        mock_completion.return_value = {
+            "choices": [{"message": {"content": '{"answer": "Paris"}'}}]
+        }
+        filepath = os.path.join(self.get_temp_dir(), "checkpoints.jsonl")
+        _ = await program.fit(
+            x=x_train,
+            y=y_train,
+            epochs=2,
+            callbacks=[
+                ProgramCheckpoint(
+                    filepath=filepath,
+                    monitor="reward",
+                    incremental=True,
+                )
+            ],
+        )
+        checkpoint = IncrementalCheckpoint(filepath)
+        self.assertEqual([c["metadata"]["epoch"] for c in checkpoint.checkpoints], [0, 1])
+        restored_program = checkpoint.restore()
+        self.assertEqual(get_examples(restored_program), get_examples(program))
+
+        with self.assertRaises(ValueError):
+            ProgramCheckpoint(
+                filepath=os.path.join(self.get_temp_dir(), "{epoch}.jsonl"),
+                incremental=True,
+            )
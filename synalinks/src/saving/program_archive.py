@@ -0,0 +1,270 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import mmap
+import struct
+import zipfile
+import zlib
+
+from synalinks.src.saving import checkpoint_writer
+from synalinks.src.utils import json_codec
+from synalinks.src.version import __version__
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+ARCHIVE_FORMAT_VERSION = 1
+
+ARCHIVE_COMPRESSIONS = (None, "gzip", "zstd")
+
+_DEFAULT_COMPRESSION_LEVELS = {"gzip": 6, "zstd": 3}
+
+_MANIFEST_FILENAME = "manifest.json"
+_CONFIG_FILENAME = "config.json"
+_VARIABLES_DIRNAME = "variables"
+
+# A program archive is a zip file holding:
+#
+# - `manifest.json`: the format version, the compression and the paths of the
+#   variables of each collection (e.g. `trainable_variables`).
+# - `config.json`: the program config (omitted for the variables only archives).
+# - `variables/<collection>/<variable path>.json`: the value of each variable.
+#
+# The central directory of the zip file is the offset table of the variables,
+# so each variable can be read without decoding the others. The members are
+# compressed separately: with deflate (the algorithm of gzip) as standard zip
+# members, or with zstd before being stored (the zip format of the standard
+# library doesn't support zstd).
+
+# The indices of the file name and extra field lengths in the local file header.
+_FILENAME_LENGTH = 10
+_EXTRA_FIELD_LENGTH = 11
+
+
+def save_archive(
+    filepath,
+    variables,
+    config=None,
+    compression=None,
+    compression_level=None,
+):
+    """Writes the variables (and config) of a program in an archive.
+
+    The variables are encoded and compressed one at a time, so saving a
+    program only holds a single encoded variable in memory. The archive is
+    written atomically.
+
+    Args:
+        filepath (str): The path of the archive.
+        variables (dict): A dictionary mapping the collection names
+            (e.g. `trainable_variables`) to a dictionary mapping the variable
+            paths to their JSON value.
+        config (dict): Optional. The program config.
+        compression (str): Optional. The compression of the archive members,
+            one of `"gzip"` or `"zstd"` (Default to None).
+        compression_level (int): Optional. The compression level, between
+            0 and 9 for gzip (Default to 6), or between 1 and 22 for zstd
+            (Default to 3).
+    """
+    if compression not in ARCHIVE_COMPRESSIONS:
+        raise ValueError(
+            f"Invalid compression, expected one of {ARCHIVE_COMPRESSIONS}, "
+            f"received compression={compression}"
+        )
+    if compression_level is None:
+        compression_level = _DEFAULT_COMPRESSION_LEVELS.get(compression)
+    zip_compression = zipfile.ZIP_STORED
+    compress = None
+    if compression == "gzip":
+        zip_compression = zipfile.ZIP_DEFLATED
+    elif compression == "zstd":
+        if zstandard is None:
+            raise ImportError(
+                "The `zstd` compression requires the `zstandard` package. "
+                "You can install it with `pip install zstandard`."
+            )
+        compress = zstandard.ZstdCompressor(level=compression_level).compress
+    manifest = {
+        "format_version": ARCHIVE_FORMAT_VERSION,
+        "synalinks_version": __version__,
+        "compression": compression,
+        "variables": {
+            collection: list(collection_variables.keys())
+            for collection, collection_variables in variables.items()
+        },
+    }
+
+    def write(archive, filename, json):
+        data = json_codec.dumps(json).encode("utf-8")
+        # The manifest is never compressed with zstd, as it holds the compression.
+        if compress is not None and filename != _MANIFEST_FILENAME:
+            data = compress(data)
+        archive.writestr(filename, data)
+
+    with checkpoint_writer.atomic_open(filepath) as f:
+        with zipfile.ZipFile(
+            f,
+            "w",
+            compression=zip_compression,
+            compresslevel=compression_level if compression == "gzip" else None,
+        ) as archive:
+            if config is not None:
+                write(archive, _CONFIG_FILENAME, config)
+            for collection, collection_variables in variables.items():
+                for path, json in collection_variables.items():
+                    write(archive, _get_variable_filename(collection, path), json)
+            write(archive, _MANIFEST_FILENAME, manifest)
+
+
+class ProgramArchive:
+    """Reads a program archive written by `save_archive()`.
+
+    The archive is mapped in memory, and the variables are only decompressed
+    and decoded when read, so loading a program doesn't require to decode its
+    whole state. The archive is closed with `close()`, or, when its variables
+    are read lazily (see `lazy_read_variable()`), after the last one is read.
+
+    Args:
+        filepath (str): The path of the archive.
+    """
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self._buffer = None
+        self._pending_reads = 0
+        self._close_when_read = False
+        try:
+            with open(filepath, "rb") as f:
+                # Raises a `ValueError` for the empty files
+                self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._archive = zipfile.ZipFile(self._buffer)
+            self.manifest = json_codec.loads(self._read(_MANIFEST_FILENAME))
+            self._decompress = None
+            compression = self.manifest.get("compression")
+            if compression == "zstd":
+                if zstandard is None:
+                    raise ImportError(
+                        f"The archive {filepath} is compressed with zstd, which "
+                        "requires the `zstandard` package. You can install it "
+                        "with `pip install zstandard`."
+                    )
+                self._decompress = zstandard.ZstdDecompressor().decompress
+        except ImportError:
+            self._buffer.close()
+            raise
+        except (zipfile.BadZipFile, KeyError, ValueError) as e:
+            if self._buffer is not None:
+                self._buffer.close()
+            raise ValueError(
+                f"The file {filepath} is not a valid program archive: {e}"
+            ) from e
+        format_version = self.manifest.get("format_version")
+        if format_version != ARCHIVE_FORMAT_VERSION:
+            self.close()
+            raise ValueError(
+                f"Unsupported program archive format version: {format_version}, "
+                f"expected {ARCHIVE_FORMAT_VERSION}. The archive {filepath} "
+                "was saved with Synalinks "
+                f"{self.manifest.get('synalinks_version')}."
+            )
+
+    @property
+    def variables(self):
+        """A dictionary mapping the collection names to the variable paths."""
+        return self.manifest["variables"]
+
+    def get_config(self):
+        """Returns the program config, or `None` for the variables only archives."""
+        if _CONFIG_FILENAME not in self._archive.NameToInfo:
+            return None
+        return json_codec.loads(self._read(_CONFIG_FILENAME, self._decompress))
+
+    def read_variable(self, collection, path):
+        """Decodes the value of a variable.
+
+        Args:
+            collection (str): The collection of the variable
+                (e.g. `trainable_variables`).
+            path (str): The path of the variable.
+
+        Returns:
+            (dict): The JSON value of the variable.
+        """
+        return json_codec.loads(
+            self._read(_get_variable_filename(collection, path), self._decompress)
+        )
+
+    def lazy_read_variable(self, collection, path):
+        """Returns a function decoding the value of a variable when called.
+
+        The function is meant to be called once (see `Variable.lazy_update()`),
+        the archive is closed after the last one is called if
+        `close_when_read()` was called.
+
+        Args:
+            collection (str): The collection of the variable
+                (e.g. `trainable_variables`).
+            path (str): The path of the variable.
+
+        Returns:
+            (callable): The function returning the JSON value of the variable.
+        """
+        self._pending_reads += 1
+
+        def read():
+            try:
+                return self.read_variable(collection, path)
+            finally:
+                self._pending_reads -= 1
+                if self._close_when_read and not self._pending_reads:
+                    self.close()
+
+        return read
+
+    def close_when_read(self):
+        """Closes the archive once the pending lazy reads are done.
+
+        The archive is closed right away if there is no pending read. Otherwise,
+        the pending reads keep it open until the last one, or until they are
+        discarded (e.g. the variables are assigned) and garbage collected.
+        """
+        self._close_when_read = True
+        if not self._pending_reads:
+            self.close()
+
+    def _read(self, filename, decompress=None):
+        # Reads the member from the memory map, the `zipfile` module is only
+        # used to parse the central directory.
+        info = self._archive.getinfo(filename)
+        header = struct.unpack(
+            zipfile.structFileHeader,
+            self._buffer[
+                info.header_offset : info.header_offset + zipfile.sizeFileHeader
+            ],
+        )
+        start = (
+            info.header_offset
+            + zipfile.sizeFileHeader
+            + header[_FILENAME_LENGTH]
+            + header[_EXTRA_FIELD_LENGTH]
+        )
+        data = self._buffer[start : start + info.compress_size]
+        if info.compress_type == zipfile.ZIP_DEFLATED:
+            data = zlib.decompress(data, -zlib.MAX_WBITS)
+        elif info.compress_type != zipfile.ZIP_STORED:
+            raise ValueError(
+                f"Unsupported compression of the archive member {filename}: "
+                f"{info.compress_type}"
+            )
+        if decompress is not None:
+            data = decompress(data)
+        return data
+
+    def close(self):
+        self._archive.close()
+        self._buffer.close()
+
+
+def _get_variable_filename(collection, path):
+    return f"{_VARIABLES_DIRNAME}/{collection}/{path}.json"
@@ -0,0 +1,220 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import os
+import zipfile
+from unittest.mock import patch
+
+from synalinks.src import optimizers
+from synalinks.src import rewards
+from synalinks.src import testing
+from synalinks.src.backend import DataModel
+from synalinks.src.callbacks.program_checkpoint import ProgramCheckpoint
+from synalinks.src.language_models import LanguageModel
+from synalinks.src.modules import Generator
+from synalinks.src.modules import Input
+from synalinks.src.programs import Program
+from synalinks.src.saving import program_archive
+from synalinks.src.testing import test_utils
+
+
+class Query(DataModel):
+    query: str
+
+
+class Answer(DataModel):
+    answer: str
+
+
+async def get_program():
+    inputs = Input(data_model=Query)
+    outputs = await Generator(
+        data_model=Answer,
+        language_model=LanguageModel(model="ollama/mistral"),
+    )(inputs)
+    outputs = await Generator(
+        data_model=Answer,
+        language_model=LanguageModel(model="ollama/mistral"),
+    )(outputs)
+    program = Program(inputs=inputs, outputs=outputs, name="qa")
+    program.compile(
+        reward=rewards.ExactMatch(in_mask=["answer"]),
+        optimizer=optimizers.RandomFewShot(),
+    )
+    return program
+
+
+class ProgramArchiveTest(testing.TestCase):
+    @patch("litellm.completion")
+    async def test_save_and_load_archive(self, mock_completion):
+        program = await get_program()
+        (x_train, y_train), _ = test_utils.load_test_data()
+        mock_completion.return_value = {
+            "choices": [{"message": {"content": '{"answer": "Paris"}'}}]
+        }
+        _ = await program.fit(x=x_train, y=y_train, epochs=2)
+        filepath = os.path.join(self.get_temp_dir(), "program.synalinks")
+        program.save(filepath)
+
+        with zipfile.ZipFile(filepath) as f:
+            self.assertIn("config.json", f.namelist())
+            self.assertIn(
+                "variables/trainable_variables/generator/generator_state.json",
+                f.namelist(),
+            )
+
+        loaded_program = Program.load(filepath)
+        self.assertEqual(loaded_program.get_state_tree(), program.get_state_tree())
+
+    async def test_variables_are_loaded_lazily(self):
+        program = await get_program()
+        json_filepath = os.path.join(self.get_temp_dir(), "program.json")
+        program.save(json_filepath)
+        program.trainable_variables[0].update({"prompt_template": "Be concise."})
+        filepath = os.path.join(self.get_temp_dir(), "program.variables.synalinks")
+        program.save_variables(filepath)
+
+        loaded_program = Program.load(json_filepath)
+        with patch.object(
+            program_archive.ProgramArchive,
+            "read_variable",
+            autospec=True,
+            side_effect=program_archive.ProgramArchive.read_variable,
+        ) as read_variable:
+            loaded_program.load_variables(filepath)
+            self.assertEqual(read_variable.call_count, 0)
+            variable_1, variable_2 = loaded_program.trainable_variables
+            self.assertEqual(variable_1.get("prompt_template"), "Be concise.")
+            self.assertEqual(read_variable.call_count, 1)
+            self.assertNotEqual(variable_2.get("prompt_template"), "Be concise.")
+            self.assertEqual(read_variable.call_count, 2)
+
+        # The archive is closed once all the variables are decoded
+        loaded_program = Program.load(json_filepath)
+        with patch.object(
+            program_archive.ProgramArchive,
+            "close",
+            autospec=True,
+            side_effect=program_archive.ProgramArchive.close,
+        ) as close:
+            loaded_program.load_variables(filepath)
+            loaded_program.trainable_variables[0].get_json()
+            self.assertEqual(close.call_count, 0)
+            for variable in (
+                loaded_program.variables
+                + loaded_program.metrics_variables
+                + loaded_program.optimizer.variables
+            ):
+                variable.get_json()
+            self.assertEqual(close.call_count, 1)
+
+        # Assigning a variable discards its pending update
+        variable_1, _ = (await get_program()).trainable_variables
+        json = {**variable_1.get_json(), "prompt_template": "Be brief."}
+        variable_1.lazy_update(lambda: {"prompt_template": "Be concise."})
+        variable_1.assign(json)
+        self.assertEqual(variable_1.get("prompt_template"), "Be brief.")
+
+    async def test_compressed_archives(self):
+        program = await get_program()
+        example = {
+            "inputs": {"query": "What is the capital of France?"},
+            "outputs": {"answer": "Paris"},
+            "reward": 1.0,
+        }
+        for variable in program.trainable_variables:
+            variable.update({"predictions": [example] * 100})
+        filepath = os.path.join(self.get_temp_dir(), "program.synalinks")
+        program.save(filepath)
+        gzip_filepath = os.path.join(self.get_temp_dir(), "program_gzip.synalinks")
+        program.save(gzip_filepath, compression="gzip", compression_level=9)
+
+        with zipfile.ZipFile(gzip_filepath) as f:
+            for info in f.infolist():
+                self.assertEqual(info.compress_type, zipfile.ZIP_DEFLATED)
+        self.assertLess(os.path.getsize(gzip_filepath), os.path.getsize(filepath) / 5)
+        loaded_program = Program.load(gzip_filepath)
+        self.assertEqual(loaded_program.get_state_tree(), program.get_state_tree())
+
+        zstd_filepath = os.path.join(self.get_temp_dir(), "program_zstd.synalinks")
+        if program_archive.zstandard is None:
+            with self.assertRaisesRegex(ImportError, "zstandard"):
+                program.save(zstd_filepath, compression="zstd")
+            self.assertFalse(os.path.exists(zstd_filepath))
+        else:
+            program.save(zstd_filepath, compression="zstd")
+            loaded_program = Program.load(zstd_filepath)
+            self.assertEqual(loaded_program.get_state_tree(), program.get_state_tree())
+
+        with self.assertRaisesRegex(ValueError, "Invalid compression"):
+            program.save(filepath, compression="lzma")
+
+    @patch("litellm.completion")
+    async def test_background_archive_checkpoint(self, mock_completion):
+        program = await get_program()
+        (x_train, y_train), _ = test_utils.load_test_data()
+        mock_completion.return_value = {
+            "choices": [{"message": {"content": '{"answer": "Paris"}'}}]
+        }
+        filepath = os.path.join(self.get_temp_dir(), "program.synalinks")
+        _ = await program.fit(
+            x=x_train,
+            y=y_train,
+            epochs=2,
+            callbacks=[ProgramCheckpoint(filepath=filepath, background=True)],
+        )
+        loaded_program = Program.load(filepath)
+        self.assertEqual(
+            [v.get("examples") for v in loaded_program.trainable_variables],
+            [v.get("examples") for v in program.trainable_variables],
+        )
+
+    @patch("litellm.completion")
+    async def test_compressed_archive_checkpoint(self, mock_completion):
+        program = await get_program()
+        (x_train, y_train), _ = test_utils.load_test_data()
+        mock_completion.return_value = {
+            "choices": [{"message": {"content": '{"answer": "Paris"}'}}]
+        }
+        for background in (False, True):
+            filepath = os.path.join(
+                self.get_temp_dir(), f"program_{background}.synalinks"
+            )
+            _ = await program.fit(
+                x=x_train,
+                y=y_train,
+                epochs=1,
+                callbacks=[
+                    ProgramCheckpoint(
+                        filepath=filepath, background=background, compression="gzip"
+                    )
+                ],
+            )
+            with zipfile.ZipFile(filepath) as f:
+                for info in f.infolist():
+                    self.assertEqual(info.compress_type, zipfile.ZIP_DEFLATED)
+            loaded_program = Program.load(filepath)
+            self.assertEqual(
+                [v.get("examples") for v in loaded_program.trainable_variables],
+                [v.get("examples") for v in program.trainable_variables],
+            )
+
+        with self.assertRaisesRegex(ValueError, "Invalid compression"):
+            ProgramCheckpoint(filepath=filepath, compression="lzma")
+
+    async def test_invalid_archives(self):
+        program = await get_program()
+        filepath = os.path.join(self.get_temp_dir(), "program.variables.synalinks")
+        program.save_variables(filepath)
+        with self.assertRaisesRegex(ValueError, "only contains variables"):
+            Program.load(filepath)
+
+        filepath = os.path.join(self.get_temp_dir(), "invalid.synalinks")
+        with open(filepath, "w") as f:
+            f.write("{}")
+        with self.assertRaisesRegex(ValueError, "not a valid program archive"):
+            Program.load(filepath)
+
+        with open(filepath, "w") as f:
+            pass
+        with self.assertRaisesRegex(ValueError, "not a valid program archive"):
+            Program.load(filepath)
@@ -570,6 +570,31 @@ class CompileReward(rewards_module.Reward):
         with ops.name_scope(self.name):
             return await self.call(y_true, y_pred)
 
+    async def batch_call(self, y_true, y_pred):
+        """Computes the rewards of a batch of samples.
+
+        In the single output case, the whole batch is given to the reward's
+        `batch_call()`. Otherwise, the rewards are computed sample by sample.
+
+        Args:
+            y_true (list): The batch of ground truths.
+            y_pred (list): The batch of predictions.
+
+        Returns:
+            (list): The list of rewards, one per sample.
+        """
+        if len(y_pred) > 0 and all(
+            not tree.is_nested(y_t) and not tree.is_nested(y_p)
+            for y_t, y_p in zip(y_true, y_pred)
+        ):
+            # Fast path: single output case / no reward-tracking metric.
+            with ops.name_scope(self.name):
+                if not self.built:
+                    self.build(y_true[0], y_pred[0])
+                _, reward_fn, _, _ = self._flat_rewards[0]
+                return await reward_fn.batch_call(y_true, y_pred)
+        return [await self(y_t, y_p) for y_t, y_p in zip(y_true, y_pred)]
+
     async def call(self, y_true, y_pred):
         if not tree.is_nested(y_true) and not tree.is_nested(y_pred):
             # Fast path: single output case / no reward-tracking metric.
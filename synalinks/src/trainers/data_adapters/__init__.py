@@ -3,6 +3,9 @@ import types
 from synalinks.src.trainers.data_adapters import array_data_adapter
 from synalinks.src.trainers.data_adapters import data_adapter
 from synalinks.src.trainers.data_adapters.array_data_adapter import ArrayDataAdapter
+from synalinks.src.trainers.data_adapters.async_generator_data_adapter import (
+    AsyncGeneratorDataAdapter,
+)
 from synalinks.src.trainers.data_adapters.generator_data_adapter import (
     GeneratorDataAdapter,
 )
@@ -31,6 +34,10 @@ def get_data_adapter(
         if y is not None:
             raise_unsupported_arg("y", "the targets", "PyDataset")
         return GeneratorDataAdapter(x)
+    elif hasattr(x, "__aiter__"):
+        if y is not None:
+            raise_unsupported_arg("y", "the targets", "async iterable")
+        return AsyncGeneratorDataAdapter(x)
 
     else:
         raise ValueError(f"Unrecognized data type: x={x} (of type {type(x)})")
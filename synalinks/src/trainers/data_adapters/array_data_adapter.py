@@ -2,7 +2,6 @@
 # Original authors: François Chollet et al. (Keras Team)
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
-import functools
 import math
 
 import numpy as np
@@ -14,7 +13,12 @@ from synalinks.src.trainers.data_adapters.data_adapter import DataAdapter
 
 
 class ArrayDataAdapter(DataAdapter):
-    """Adapter for array-like objects, e.g. NumPy arrays."""
+    """Adapter for array-like objects, e.g. NumPy arrays.
+
+    The inputs are converted once to NumPy object arrays. The batches are
+    views of these arrays (or gathered with an index array when shuffling),
+    so iterating over an epoch doesn't copy the dataset.
+    """
 
     def __init__(
         self,
@@ -24,7 +28,9 @@ class ArrayDataAdapter(DataAdapter):
         steps=None,
         shuffle=False,
     ):
-        inputs = data_adapter_utils.pack_x_y(x, y)
+        inputs = tree.map_structure(
+            convert_to_object_array, data_adapter_utils.pack_x_y(x, y)
+        )
         num_samples = set(i.shape[0] for i in tree.flatten(inputs)).pop()
         self._num_samples = num_samples
         self._inputs = inputs
@@ -40,16 +46,20 @@ class ArrayDataAdapter(DataAdapter):
         self._shuffle = shuffle
 
     def get_numpy_iterator(self):
-        inputs = np.array(self._inputs, dtype="object")
-
-        def slice_and_convert_to_numpy(sliceable, indices=None):
-            x = sliceable[indices]
-            x = np.array(x, dtype="object")
-            return x
-
-        return self._get_iterator(slice_and_convert_to_numpy, inputs)
-
-    def _get_iterator(self, slice_and_convert_fn, inputs):
+        flat_inputs = tree.flatten(self._inputs)
+        # The `(x,)` and `(x, y)` inputs don't need to be packed.
+        is_flat = len(flat_inputs) == len(self._inputs)
+        for indices in self._get_batch_indices():
+            # A view for the slices, a copy of the selected items otherwise.
+            batch = tuple(array[indices] for array in flat_inputs)
+            yield batch if is_flat else tree.pack_sequence_as(self._inputs, batch)
+
+    async def get_async_iterator(self):
+        # Slicing the in-memory arrays doesn't block the event loop.
+        for batch in self.get_numpy_iterator():
+            yield batch
+
+    def _get_batch_indices(self):
         global_permutation = None
         if self._shuffle and self._shuffle != "batch":
             global_permutation = np.random.permutation(self._num_samples)
@@ -58,21 +68,11 @@ class ArrayDataAdapter(DataAdapter):
             start = i * self._batch_size
             stop = min((i + 1) * self._batch_size, self._num_samples)
             if self._shuffle == "batch":
-                indices = np.random.permutation(stop - start) + start
+                yield np.random.permutation(stop - start) + start
             elif self._shuffle:
-                indices = global_permutation[start:stop]
+                yield global_permutation[start:stop]
             else:
-                indices = slice(start, stop)
-
-            slice_indices_and_convert_fn = functools.partial(
-                slice_and_convert_fn, indices=indices
-            )
-            x = tree.map_structure(slice_indices_and_convert_fn, inputs[0])
-            if inputs.shape[0] > 1:
-                y = tree.map_structure(slice_indices_and_convert_fn, inputs[1])
-            else:
-                y = None
-            yield data_adapter_utils.pack_x_y(x, y=y)
+                yield slice(start, stop)
 
     @property
     def num_batches(self):
@@ -91,6 +91,14 @@ class ArrayDataAdapter(DataAdapter):
         return self._partial_batch_size or None
 
 
+def convert_to_object_array(x):
+    """Converts an array-like object to a NumPy object array.
+
+    The NumPy object arrays are returned as is, without copy.
+    """
+    return np.asarray(x, dtype="object")
+
+
 def can_convert_arrays(arrays):
     """Check if array like-inputs can be handled by `ArrayDataAdapter`
 
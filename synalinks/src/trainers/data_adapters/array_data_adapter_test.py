@@ -42,3 +42,24 @@ class TestArrayDataAdapter(testing.TestCase):
             self.assertIsInstance(x[1], Query)
             self.assertIsInstance(y[0], AnswerWithRationale)
             self.assertIsInstance(y[1], AnswerWithRationale)
+
+    @parameterized.named_parameters(
+        named_product(
+            shuffle=[False, "batch", True],
+        )
+    )
+    def test_iterate_without_copying_the_dataset(self, shuffle):
+        (x, y), _ = load_test_data()
+        adapter = ArrayDataAdapter(x, y=y, batch_size=1, shuffle=shuffle)
+        # The object arrays are not converted again
+        self.assertIs(adapter._inputs[0], x)
+        for _ in range(2):
+            x_batches = []
+            for x_batch, y_batch in adapter.get_numpy_iterator():
+                self.assertEqual(x_batch.dtype, object)
+                if not shuffle:
+                    self.assertIs(x_batch.base, x)
+                x_batches.extend(x_batch)
+            self.assertCountEqual(
+                [id(query) for query in x_batches], [id(query) for query in x]
+            )
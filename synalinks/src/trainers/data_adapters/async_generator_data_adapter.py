@@ -0,0 +1,114 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import asyncio
+
+from synalinks.src.trainers.data_adapters import data_adapter_utils
+from synalinks.src.trainers.data_adapters.data_adapter import DataAdapter
+
+# Marks the end of the async iterable in the prefetch buffer.
+_END = object()
+
+
+class _Error:
+    def __init__(self, error):
+        self.error = error
+
+
+class AsyncGeneratorDataAdapter(DataAdapter):
+    """Adapter for Python async generators (and any async iterable).
+
+    The batches are pulled from the async iterable by a background task
+    filling a bounded buffer, so the data loading (e.g. reading from a queue,
+    a database cursor or an HTTP stream) runs while the program awaits the
+    language models, without blocking the event loop.
+
+    Like for the Python generators, the first batches are kept to be replayed
+    at the beginning of each iteration (they are used to build the program).
+
+    Args:
+        async_iterable (AsyncIterable): The async iterable yielding the batches,
+            either `(inputs,)` or `(inputs, targets)` tuples.
+        prefetch (int): The maximum number of batches pulled in advance
+            (Default to 2).
+    """
+
+    def __init__(self, async_iterable, prefetch=2):
+        if prefetch < 1:
+            raise ValueError(
+                f"`prefetch` should be a strictly positive integer, "
+                f"received prefetch={prefetch}"
+            )
+        self.async_iterator = async_iterable.__aiter__()
+        self.prefetch = prefetch
+        self._first_batches = []
+        self._buffer = None
+        self._pull = None
+        self._exhausted = False
+
+    def get_numpy_iterator(self):
+        raise NotImplementedError(
+            "Async iterables can only be iterated asynchronously, "
+            "use `get_async_iterator()` instead."
+        )
+
+    async def get_async_iterator(self):
+        for batch in self._first_batches:
+            yield batch
+        if self._exhausted:
+            return
+        if self._buffer is None:
+            self._buffer = asyncio.Queue(maxsize=self.prefetch)
+        producer = asyncio.ensure_future(self._produce())
+        try:
+            while not self._exhausted:
+                item = await self._buffer.get()
+                if item is _END:
+                    self._exhausted = True
+                elif isinstance(item, _Error):
+                    self._exhausted = True
+                    raise item.error
+                else:
+                    if len(self._first_batches) < data_adapter_utils.NUM_BATCHES_FOR_SPEC:
+                        check_batch(item)
+                        self._first_batches.append(item)
+                    yield item
+        finally:
+            # The producer doesn't outlive the iteration, the next one starts
+            # a new producer.
+            producer.cancel()
+            await asyncio.wait([producer])
+
+    async def _produce(self):
+        # The buffer and the pending pull are kept by the adapter, so the
+        # batches already pulled are not lost when an iteration stops early.
+        try:
+            while True:
+                if self._pull is None:
+                    self._pull = asyncio.ensure_future(self.async_iterator.__anext__())
+                # The pull is shielded, so stopping the producer doesn't cancel
+                # the async iterable, the next producer awaits it instead.
+                batch = await asyncio.shield(self._pull)
+                await self._buffer.put(batch)
+                self._pull = None
+        except StopAsyncIteration:
+            await self._buffer.put(_END)
+        except Exception as e:
+            await self._buffer.put(_Error(e))
+
+    @property
+    def num_batches(self):
+        return None
+
+    @property
+    def batch_size(self):
+        return None
+
+
+def check_batch(batch):
+    if not isinstance(batch, tuple):
+        raise ValueError(
+            "When passing an async iterable to a Synalinks program, "
+            "it must yield tuples, either "
+            "(input,) or (inputs, targets). "
+            f"Received: {batch}"
+        )
@@ -0,0 +1,164 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import numpy as np
+
+from synalinks.src import modules
+from synalinks.src import optimizers
+from synalinks.src import programs
+from synalinks.src import rewards
+from synalinks.src import testing
+from synalinks.src.language_models import LanguageModel
+from synalinks.src.testing.test_utils import AnswerWithRationale
+from synalinks.src.testing.test_utils import Query
+from synalinks.src.trainers.data_adapters import get_data_adapter
+from synalinks.src.trainers.data_adapters.async_generator_data_adapter import (
+    AsyncGeneratorDataAdapter,
+)
+
+
+def make_batch(i, with_targets=True):
+    x = np.array([Query(query=f"Question {i}")], dtype="object")
+    if not with_targets:
+        return (x,)
+    y = np.array(
+        [AnswerWithRationale(rationale=f"Rationale {i}", answer=f"Answer {i}")],
+        dtype="object",
+    )
+    return (x, y)
+
+
+async def async_generator(num_batches, with_targets=True, delay=0.0, pulled=None):
+    for i in range(num_batches):
+        await asyncio.sleep(delay)
+        if pulled is not None:
+            pulled.append(i)
+        yield make_batch(i, with_targets=with_targets)
+
+
+async def collect(adapter):
+    return [x[0].query async for x, *_ in adapter.get_async_iterator()]
+
+
+class AsyncGeneratorDataAdapterTest(testing.TestCase):
+    async def test_basic_flow(self):
+        adapter = get_data_adapter(async_generator(4))
+        self.assertIsInstance(adapter, AsyncGeneratorDataAdapter)
+        self.assertIsNone(adapter.num_batches)
+        self.assertIsNone(adapter.batch_size)
+        batches = [batch async for batch in adapter.get_async_iterator()]
+        self.assertEqual(len(batches), 4)
+        for i, (x, y) in enumerate(batches):
+            self.assertIsInstance(x[0], Query)
+            self.assertEqual(y[0].answer, f"Answer {i}")
+
+    async def test_stop_early_and_resume(self):
+        adapter = AsyncGeneratorDataAdapter(async_generator(5))
+        async for _ in adapter.get_async_iterator():
+            break
+        # The first batches are replayed, and the batches already
+        # pulled in the buffer are not lost
+        self.assertEqual(
+            await collect(adapter),
+            [f"Question {i}" for i in range(5)],
+        )
+        # Once exhausted, only the first batches are replayed
+        self.assertEqual(await collect(adapter), ["Question 0", "Question 1"])
+
+    async def test_producer_stops_with_the_iteration(self):
+        adapter = AsyncGeneratorDataAdapter(async_generator(5))
+        iterator = adapter.get_async_iterator()
+        await iterator.__anext__()
+        await iterator.aclose()
+        producers = [
+            task
+            for task in asyncio.all_tasks()
+            if task.get_coro().__qualname__.endswith("._produce")
+        ]
+        self.assertEqual(producers, [])
+        self.assertEqual(
+            await collect(adapter),
+            [f"Question {i}" for i in range(5)],
+        )
+
+    async def test_bounded_prefetch(self):
+        pulled = []
+        adapter = AsyncGeneratorDataAdapter(
+            async_generator(10, pulled=pulled),
+            prefetch=2,
+        )
+        iterator = adapter.get_async_iterator()
+        await iterator.__anext__()
+        await asyncio.sleep(0.05)
+        # The batch yielded, the batches in the buffer and the batch waiting
+        # to be put in the buffer
+        self.assertEqual(len(pulled), 4)
+        await iterator.aclose()
+
+    async def test_prefetch_overlaps_with_the_consumer(self):
+        adapter = AsyncGeneratorDataAdapter(async_generator(4, delay=0.05), prefetch=4)
+        iterator = adapter.get_async_iterator()
+        await iterator.__anext__()
+        # The next batches are loaded while the consumer awaits
+        await asyncio.sleep(0.2)
+        start = asyncio.get_running_loop().time()
+        async for _ in iterator:
+            pass
+        self.assertLess(asyncio.get_running_loop().time() - start, 0.05)
+
+    async def test_invalid_batch(self):
+        async def invalid_generator():
+            yield Query(query="What is the capital of France?")
+
+        adapter = AsyncGeneratorDataAdapter(invalid_generator())
+        with self.assertRaisesRegex(ValueError, "must yield tuples"):
+            await collect(adapter)
+
+    async def test_error_in_the_async_iterable(self):
+        async def failing_generator():
+            yield make_batch(0)
+            raise RuntimeError("Connection lost")
+
+        adapter = AsyncGeneratorDataAdapter(failing_generator())
+        with self.assertRaisesRegex(RuntimeError, "Connection lost"):
+            await collect(adapter)
+
+    def test_targets_not_supported(self):
+        with self.assertRaisesRegex(ValueError, "async iterable"):
+            get_data_adapter(async_generator(1), y=np.array([]))
+
+    def test_numpy_iterator_not_supported(self):
+        adapter = AsyncGeneratorDataAdapter(async_generator(1))
+        with self.assertRaisesRegex(NotImplementedError, "asynchronously"):
+            adapter.get_numpy_iterator()
+
+    @patch("litellm.completion")
+    async def test_fit_evaluate_predict(self, mock_completion):
+        mock_answer = AnswerWithRationale(rationale="It is well-known", answer="Paris")
+        mock_completion.return_value = {
+            "choices": [{"message": {"content": json.dumps(mock_answer.get_json())}}]
+        }
+
+        inputs = modules.Input(data_model=Query)
+        outputs = await modules.Generator(
+            data_model=AnswerWithRationale,
+            language_model=LanguageModel("ollama_chat/deepseek-r1"),
+        )(inputs)
+        program = programs.Program(inputs=inputs, outputs=outputs)
+        program.compile(
+            optimizer=optimizers.RandomFewShot(),
+            reward=rewards.ExactMatch(in_mask=["answer"]),
+        )
+
+        history = await program.fit(x=async_generator(3), epochs=1)
+        self.assertEqual(len(history.history["reward"]), 1)
+
+        metrics = await program.evaluate(x=async_generator(3), return_dict=True)
+        self.assertIn("reward", metrics)
+
+        y_pred = await program.predict(x=async_generator(3, with_targets=False))
+        self.assertEqual(len(y_pred), 3)
+        self.assertEqual(y_pred[0].get("answer"), "Paris")
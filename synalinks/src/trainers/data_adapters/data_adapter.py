@@ -2,6 +2,11 @@
 # Original authors: François Chollet et al. (Keras Team)
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import asyncio
+
+# Returned by `next()` at the end of the iterator.
+_END = object()
+
 
 class DataAdapter:
     """Base class for input data adapters.
@@ -19,6 +24,29 @@ class DataAdapter:
         """
         raise NotImplementedError
 
+    async def get_async_iterator(self):
+        """Get a Python async iterable for the `DataAdapter`.
+
+        By default, yields the batches of `get_numpy_iterator()`, each batch
+        being pulled in a worker thread, so the iterators reading the data
+        (e.g. from files or Python generators) don't block the event loop.
+
+        Returns:
+            A Python async iterator.
+        """
+        iterator = iter(self.get_numpy_iterator())
+        try:
+            while True:
+                batch = await asyncio.to_thread(next, iterator, _END)
+                if batch is _END:
+                    break
+                yield batch
+        finally:
+            # Unless still running in the worker thread (the iteration was
+            # cancelled), in which case it is closed when garbage collected.
+            if hasattr(iterator, "close") and not getattr(iterator, "gi_running", False):
+                iterator.close()
+
     @property
     def num_batches(self):
         """Return the size (number of batches) for the dataset created.
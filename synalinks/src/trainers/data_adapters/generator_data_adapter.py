@@ -25,7 +25,7 @@ class GeneratorDataAdapter(DataAdapter):
             )
 
     def get_numpy_iterator(self):
-        return data_adapter_utils.get_numpy_iterator(self.generator())
+        return self.generator()
 
     @property
     def num_batches(self):
@@ -1 +1,32 @@
-# TODO
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+from synalinks.src import testing
+from synalinks.src.testing.test_utils import AnswerWithRationale
+from synalinks.src.testing.test_utils import Query
+from synalinks.src.testing.test_utils import load_test_data
+from synalinks.src.trainers.data_adapters.generator_data_adapter import (
+    GeneratorDataAdapter,
+)
+
+
+def generator(x, y, num_batches):
+    for i in range(num_batches):
+        yield x[i % len(x) : i % len(x) + 1], y[i % len(y) : i % len(y) + 1]
+
+
+class GeneratorDataAdapterTest(testing.TestCase):
+    def test_basic_flow(self):
+        (x, y), _ = load_test_data()
+        adapter = GeneratorDataAdapter(generator(x, y, 4))
+        self.assertIsNone(adapter.num_batches)
+        self.assertIsNone(adapter.batch_size)
+        batches = list(adapter.get_numpy_iterator())
+        self.assertEqual(len(batches), 4)
+        for x_batch, y_batch in batches:
+            self.assertIsInstance(x_batch[0], Query)
+            self.assertIsInstance(y_batch[0], AnswerWithRationale)
+
+    def test_invalid_batch(self):
+        (x, _), _ = load_test_data()
+        with self.assertRaisesRegex(ValueError, "must return a tuple"):
+            GeneratorDataAdapter(iter([x]))
@@ -0,0 +1,314 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import asyncio
+import collections
+import copy
+import math
+import mmap
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from synalinks.src.api_export import synalinks_export
+from synalinks.src.trainers.data_adapters import data_adapter_utils
+from synalinks.src.trainers.data_adapters.data_adapter import DataAdapter
+from synalinks.src.utils import file_utils
+from synalinks.src.utils import json_codec
+
+# The number of bytes scanned at once when indexing the lines of a file.
+INDEX_CHUNK_SIZE = 1 << 24
+
+
+@synalinks_export("synalinks.utils.JsonlDataAdapter")
+class JsonlDataAdapter(DataAdapter):
+    """Adapter reading the samples from JSON Lines files.
+
+    The files are not loaded in memory: the offset of each line is indexed when
+    the adapter is created, and the records are read and parsed batch by batch.
+    The next batches are prefetched in a background thread while the current
+    batch runs through the program, and the records can be shuffled at each
+    epoch thanks to the offsets index.
+
+    Each line is a JSON object. By default, the fields of the data models are
+    read from the record itself, e.g. `{"query": "...", "answer": "..."}`.
+    If `input_key` (and `output_key`) are provided, the inputs (and outputs)
+    are read from the corresponding field, e.g.
+    `{"inputs": {"query": "..."}, "outputs": {"answer": "..."}}`.
+
+    The adapter can be passed as `x` to `fit()`, `evaluate()` and `predict()`
+    (in which case `y` and `batch_size` should not be provided).
+
+    Example:
+
+    ```python
+    class Query(synalinks.DataModel):
+        query: str
+
+    class Answer(synalinks.DataModel):
+        answer: str
+
+    train_data = synalinks.utils.JsonlDataAdapter(
+        "train.jsonl",
+        input_data_model=Query,
+        output_data_model=Answer,
+        batch_size=32,
+        shuffle=True,
+    )
+    history = await program.fit(x=train_data, epochs=10)
+    ```
+
+    When running multiple processes, each process can iterate over its own
+    shard of the records:
+
+    ```python
+    train_data = train_data.shard(index=worker_index, count=num_workers)
+    ```
+
+    Args:
+        filepath (str | list): The path of the JSON Lines file, or a list of paths.
+        input_data_model (DataModel): The data model of the inputs.
+        output_data_model (DataModel): Optional. The data model of the outputs.
+            If not provided, the adapter only yields inputs (e.g. for `predict()`).
+        input_key (str): Optional. The field of the records holding the inputs.
+        output_key (str): Optional. The field of the records holding the outputs.
+        batch_size (int): The number of samples per batch (Default to 32).
+        shuffle (bool | str): Whether to shuffle the records at each epoch.
+            If `"batch"`, only the records within each batch are shuffled,
+            preserving the locality of the reads (Default to False).
+        prefetch (int): The number of batches read and parsed in advance in a
+            background thread. Use 0 to disable prefetching (Default to 1).
+    """
+
+    def __init__(
+        self,
+        filepath,
+        input_data_model,
+        output_data_model=None,
+        input_key=None,
+        output_key=None,
+        batch_size=32,
+        shuffle=False,
+        prefetch=1,
+    ):
+        if isinstance(filepath, (list, tuple)):
+            filepaths = [file_utils.path_to_string(f) for f in filepath]
+        else:
+            filepaths = [file_utils.path_to_string(filepath)]
+        if prefetch < 0:
+            raise ValueError(
+                f"`prefetch` should be a positive integer, received prefetch={prefetch}"
+            )
+        self.filepaths = filepaths
+        self.input_data_model = input_data_model
+        self.output_data_model = output_data_model
+        self.input_key = input_key
+        self.output_key = output_key
+        self.prefetch = prefetch
+        self._batch_size = batch_size
+        self._shuffle = shuffle
+        self._offsets = []
+        self._lengths = []
+        file_indices = []
+        for i, path in enumerate(filepaths):
+            offsets, lengths = index_lines(path)
+            self._offsets.append(offsets)
+            self._lengths.append(lengths)
+            file_indices.append(np.full(len(offsets), i, dtype=np.int32))
+        # The (file index, line index) of each record.
+        self._file_indices = np.concatenate(file_indices)
+        self._line_indices = np.concatenate(
+            [np.arange(len(offsets)) for offsets in self._offsets]
+        )
+
+    def shard(self, index, count):
+        """Returns an adapter iterating over a shard of the records.
+
+        The records are split in `count` shards, the `index`-th shard holding
+        every `count`-th record starting at `index`.
+
+        Args:
+            index (int): The index of the shard.
+            count (int): The number of shards.
+
+        Returns:
+            (JsonlDataAdapter): The adapter of the shard.
+        """
+        if not 0 <= index < count:
+            raise ValueError(
+                "The shard index should be between 0 and `count - 1`, "
+                f"received index={index} and count={count}"
+            )
+        adapter = copy.copy(self)
+        adapter._file_indices = self._file_indices[index::count]
+        adapter._line_indices = self._line_indices[index::count]
+        return adapter
+
+    def get_numpy_iterator(self):
+        buffers = [None] * len(self.filepaths)
+        if not self.prefetch:
+            try:
+                for indices in self._get_batch_indices():
+                    yield self._load_batch(indices, buffers)
+            finally:
+                _close_buffers(buffers)
+            return
+
+        executor = _get_executor()
+        pending = collections.deque()
+        try:
+            for indices in self._get_batch_indices():
+                pending.append(executor.submit(self._load_batch, indices, buffers))
+                if len(pending) > self.prefetch:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            _shutdown(executor, pending, buffers)
+
+    async def get_async_iterator(self):
+        # The batches are loaded by the worker thread and awaited, so the event
+        # loop is never blocked by the reads (without prefetch, each batch is
+        # loaded when requested).
+        buffers = [None] * len(self.filepaths)
+        executor = _get_executor()
+        pending = collections.deque()
+        try:
+            for indices in self._get_batch_indices():
+                pending.append(executor.submit(self._load_batch, indices, buffers))
+                if len(pending) > self.prefetch:
+                    yield await asyncio.wrap_future(pending.popleft())
+            while pending:
+                yield await asyncio.wrap_future(pending.popleft())
+        finally:
+            _shutdown(executor, pending, buffers)
+
+    def _load_batch(self, indices, buffers):
+        for i, path in enumerate(self.filepaths):
+            if buffers[i] is None and len(self._offsets[i]):
+                with open(path, "rb") as f:
+                    buffers[i] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        records = []
+        for i in indices:
+            file_index = self._file_indices[i]
+            line_index = self._line_indices[i]
+            offset = self._offsets[file_index][line_index]
+            length = self._lengths[file_index][line_index]
+            records.append(
+                json_codec.loads(buffers[file_index][offset : offset + length])
+            )
+        return self._parse_records(records)
+
+    def _get_batch_indices(self):
+        num_samples = self.num_samples
+        permutation = None
+        if self._shuffle and self._shuffle != "batch":
+            permutation = np.random.permutation(num_samples)
+        for i in range(self.num_batches):
+            start = i * self._batch_size
+            stop = min((i + 1) * self._batch_size, num_samples)
+            if self._shuffle == "batch":
+                yield np.random.permutation(stop - start) + start
+            elif self._shuffle:
+                yield permutation[start:stop]
+            else:
+                yield range(start, stop)
+
+    def _parse_records(self, records):
+        x = np.empty(len(records), dtype="object")
+        x[:] = [
+            _parse_record(record, self.input_data_model, self.input_key)
+            for record in records
+        ]
+        y = None
+        if self.output_data_model is not None:
+            y = np.empty(len(records), dtype="object")
+            y[:] = [
+                _parse_record(record, self.output_data_model, self.output_key)
+                for record in records
+            ]
+        return data_adapter_utils.pack_x_y(x, y)
+
+    @property
+    def num_samples(self):
+        """The number of records (in the shard)."""
+        return len(self._line_indices)
+
+    @property
+    def num_batches(self):
+        return int(math.ceil(self.num_samples / self._batch_size))
+
+    @property
+    def batch_size(self):
+        return self._batch_size
+
+    @property
+    def has_partial_batch(self):
+        return self.num_samples % self._batch_size > 0
+
+    @property
+    def partial_batch_size(self):
+        return self.num_samples % self._batch_size or None
+
+
+def _get_executor():
+    return ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="synalinks_jsonl_prefetch"
+    )
+
+
+def _shutdown(executor, pending, buffers):
+    for future in pending:
+        future.cancel()
+    # The buffers are closed by the worker after the batch it may be loading,
+    # so the iteration doesn't wait for it.
+    executor.submit(_close_buffers, buffers)
+    executor.shutdown(wait=False)
+
+
+def index_lines(filepath):
+    """Returns the offset and length of the non-empty lines of a file.
+
+    Args:
+        filepath (str): The path of the file.
+
+    Returns:
+        (tuple): The offsets and the lengths of the lines (NumPy arrays).
+    """
+    with open(filepath, "rb") as f:
+        if not f.seek(0, 2):
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            size = len(buffer)
+            # The file is scanned by chunks, so the memory used doesn't grow
+            # with the size of the file (except for the offsets).
+            newlines = []
+            for start in range(0, size, INDEX_CHUNK_SIZE):
+                chunk = np.frombuffer(
+                    buffer,
+                    dtype=np.uint8,
+                    count=min(INDEX_CHUNK_SIZE, size - start),
+                    offset=start,
+                )
+                newlines.append(np.flatnonzero(chunk == ord("\n")) + start)
+                del chunk
+            newlines = np.concatenate(newlines)
+    starts = np.concatenate([[0], newlines + 1])
+    ends = np.concatenate([newlines, [size]])
+    lengths = ends - starts
+    non_empty = lengths > 0
+    return starts[non_empty].astype(np.int64), lengths[non_empty].astype(np.int64)
+
+
+def _parse_record(record, data_model, key):
+    if key is not None:
+        return data_model.model_validate(record[key])
+    fields = data_model.model_fields
+    return data_model.model_validate(
+        {name: value for name, value in record.items() if name in fields}
+    )
+
+
+def _close_buffers(buffers):
+    for buffer in buffers:
+        if buffer is not None:
+            buffer.close()
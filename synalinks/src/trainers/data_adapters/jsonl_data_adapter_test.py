@@ -0,0 +1,245 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import asyncio
+import json
+import os
+import time
+from unittest.mock import patch
+
+from absl.testing import parameterized
+
+from synalinks.src import modules
+from synalinks.src import optimizers
+from synalinks.src import programs
+from synalinks.src import rewards
+from synalinks.src import testing
+from synalinks.src.language_models import LanguageModel
+from synalinks.src.testing.test_utils import AnswerWithRationale
+from synalinks.src.testing.test_utils import Query
+from synalinks.src.testing.test_utils import named_product
+from synalinks.src.trainers.data_adapters import jsonl_data_adapter
+from synalinks.src.trainers.data_adapters.jsonl_data_adapter import JsonlDataAdapter
+from synalinks.src.trainers.data_adapters.jsonl_data_adapter import index_lines
+
+
+def make_records(num_records):
+    return [
+        {
+            "query": f"Question {i}",
+            "rationale": f"Rationale {i}",
+            "answer": f"Answer {i}",
+        }
+        for i in range(num_records)
+    ]
+
+
+class JsonlDataAdapterTest(testing.TestCase):
+    def write_jsonl(self, records, filename="data.jsonl", separator="\n"):
+        filepath = os.path.join(self.get_temp_dir(), filename)
+        with open(filepath, "w") as f:
+            f.write(separator.join(json.dumps(record) for record in records))
+        return filepath
+
+    def test_index_lines(self):
+        filepath = self.write_jsonl(["a", "bc"], separator="\n\n")
+        offsets, lengths = index_lines(filepath)
+        self.assertEqual(offsets.tolist(), [0, 5])
+        self.assertEqual(lengths.tolist(), [3, 4])
+
+    def test_index_lines_by_chunks(self):
+        records = make_records(20)
+        filepath = self.write_jsonl(records)
+        expected_offsets, expected_lengths = index_lines(filepath)
+        # Chunks smaller than the lines, with lines spanning several chunks
+        with patch.object(jsonl_data_adapter, "INDEX_CHUNK_SIZE", 7):
+            offsets, lengths = index_lines(filepath)
+        self.assertEqual(offsets.tolist(), expected_offsets.tolist())
+        self.assertEqual(lengths.tolist(), expected_lengths.tolist())
+        self.assertEqual(len(offsets), len(records))
+
+    def test_index_empty_file(self):
+        filepath = self.write_jsonl([])
+        offsets, lengths = index_lines(filepath)
+        self.assertEqual(len(offsets), 0)
+        self.assertEqual(len(lengths), 0)
+
+    @parameterized.named_parameters(
+        named_product(
+            shuffle=[False, "batch", True],
+            prefetch=[0, 1, 3],
+        )
+    )
+    def test_basic_flow(self, shuffle, prefetch):
+        filepath = self.write_jsonl(make_records(10))
+        adapter = JsonlDataAdapter(
+            filepath,
+            input_data_model=Query,
+            output_data_model=AnswerWithRationale,
+            batch_size=4,
+            shuffle=shuffle,
+            prefetch=prefetch,
+        )
+        self.assertEqual(adapter.num_samples, 10)
+        self.assertEqual(adapter.num_batches, 3)
+        self.assertEqual(adapter.batch_size, 4)
+        self.assertEqual(adapter.has_partial_batch, True)
+        self.assertEqual(adapter.partial_batch_size, 2)
+
+        for _ in range(2):
+            queries = []
+            for i, batch in enumerate(adapter.get_numpy_iterator()):
+                self.assertIsInstance(batch, tuple)
+                x, y = batch
+                self.assertEqual(x.dtype, object)
+                self.assertEqual(len(x), 2 if i == 2 else 4)
+                for x_sample, y_sample in zip(x, y):
+                    self.assertIsInstance(x_sample, Query)
+                    self.assertIsInstance(y_sample, AnswerWithRationale)
+                    self.assertEqual(
+                        x_sample.query.split()[-1], y_sample.answer.split()[-1]
+                    )
+                queries.extend(x_sample.query for x_sample in x)
+            expected = [f"Question {i}" for i in range(10)]
+            if shuffle:
+                self.assertEqual(sorted(queries), sorted(expected))
+            else:
+                self.assertEqual(queries, expected)
+
+    def test_inputs_only(self):
+        filepath = self.write_jsonl(make_records(3))
+        adapter = JsonlDataAdapter(filepath, input_data_model=Query)
+        batches = list(adapter.get_numpy_iterator())
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(len(batches[0]), 1)
+        self.assertEqual(batches[0][0][2].query, "Question 2")
+
+    def test_input_and_output_keys(self):
+        records = [
+            {
+                "inputs": {"query": "What is the capital of France?"},
+                "outputs": {"rationale": "It is well-known", "answer": "Paris"},
+            }
+        ]
+        filepath = self.write_jsonl(records, separator="\r\n")
+        adapter = JsonlDataAdapter(
+            filepath,
+            input_data_model=Query,
+            output_data_model=AnswerWithRationale,
+            input_key="inputs",
+            output_key="outputs",
+        )
+        ((x, y),) = list(adapter.get_numpy_iterator())
+        self.assertEqual(x[0].query, "What is the capital of France?")
+        self.assertEqual(y[0].answer, "Paris")
+
+    def test_multiple_files(self):
+        records = make_records(5)
+        filepaths = [
+            self.write_jsonl(records[:3], filename="0.jsonl"),
+            self.write_jsonl([], filename="1.jsonl"),
+            self.write_jsonl(records[3:], filename="2.jsonl"),
+        ]
+        adapter = JsonlDataAdapter(filepaths, input_data_model=Query, batch_size=2)
+        self.assertEqual(adapter.num_samples, 5)
+        queries = [
+            x_sample.query for (x,) in adapter.get_numpy_iterator() for x_sample in x
+        ]
+        self.assertEqual(queries, [f"Question {i}" for i in range(5)])
+
+    def test_shard(self):
+        filepath = self.write_jsonl(make_records(10))
+        adapter = JsonlDataAdapter(filepath, input_data_model=Query, batch_size=2)
+        queries = []
+        for index in range(3):
+            shard = adapter.shard(index=index, count=3)
+            self.assertEqual(shard.num_samples, 4 if index == 0 else 3)
+            queries.extend(
+                x_sample.query for (x,) in shard.get_numpy_iterator() for x_sample in x
+            )
+        # The shards are disjoint and cover all the records
+        self.assertEqual(sorted(queries), sorted(f"Question {i}" for i in range(10)))
+        # The adapter is not modified
+        self.assertEqual(adapter.num_samples, 10)
+        with self.assertRaisesRegex(ValueError, "shard index"):
+            adapter.shard(index=3, count=3)
+
+    def test_stop_iteration_early(self):
+        filepath = self.write_jsonl(make_records(10))
+        adapter = JsonlDataAdapter(
+            filepath, input_data_model=Query, batch_size=1, prefetch=2
+        )
+        iterator = adapter.get_numpy_iterator()
+        next(iterator)
+        iterator.close()
+
+    async def test_async_iterator_doesnt_block_the_event_loop(self):
+        filepath = self.write_jsonl(make_records(4))
+        adapter = JsonlDataAdapter(
+            filepath, input_data_model=Query, batch_size=2, prefetch=0
+        )
+        parse_records = adapter._parse_records
+
+        def slow_parse_records(records):
+            time.sleep(0.1)
+            return parse_records(records)
+
+        ticks = []
+
+        async def tick():
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.ensure_future(tick())
+        with patch.object(adapter, "_parse_records", side_effect=slow_parse_records):
+            batches = [x async for (x,) in adapter.get_async_iterator()]
+        ticker.cancel()
+        self.assertEqual(
+            [query.query for x in batches for query in x],
+            [f"Question {i}" for i in range(4)],
+        )
+        self.assertGreater(len(ticks), 5)
+
+    def test_invalid_record(self):
+        filepath = self.write_jsonl([{"text": "What is the capital of France?"}])
+        adapter = JsonlDataAdapter(filepath, input_data_model=Query)
+        with self.assertRaisesRegex(ValueError, "query"):
+            list(adapter.get_numpy_iterator())
+
+    @patch("litellm.completion")
+    async def test_fit_evaluate_predict(self, mock_completion):
+        mock_answer = AnswerWithRationale(rationale="It is well-known", answer="Paris")
+        mock_completion.return_value = {
+            "choices": [{"message": {"content": json.dumps(mock_answer.get_json())}}]
+        }
+
+        inputs = modules.Input(data_model=Query)
+        outputs = await modules.Generator(
+            data_model=AnswerWithRationale,
+            language_model=LanguageModel("ollama_chat/deepseek-r1"),
+        )(inputs)
+        program = programs.Program(inputs=inputs, outputs=outputs)
+        program.compile(
+            optimizer=optimizers.RandomFewShot(),
+            reward=rewards.ExactMatch(in_mask=["answer"]),
+        )
+
+        filepath = self.write_jsonl(make_records(5))
+        data = JsonlDataAdapter(
+            filepath,
+            input_data_model=Query,
+            output_data_model=AnswerWithRationale,
+            batch_size=2,
+            shuffle=True,
+        )
+        history = await program.fit(x=data, epochs=2)
+        self.assertEqual(len(history.history["reward"]), 2)
+
+        metrics = await program.evaluate(x=data, return_dict=True)
+        self.assertIn("reward", metrics)
+
+        y_pred = await program.predict(
+            x=JsonlDataAdapter(filepath, input_data_model=Query, batch_size=2)
+        )
+        self.assertEqual(len(y_pred), 5)
+        self.assertEqual(y_pred[0].get("answer"), "Paris")
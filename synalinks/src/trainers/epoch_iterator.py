@@ -17,12 +17,17 @@ class EpochIterator:
         steps_per_epoch=None,
         shuffle=False,
         steps_per_execution=1,
+        initial_step=0,
     ):
         self.steps_per_epoch = steps_per_epoch
         self.steps_per_execution = steps_per_execution
+        self.initial_step = initial_step
+        self._initial_step = initial_step
         self._current_iterator = None
         self._epoch_iterator = None
         self._steps_seen = 0
+        self._steps_to_skip = 0
+        self._asynchronous = False
         self.data_adapter = data_adapters.get_data_adapter(
             x=x,
             y=y,
@@ -33,7 +38,9 @@ class EpochIterator:
         self._num_batches = self.data_adapter.num_batches
 
     def _get_iterator(self):
-        return self.data_adapter.get_numpy_iterator()
+        if self._asynchronous:
+            return self.data_adapter.get_async_iterator().__aiter__()
+        return iter(self.data_adapter.get_numpy_iterator())
 
     def _interrupted_warning(self):
         warnings.warn(
@@ -47,18 +54,37 @@ class EpochIterator:
         self._current_iterator = None
         self._num_batches = self.data_adapter.num_batches
         self._steps_seen = 0
+        self._steps_to_skip = 0
         self._epoch_iterator = None
+        self._initial_step = self.initial_step
         self.data_adapter.on_epoch_end()
 
+    def _skip_initial_steps(self, iterator):
+        """Consumes the batches preceding `initial_step` without yielding them."""
+        initial_step = self._initial_step
+        self._initial_step = 0
+        if self._asynchronous:
+            # The batches of an async iterator are skipped in `__anext__()`.
+            self._steps_to_skip = initial_step
+        else:
+            for _ in range(initial_step):
+                try:
+                    next(iterator)
+                except StopIteration:
+                    break
+        self._steps_seen += initial_step
+        return initial_step
+
     def _enumerate_iterator(self):
         self.data_adapter.on_epoch_begin()
         steps_per_epoch = self.steps_per_epoch or self._num_batches or -1
 
         if steps_per_epoch > 0:
             if self._current_iterator is None or self.steps_per_epoch is None:
-                self._current_iterator = iter(self._get_iterator())
+                self._current_iterator = self._get_iterator()
                 self._steps_seen = 0
-            for step in range(0, steps_per_epoch, self.steps_per_execution):
+            initial_step = self._skip_initial_steps(self._current_iterator)
+            for step in range(initial_step, steps_per_epoch, self.steps_per_execution):
                 if self._num_batches and self._steps_seen >= self._num_batches:
                     if self.steps_per_epoch:
                         self._interrupted_warning()
@@ -66,11 +92,11 @@ class EpochIterator:
                 self._steps_seen += self.steps_per_execution
                 yield step, self._current_iterator
             if self._num_batches and self._steps_seen >= self._num_batches:
-                self._current_iterator = iter(self._get_iterator())
+                self._current_iterator = self._get_iterator()
                 self._steps_seen = 0
         else:
-            iterator = iter(self._get_iterator())
-            step = -self.steps_per_execution
+            iterator = self._get_iterator()
+            step = self._skip_initial_steps(iterator) - self.steps_per_execution
             while True:
                 step += self.steps_per_execution
                 self._steps_seen = step + self.steps_per_execution
@@ -78,9 +104,21 @@ class EpochIterator:
         self.data_adapter.on_epoch_end()
 
     def __iter__(self):
+        self._set_asynchronous(False)
+        self._epoch_iterator = self._enumerate_iterator()
+        return self
+
+    def __aiter__(self):
+        self._set_asynchronous(True)
         self._epoch_iterator = self._enumerate_iterator()
         return self
 
+    def _set_asynchronous(self, asynchronous):
+        if asynchronous != self._asynchronous:
+            # The current iterator can't be used with the other protocol.
+            self._current_iterator = None
+            self._asynchronous = asynchronous
+
     def __next__(self):
         buffer = []
         step, iterator = next(self._epoch_iterator)
@@ -93,6 +131,24 @@ class EpochIterator:
             return step, buffer
         raise StopIteration
 
+    async def __anext__(self):
+        buffer = []
+        try:
+            step, iterator = next(self._epoch_iterator)
+        except StopIteration:
+            raise StopAsyncIteration
+        with self.catch_stop_iteration():
+            steps_to_skip, self._steps_to_skip = self._steps_to_skip, 0
+            for _ in range(steps_to_skip):
+                await iterator.__anext__()
+            for _ in range(self.steps_per_execution):
+                data = await iterator.__anext__()
+                buffer.append(data)
+            return step, buffer
+        if buffer:
+            return step, buffer
+        raise StopAsyncIteration
+
     def enumerate_epoch(self):
         for step, data in self:
             yield step, data
@@ -102,7 +158,7 @@ class EpochIterator:
         """Catches errors when an iterator runs out of data."""
         try:
             yield
-        except StopIteration:
+        except (StopIteration, StopAsyncIteration):
             if self._num_batches is None:
                 self._num_batches = self._steps_seen
             self._interrupted_warning()
@@ -29,3 +29,22 @@ class EpochIteratorTest(testing.TestCase):
                 self.assertIsInstance(y_batch, np.ndarray)
                 self.assertIsInstance(x_batch[0], Query)
                 self.assertIsInstance(y_batch[0], AnswerWithRationale)
+
+    async def test_async_iteration(self):
+        (x_train, y_train), (x_test, y_test) = load_test_data()
+
+        async def async_generator():
+            for i in range(len(x_train)):
+                yield x_train[i : i + 1], y_train[i : i + 1]
+
+        epoch_iterator = EpochIterator(x=async_generator(), initial_step=1)
+
+        steps = []
+        with epoch_iterator.catch_stop_iteration():
+            async for step, iterator in epoch_iterator:
+                x_batch, y_batch = iterator[0]
+                steps.append(step)
+                self.assertIsInstance(x_batch[0], Query)
+                self.assertIsInstance(y_batch[0], AnswerWithRationale)
+                self.assertEqual(x_batch[0].query, x_train[1].query)
+        self.assertEqual(steps, [1])
@@ -0,0 +1,181 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import os
+
+from synalinks.src.backend import JsonDataModel
+from synalinks.src.utils import file_utils
+from synalinks.src.utils import json_codec
+
+
+class PredictionSink:
+    """Append-only JSONL sink used to checkpoint `Program.predict()` outputs.
+
+    The outputs of each finished batch are appended to `filepath`, one JSON line
+    per sample. The batch is then committed by appending its step and the end
+    byte offset of its rows to an offset index (`filepath + ".index"`).
+
+    When the sink is re-opened after an interruption, any rows written after
+    the last committed offset (e.g. a batch interrupted by a crash) are
+    truncated, and `next_step` tells from which step the prediction should
+    resume.
+
+    Example:
+
+    ```python
+    with PredictionSink("predictions.jsonl") as sink:
+        sink.write(step=0, outputs=batch_outputs)
+    ```
+
+    Args:
+        filepath (str | os.PathLike): The path of the JSONL file.
+            Must end in `.jsonl`.
+        steps_per_execution (int): The number of batches processed per step,
+            used to infer the step to resume from (Default to 1).
+    """
+
+    def __init__(self, filepath, steps_per_execution=1):
+        filepath = file_utils.path_to_string(filepath)
+        if not filepath.endswith(".jsonl"):
+            raise ValueError(
+                f"The filepath should ends with '.jsonl', received filepath={filepath}"
+            )
+        self.filepath = filepath
+        self.index_filepath = filepath + ".index"
+        self.steps_per_execution = steps_per_execution
+        self._last_entry = None
+        self._index_size = 0
+        self._file = None
+        self._index_file = None
+        self._read_index()
+
+    def _read_index(self):
+        if not file_utils.exists(self.index_filepath):
+            return
+        with open(self.index_filepath, "rb") as f:
+            for line in f:
+                try:
+                    entry = json_codec.loads(line)
+                except ValueError:
+                    # Partially written entry from an interrupted run.
+                    break
+                if not line.endswith(b"\n"):
+                    break
+                self._last_entry = entry
+                self._index_size += len(line)
+
+    @property
+    def last_step(self):
+        """The last committed step, or `None` if nothing was committed yet."""
+        if self._last_entry is None:
+            return None
+        return self._last_entry["step"]
+
+    @property
+    def next_step(self):
+        """The step from which to resume the prediction."""
+        if self._last_entry is None:
+            return 0
+        return self._last_entry["step"] + self.steps_per_execution
+
+    @property
+    def num_samples(self):
+        """The number of committed samples."""
+        if self._last_entry is None:
+            return 0
+        return self._last_entry["num_samples"]
+
+    @property
+    def offset(self):
+        """The end byte offset of the committed samples."""
+        if self._last_entry is None:
+            return 0
+        return self._last_entry["offset"]
+
+    def open(self):
+        """Opens the sink for writing, dropping any uncommitted rows."""
+        dirname = os.path.dirname(self.filepath)
+        if dirname and not file_utils.exists(dirname):
+            file_utils.makedirs(dirname)
+        self._file = _open_truncated(self.filepath, self.offset)
+        self._index_file = _open_truncated(self.index_filepath, self._index_size)
+        return self
+
+    def close(self):
+        """Closes the sink."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._index_file is not None:
+            self._index_file.close()
+            self._index_file = None
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, *args, **kwargs):
+        self.close()
+
+    def write(self, step, outputs):
+        """Appends the outputs of a finished step and commits them.
+
+        Args:
+            step (int): The step (as yielded by the `EpochIterator`).
+            outputs (list): The batch outputs.
+        """
+        if self._file is None:
+            raise ValueError(
+                "The sink is not opened. Use `sink.open()` before writing to it."
+            )
+        for output in outputs:
+            line = json_codec.dumps(serialize_output(output)) + "\n"
+            self._file.write(line.encode("utf-8"))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        entry = {
+            "step": step,
+            "offset": self._file.tell(),
+            "num_samples": self.num_samples + len(outputs),
+        }
+        line = (json_codec.dumps(entry) + "\n").encode("utf-8")
+        self._index_file.write(line)
+        self._index_file.flush()
+        os.fsync(self._index_file.fileno())
+        self._last_entry = entry
+        self._index_size += len(line)
+
+    def read(self):
+        """Reads back the committed outputs.
+
+        Returns:
+            (list): The committed outputs, in the order they were written.
+        """
+        if not self.offset:
+            return []
+        with open(self.filepath, "rb") as f:
+            data = f.read(self.offset)
+        return [deserialize_output(json_codec.loads(line)) for line in data.splitlines()]
+
+
+def _open_truncated(filepath, size):
+    f = open(filepath, "r+b" if file_utils.exists(filepath) else "wb")
+    f.truncate(size)
+    f.seek(size)
+    return f
+
+
+def serialize_output(output):
+    """Converts a program output into a JSON serializable structure."""
+    if output is None:
+        return None
+    if isinstance(output, (list, tuple)):
+        return [serialize_output(o) for o in output]
+    return {"schema": output.get_schema(), "json": output.get_json()}
+
+
+def deserialize_output(config):
+    """Converts back a serialized program output into `JsonDataModel`(s)."""
+    if config is None:
+        return None
+    if isinstance(config, list):
+        return [deserialize_output(c) for c in config]
+    return JsonDataModel(schema=config["schema"], json=config["json"])
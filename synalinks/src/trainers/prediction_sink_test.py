@@ -0,0 +1,63 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import os
+
+from synalinks.src import testing
+from synalinks.src.backend import JsonDataModel
+from synalinks.src.testing.test_utils import AnswerWithRationale
+from synalinks.src.trainers.prediction_sink import PredictionSink
+
+
+def make_output(answer):
+    return AnswerWithRationale(
+        rationale="Some rationale.",
+        answer=answer,
+    ).to_json_data_model()
+
+
+class PredictionSinkTest(testing.TestCase):
+    def test_write_and_read(self):
+        filepath = os.path.join(self.get_temp_dir(), "predictions.jsonl")
+        with PredictionSink(filepath) as sink:
+            sink.write(0, [make_output("Paris"), None])
+            sink.write(1, [make_output("Toulouse")])
+
+        sink = PredictionSink(filepath)
+        self.assertEqual(sink.last_step, 1)
+        self.assertEqual(sink.next_step, 2)
+        self.assertEqual(sink.num_samples, 3)
+        outputs = sink.read()
+        self.assertEqual(len(outputs), 3)
+        self.assertIsInstance(outputs[0], JsonDataModel)
+        self.assertEqual(outputs[0].get_json()["answer"], "Paris")
+        self.assertIsNone(outputs[1])
+        self.assertEqual(outputs[2].get_json()["answer"], "Toulouse")
+
+    def test_uncommitted_rows_are_truncated(self):
+        filepath = os.path.join(self.get_temp_dir(), "predictions.jsonl")
+        with PredictionSink(filepath) as sink:
+            sink.write(0, [make_output("Paris")])
+        # Simulate a crash while writing the next batch and its index entry.
+        with open(filepath, "a") as f:
+            f.write('{"schema": {}, "json"')
+        with open(filepath + ".index", "a") as f:
+            f.write('{"step": 1, "off')
+
+        with PredictionSink(filepath) as sink:
+            self.assertEqual(sink.next_step, 1)
+            sink.write(1, [make_output("Toulouse")])
+
+        outputs = PredictionSink(filepath).read()
+        self.assertEqual(len(outputs), 2)
+        self.assertEqual(outputs[1].get_json()["answer"], "Toulouse")
+
+    def test_steps_per_execution(self):
+        filepath = os.path.join(self.get_temp_dir(), "predictions.jsonl")
+        with PredictionSink(filepath, steps_per_execution=2) as sink:
+            self.assertEqual(sink.next_step, 0)
+            sink.write(0, [make_output("Paris")])
+            self.assertEqual(sink.next_step, 2)
+
+    def test_invalid_filepath(self):
+        with self.assertRaisesRegex(ValueError, ".jsonl"):
+            PredictionSink(os.path.join(self.get_temp_dir(), "predictions.json"))
@@ -20,6 +20,7 @@ from synalinks.src.trainers.compile_utils import CompileReward
 from synalinks.src.trainers.data_adapters import array_slicing
 from synalinks.src.trainers.data_adapters import data_adapter_utils
 from synalinks.src.trainers.epoch_iterator import EpochIterator
+from synalinks.src.trainers.prediction_sink import PredictionSink
 from synalinks.src.utils import python_utils
 from synalinks.src.utils import tracking
 
@@ -226,10 +227,8 @@ class Trainer:
         del training
         rewards = []
         if self._compile_reward is not None:
-            for y_t, y_p in zip(y, y_pred):
-                reward = await self._compile_reward(y_t, y_p)
-                if reward is not None:
-                    rewards.append(reward)
+            batch_rewards = await self._compile_reward.batch_call(y, y_pred)
+            rewards.extend(reward for reward in batch_rewards if reward is not None)
         for reward in self.rewards:
             rewards.append(numpy.sum(reward))
         if len(rewards) == 1:
@@ -353,6 +352,8 @@ class Trainer:
                 - A list of dict mapping input names to the corresponding `DataModel`s,
                     if the program has named inputs.
                 - A Python generator function yielding `(inputs, targets)`.
+                - A Python async generator (or any async iterable) yielding
+                    `(inputs, targets)`, consumed while the program runs.
             y (np.ndarray): Target data. Like the input data `x`, it can be either NumPy
                 array(s) of `DataModel`(s). If `x` is a Python generator function,
                 `y` should not be specified since targets will be obtained from
@@ -472,12 +473,18 @@ class Trainer:
 
         if not all(module.built for module in self._flatten_modules()):
             # Build the model on one batch of data.
-            for _, data in epoch_iterator:
+            async for _, data in epoch_iterator:
                 data_batch = data[0]
                 self._symbolic_build(data_batch)
                 break
         epoch_iterator.reset()
 
+        if isinstance(self.optimizer, optimizers_module.Optimizer):
+            self.optimizer.set_program(
+                self,
+                validation_data=(val_x, val_y) if validation_data is not None else None,
+            )
+
         # Container that configures and calls callbacks.
         if not isinstance(callbacks, callbacks_module.CallbackList):
             callbacks = callbacks_module.CallbackList(
@@ -500,7 +507,7 @@ class Trainer:
             self.reset_metrics()
             callbacks.on_epoch_begin(epoch)
             with epoch_iterator.catch_stop_iteration():
-                for step, iterator in epoch_iterator:
+                async for step, iterator in epoch_iterator:
                     data = iterator[0]
                     x_batch, y_batch = data_adapter_utils.unpack_x_y(data)
                     callbacks.on_train_batch_begin(step)
@@ -575,6 +582,8 @@ class Trainer:
                 - A list of dict mapping input names to the corresponding `DataModel`s,
                     if the program has named inputs.
                 - A Python generator function yielding `(inputs, targets)`.
+                - A Python async generator (or any async iterable) yielding
+                    `(inputs, targets)`, consumed while the program runs.
             y (np.ndarray): Target data. Like the input data `x`, it can be either NumPy
                 array(s) of `DataModel`(s). If `x` is a Python generator function,
                 `y` should not be specified since targets will be obtained from
@@ -628,7 +637,7 @@ class Trainer:
 
         if not all(module.built for module in self._flatten_modules()):
             # Build the model on one batch of data.
-            for _, data in epoch_iterator:
+            async for _, data in epoch_iterator:
                 data_batch = data[0]
                 self._symbolic_build(data_batch)
                 break
@@ -650,7 +659,7 @@ class Trainer:
         callbacks.on_test_begin()
         logs = {}
         self.reset_metrics()
-        for step, iterator in epoch_iterator:
+        async for step, iterator in epoch_iterator:
             callbacks.on_test_batch_begin(step)
             data = iterator[0]
             x_batch, y_batch = data_adapter_utils.unpack_x_y(data)
@@ -670,7 +679,13 @@ class Trainer:
         return self._flatten_metrics_in_order(logs)
 
     async def predict(
-        self, x, batch_size=None, verbose="auto", steps=None, callbacks=None
+        self,
+        x,
+        batch_size=None,
+        verbose="auto",
+        steps=None,
+        callbacks=None,
+        checkpoint_filepath=None,
     ):
         """Generates output predictions for the input samples.
 
@@ -691,6 +706,8 @@ class Trainer:
                 - A list of dict mapping input names to the corresponding `DataModel`s,
                     if the program has named inputs.
                 - A Python generator function yielding `(inputs, targets)`.
+                - A Python async generator (or any async iterable) yielding
+                    `(inputs, targets)`, consumed while the program runs.
             batch_size (int): Integer or `None`.
                 Number of samples per batch of computation.
                 If unspecified, `batch_size` will default to 32.
@@ -710,11 +727,27 @@ class Trainer:
                 repeating dataset, it will run indefinitely.
             callbacks (list): List of `synalinks.callbacks.Callback` instances.
                 List of callbacks to apply during prediction.
+            checkpoint_filepath (str | os.PathLike): Optional. The path of a `.jsonl`
+                file where the outputs of each finished batch are appended
+                (with an offset index in `checkpoint_filepath + ".index"`).
+                If the file already contains the outputs of an interrupted run,
+                the batches already completed are skipped and the prediction
+                resumes from the next step. The data, `batch_size` and
+                `steps_per_execution` should be the same as in the interrupted run.
 
         Returns:
             (list): `JsonDataModel` array(s) of predictions.
                 If the pipeline failed, a None is added to the predictions.
         """
+        sink = None
+        initial_step = 0
+        if checkpoint_filepath:
+            sink = PredictionSink(
+                checkpoint_filepath,
+                steps_per_execution=self.steps_per_execution,
+            )
+            initial_step = sink.next_step
+
         # Create an iterator that yields batches of input data.
         epoch_iterator = EpochIterator(
             x=x,
@@ -722,6 +755,7 @@ class Trainer:
             steps_per_epoch=steps,
             shuffle=False,
             steps_per_execution=self.steps_per_execution,
+            initial_step=initial_step,
         )
 
         # Container that configures and calls callbacks.
@@ -739,15 +773,24 @@ class Trainer:
         self.stop_predicting = False
         callbacks.on_test_begin()
         outputs = []
-        for step, iterator in epoch_iterator:
-            callbacks.on_predict_batch_begin(step)
-            data = iterator[0]
-            x_batch, _ = data_adapter_utils.unpack_x_y(data)
-            batch_outputs = await self.predict_on_batch(x_batch)
-            outputs.extend(batch_outputs)
-            callbacks.on_predict_batch_end(step, {"outputs": batch_outputs})
-            if self.stop_predicting:
-                break
+        if sink:
+            outputs.extend(sink.read())
+            sink.open()
+        try:
+            async for step, iterator in epoch_iterator:
+                callbacks.on_predict_batch_begin(step)
+                data = iterator[0]
+                x_batch, _ = data_adapter_utils.unpack_x_y(data)
+                batch_outputs = await self.predict_on_batch(x_batch)
+                outputs.extend(batch_outputs)
+                if sink:
+                    sink.write(step, batch_outputs)
+                callbacks.on_predict_batch_end(step, {"outputs": batch_outputs})
+                if self.stop_predicting:
+                    break
+        finally:
+            if sink:
+                sink.close()
         callbacks.on_predict_end()
         return np.array(outputs, dtype="object")
 
@@ -1,6 +1,7 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
 import json
+import os
 from unittest.mock import patch
 
 from synalinks.src import metrics
@@ -170,3 +171,49 @@ class TestTrainer(testing.TestCase):
         self.assertEqual(len(y_data), 2)
         self.assertIsInstance(y_data[0], JsonDataModel)
         self.assertIsInstance(y_data[1], JsonDataModel)
+
+    @patch("litellm.completion")
+    async def test_predict_resumes_from_checkpoint(self, mock_completion):
+        mock_answer = AnswerWithRationale(
+            rationale="""The capital of France is well-known and is the seat of """
+            """the French government.""",
+            answer="Paris",
+        )
+
+        mock_completion.return_value = {
+            "choices": [{"message": {"content": json.dumps(mock_answer.get_json())}}]
+        }
+
+        program = await program_test()
+
+        (x_train, _), _ = load_test_data()
+        filepath = os.path.join(self.get_temp_dir(), "predictions.jsonl")
+
+        # Interrupted run: only the first batch is completed.
+        y_data = await program.predict(
+            x=x_train,
+            batch_size=1,
+            steps=1,
+            checkpoint_filepath=filepath,
+        )
+        self.assertEqual(len(y_data), 1)
+        self.assertEqual(mock_completion.call_count, 1)
+
+        y_data = await program.predict(
+            x=x_train,
+            batch_size=1,
+            checkpoint_filepath=filepath,
+        )
+        self.assertEqual(len(y_data), 2)
+        self.assertEqual(mock_completion.call_count, 2)
+        self.assertEqual(y_data[0].get_json(), mock_answer.get_json())
+        self.assertEqual(y_data[1].get_json(), mock_answer.get_json())
+
+        # Everything is already completed: no more LM calls.
+        y_data = await program.predict(
+            x=x_train,
+            batch_size=1,
+            checkpoint_filepath=filepath,
+        )
+        self.assertEqual(len(y_data), 2)
+        self.assertEqual(mock_completion.call_count, 2)
@@ -0,0 +1,142 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import json
+import math
+
+from synalinks.src.api_export import synalinks_export
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSON_CODECS = ("orjson", "json")
+
+_JSON_CODEC = "orjson" if orjson is not None else "json"
+
+
+@synalinks_export("synalinks.utils.set_json_codec")
+def set_json_codec(codec):
+    """Sets the codec used to encode and decode JSON.
+
+    The structured outputs of the language models and the saved programs and
+    variables are encoded/decoded with this codec. By default, `orjson` is used
+    when installed, otherwise the standard `json` library is used.
+
+    **Note:** `orjson` encodes the non-finite floats (`NaN`, `Infinity`) as
+    `null`, so the objects holding such values (e.g. a `NaN` reward) are always
+    encoded with the `json` library, which writes them as the non-standard
+    `NaN` and `Infinity` values, decoded back by both codecs.
+
+    Example:
+
+    ```python
+    synalinks.utils.set_json_codec("json")
+    ```
+
+    Args:
+        codec (str): One of `"orjson"` or `"json"`.
+    """
+    global _JSON_CODEC
+    if codec not in JSON_CODECS:
+        raise ValueError(
+            f"Invalid JSON codec, expected one of {JSON_CODECS}, received codec={codec}"
+        )
+    if codec == "orjson" and orjson is None:
+        raise ImportError(
+            "The `orjson` codec requires the `orjson` package. "
+            "You can install it with `pip install orjson`."
+        )
+    _JSON_CODEC = codec
+
+
+@synalinks_export("synalinks.utils.get_json_codec")
+def get_json_codec():
+    """Returns the name of the codec used to encode and decode JSON.
+
+    Returns:
+        (str): One of `"orjson"` or `"json"`.
+    """
+    return _JSON_CODEC
+
+
+def dumps(obj, indent=None, sort_keys=False):
+    """Encodes an object into a JSON string.
+
+    The output is compact, unless `indent` is provided. The objects holding
+    non-finite floats (`NaN`, `Infinity`) are encoded with the `json` library,
+    as `orjson` would encode them as `null` (see `set_json_codec()`).
+
+    Args:
+        obj (dict | list): The object to encode.
+        indent (int): Optional. The indentation used for human-read outputs.
+            `orjson` only supports an indentation of 2 spaces, the other values
+            are encoded with the `json` library.
+        sort_keys (bool): Whether to sort the keys of the objects (Default to False).
+
+    Returns:
+        (str): The JSON string.
+    """
+    if _JSON_CODEC == "orjson" and indent in (None, 2):
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            data = orjson.dumps(obj, option=option)
+            # The non-finite floats are encoded as `null`, the object is only
+            # checked when the output has one.
+            if b"null" not in data or not _has_non_finite_floats(obj):
+                return data.decode("utf-8")
+        except TypeError:
+            # Values unsupported by orjson (e.g. non-string keys or integers
+            # above 64 bits) are handled by the `json` library.
+            pass
+    if indent:
+        return json.dumps(obj, indent=indent, sort_keys=sort_keys, default=_default)
+    return json.dumps(obj, sort_keys=sort_keys, separators=(",", ":"), default=_default)
+
+
+def _default(obj):
+    # The NumPy values, like with the `OPT_SERIALIZE_NUMPY` option of orjson.
+    if hasattr(obj, "dtype") and hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _has_non_finite_floats(obj):
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite_floats(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite_floats(value) for value in obj)
+    if hasattr(obj, "dtype") and obj.dtype.kind in "fc":
+        # NumPy floats and arrays, encoded by orjson with `OPT_SERIALIZE_NUMPY`.
+        import numpy as np
+
+        return not np.isfinite(obj).all()
+    return False
+
+
+def loads(data):
+    """Decodes a JSON string.
+
+    Args:
+        data (str | bytes): The JSON string to decode.
+
+    Returns:
+        (dict | list): The decoded object.
+
+    Raises:
+        json.JSONDecodeError: If the string is not a valid JSON.
+    """
+    if _JSON_CODEC == "orjson":
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # The `json` library decodes a few non-standard values (e.g. the
+            # `NaN` or `Infinity` of the non-finite floats).
+            pass
+    return json.loads(data)
@@ -0,0 +1,76 @@
+# License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
+
+import json
+import math
+
+import numpy as np
+
+from synalinks.src import testing
+from synalinks.src.utils import json_codec
+
+
+class JsonCodecTest(testing.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.codec = json_codec.get_json_codec()
+
+    def tearDown(self):
+        super().tearDown()
+        json_codec.set_json_codec(self.codec)
+
+    def test_codecs_are_equivalent(self):
+        obj = {"query": "Quelle est la capitale de la France ?", "rewards": [0.5, 1]}
+        codecs = ["orjson", "json"] if json_codec.orjson is not None else ["json"]
+        for codec in codecs:
+            json_codec.set_json_codec(codec)
+            self.assertEqual(json_codec.get_json_codec(), codec)
+            self.assertEqual(
+                json_codec.dumps(obj),
+                '{"query":"Quelle est la capitale de la France ?","rewards":[0.5,1]}',
+            )
+            self.assertEqual(json_codec.dumps(obj, indent=2), json.dumps(obj, indent=2))
+            self.assertEqual(json_codec.loads(json_codec.dumps(obj)), obj)
+
+    def test_sort_keys(self):
+        self.assertEqual(
+            json_codec.dumps({"b": 1, "a": 2}, sort_keys=True), '{"a":2,"b":1}'
+        )
+
+    def test_fallback_to_json(self):
+        self.assertEqual(json_codec.dumps({1: "a"}), '{"1":"a"}')
+        self.assertEqual(
+            json_codec.dumps({"a": [1]}, indent=4), '{\n    "a": [\n        1\n    ]\n}'
+        )
+        self.assertTrue(np.isnan(json_codec.loads('{"a": NaN}')["a"]))
+
+    def test_non_finite_floats(self):
+        obj = {"a": float("nan"), "b": float("inf")}
+        json_codec.set_json_codec("json")
+        self.assertEqual(json_codec.dumps(obj), '{"a":NaN,"b":Infinity}')
+        if json_codec.orjson is not None:
+            json_codec.set_json_codec("orjson")
+            self.assertEqual(json_codec.dumps(obj), '{"a":NaN,"b":Infinity}')
+            self.assertEqual(
+                json_codec.dumps({"a": None, "b": 1.0}), '{"a":null,"b":1.0}'
+            )
+
+    def test_non_finite_floats_round_trip(self):
+        obj = {"rewards": [float("nan"), float("-inf"), 0.5], "best": None}
+        for codec in json_codec.JSON_CODECS:
+            if codec == "orjson" and json_codec.orjson is None:
+                continue
+            json_codec.set_json_codec(codec)
+            decoded = json_codec.loads(json_codec.dumps(obj))
+            self.assertTrue(math.isnan(decoded["rewards"][0]))
+            self.assertEqual(decoded["rewards"][1:], [float("-inf"), 0.5])
+            self.assertIsNone(decoded["best"])
+            decoded = json_codec.loads(json_codec.dumps({"a": np.array([np.nan, 1.0])}))
+            self.assertTrue(math.isnan(decoded["a"][0]))
+
+    def test_invalid_json(self):
+        with self.assertRaises(ValueError):
+            json_codec.loads('{"a": ')
+
+    def test_invalid_codec(self):
+        with self.assertRaises(ValueError):
+            json_codec.set_json_codec("ujson")
@@ -1,11 +1,15 @@
 # License Apache 2.0: (c) 2025 Yoan Sallami (Synalinks Team)
 
+import functools
 import re
 import string
 
-ARTICLE_REGEX = re.compile(r"\b(a|an|the|of|is)\b", re.UNICODE)
+ARTICLE_REGEX = re.compile(r"\b(?:a|an|the|of|is)\b", re.UNICODE)
 PUNCTUATION_TRANSLATOR = str.maketrans("", "", string.punctuation)
 
+# The property keys are few and repeated for every JSON object
+PROPERTY_CACHE_SIZE = 4096
+
 Y_ENDING = re.compile(r"[^aeiou]y$")
 S_ENDING = re.compile(r"[sxz]$")
 SH_CH_ENDING = re.compile(r"(sh|ch)$")
@@ -242,6 +246,7 @@ def to_singular(word):
             return word
 
 
+@functools.lru_cache(maxsize=PROPERTY_CACHE_SIZE)
 def to_plural_property(property_key):
     """
     Convert the last word of a property key to its plural form.
@@ -261,6 +266,7 @@ def to_plural_property(property_key):
     return "_".join(words)
 
 
+@functools.lru_cache(maxsize=PROPERTY_CACHE_SIZE)
 def to_singular_property(property_key):
     """
     Convert the last word of a property key to its singular form.
@@ -280,6 +286,7 @@ def to_singular_property(property_key):
     return "_".join(words)
 
 
+@functools.lru_cache(maxsize=PROPERTY_CACHE_SIZE)
 def remove_numerical_suffix(property_key):
     """
     Remove the numerical suffix from a property key.
@@ -290,7 +297,7 @@ def remove_numerical_suffix(property_key):
     Returns:
         (str): The property key with the suffix removed.
     """
-    return re.sub(SUFFIX_PATTERN, "", property_key)
+    return SUFFIX_PATTERN.sub("", property_key)
 
 
 def add_suffix(property_key, suffix):
@@ -307,6 +314,7 @@ def add_suffix(property_key, suffix):
     return f"{property_key}_{suffix}"
 
 
+@functools.lru_cache(maxsize=PROPERTY_CACHE_SIZE)
 def to_singular_without_numerical_suffix(property_key):
     """
     Convert a property key to its base (singular) form by removing
@@ -322,6 +330,7 @@ def to_singular_without_numerical_suffix(property_key):
     return to_singular_property(property_key)
 
 
+@functools.lru_cache(maxsize=PROPERTY_CACHE_SIZE)
 def to_plural_without_numerical_suffix(property_key):
     """
     Convert a property key to its list (plural) form by removing
@@ -337,6 +346,7 @@ def to_plural_without_numerical_suffix(property_key):
     return to_plural_property(property_key)
 
 
+@functools.lru_cache(maxsize=PROPERTY_CACHE_SIZE)
 def is_plural(property_key):
     """
     Check if the last word of a property key is in plural form.
@@ -367,7 +377,7 @@ def remove_articles(text):
     Returns:
         (str): The text with articles removed.
     """
-    return " ".join(re.sub(ARTICLE_REGEX, "", text).split())
+    return " ".join(ARTICLE_REGEX.sub("", text).split())
 
 
 def remove_punctuation(text):
@@ -407,7 +417,5 @@ def normalize_and_tokenize(text):
     Returns:
         (list): A list of normalized words.
     """
-    text = text.lower()
-    text = remove_articles(text)
-    text = remove_punctuation(text)
-    return text.split()
+    # The whitespaces are normalized by the final split
+    return ARTICLE_REGEX.sub("", text.lower()).translate(PUNCTUATION_TRANSLATOR).split()
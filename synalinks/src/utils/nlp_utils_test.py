@@ -141,3 +141,20 @@ class NLPUtilsTest(testing.TestCase):
             normalize_and_tokenize("The Quick Brown Fox!"), ["quick", "brown", "fox"]
         )
         self.assertEqual(normalize_and_tokenize("An Apple a Day..."), ["apple", "day"])
+
+    def test_normalize_and_tokenize_matches_the_step_by_step_normalization(self):
+        texts = [
+            "The  answer is:\n42, of course.",
+            "It's the end-of-the-line\tfor a theory",
+            "Isthmus of Panama",
+        ]
+        for text in texts:
+            expected = remove_punctuation(remove_articles(text.lower())).split()
+            self.assertEqual(normalize_and_tokenize(text), expected)
+
+    def test_normalize_and_tokenize_returns_a_new_list(self):
+        tokens = normalize_and_tokenize("The Quick Brown Fox!")
+        tokens.append("jumps")
+        self.assertEqual(
+            normalize_and_tokenize("The Quick Brown Fox!"), ["quick", "brown", "fox"]
+        )